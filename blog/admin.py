@@ -4,6 +4,7 @@ from django.contrib import admin
 from django.utils.html import format_html
 from django.urls import reverse
 from django.shortcuts import redirect
+from . import comment_counts
 from .models import BlogComment
 
 from .models import (
@@ -195,6 +196,27 @@ def clear_parent(modeladmin, request, queryset):
     queryset.update(parent=None)
 
 
+def _moderation_action(status, description):
+    # Cambia el estado en bloque; los contadores se ajustan con una consulta
+    # agrupada por post (blog/comment_counts.py), no uno por comentario.
+    @admin.action(description=description)
+    def action(modeladmin, request, queryset):
+        n = comment_counts.moderate(queryset, status)
+        modeladmin.message_user(request, f"{n} comentario(s) actualizados.")
+
+    action.__name__ = f"mark_{status}"
+    return action
+
+
+approve_comments = _moderation_action(
+    BlogComment.Status.APPROVED, "Aprobar comentarios seleccionados"
+)
+reject_comments = _moderation_action(
+    BlogComment.Status.REJECTED, "Rechazar comentarios seleccionados"
+)
+spam_comments = _moderation_action(BlogComment.Status.SPAM, "Marcar como spam")
+
+
 @admin.register(BlogComment)
 class BlogCommentAdmin(admin.ModelAdmin):
     form = BlogCommentAdminForm
@@ -216,7 +238,7 @@ class BlogCommentAdmin(admin.ModelAdmin):
     autocomplete_fields = ("post", "user")
     raw_id_fields = ("parent",)  # <- esto te da la lupita + la ✖ Clear
     inlines = [ReplyInline]
-    actions = [clear_parent]
+    actions = [approve_comments, reject_comments, spam_comments, clear_parent]
 
     # --- helpers para columnas ---
     @admin.display(description="Mensaje")
@@ -1,6 +1,5 @@
 # blog/apps.py
 from django.apps import AppConfig
-from django.db.models.signals import post_migrate
 
 
 class BlogConfig(AppConfig):
@@ -9,6 +8,10 @@ class BlogConfig(AppConfig):
     verbose_name = "Blog"
 
     def ready(self):
-        from .seeds.seed_blog import _seed_blog_once
+        from .seeds import seed_blog  # noqa: F401  (semillas, manage.py seed)
+        from . import signals  # noqa: F401  (conteo de comentarios + cabecera)
+        from . import sidebar  # noqa: F401  (etiqueta de caché del sidebar)
 
-        post_migrate.connect(_seed_blog_once, sender=self)
+        from core import search
+
+        search.register(self.get_model("BlogPost"))
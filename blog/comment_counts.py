@@ -0,0 +1,79 @@
+# blog/comment_counts.py
+"""
+Contador denormalizado BlogPost.comentarios_count (comentarios aprobados).
+
+Se mantiene con incrementos atómicos (F) según la transición de estado del
+comentario, en lugar de recontar con COUNT(*) + post.save() en cada guardado:
+
+    pendiente → aprobado   +1
+    aprobado  → spam/...   -1
+    borrar un aprobado     -1
+
+La moderación masiva del admin (moderate) resuelve todos los posts afectados con
+una consulta agrupada y un único UPDATE. Si el contador se desvía (cargas con
+loaddata, ediciones directas en la BD...): manage.py repair_comment_counts
+"""
+
+from django.db import transaction
+from django.db.models import Case, Count, F, IntegerField, Q, Value, When
+from django.db.models.functions import Greatest
+from django.utils import timezone
+
+from .models import BlogComment, BlogPost
+
+APPROVED = BlogComment.Status.APPROVED
+
+
+def apply_deltas(deltas):
+    """Aplica {post_id: delta} en un solo UPDATE (sin bajar de 0)."""
+    deltas = {pk: d for pk, d in deltas.items() if pk and d}
+    if not deltas:
+        return 0
+    delta = Case(
+        *[When(pk=pk, then=Value(d)) for pk, d in deltas.items()],
+        default=Value(0),
+        output_field=IntegerField(),
+    )
+    return BlogPost.objects.filter(pk__in=deltas).update(
+        comentarios_count=Greatest(F("comentarios_count") + delta, Value(0))
+    )
+
+
+def moderate(queryset, status):
+    """
+    Cambia el estado de muchos comentarios y ajusta los contadores con una
+    consulta agrupada por post. Devuelve cuántos comentarios cambiaron.
+    """
+    with transaction.atomic():
+        queryset = queryset.exclude(status=status)
+        # Por post: cuántos de los que cambian estaban aprobados y cuántos son
+        por_post = (
+            queryset.order_by()
+            .values("post_id")
+            .annotate(
+                total=Count("id"), aprobados=Count("id", filter=Q(status=APPROVED))
+            )
+        )
+        if status == APPROVED:
+            deltas = {r["post_id"]: r["total"] for r in por_post}
+        else:
+            deltas = {r["post_id"]: -r["aprobados"] for r in por_post}
+
+        n = queryset.update(status=status, actualizado=timezone.now())
+        apply_deltas(deltas)
+    return n
+
+
+def recount(post_ids=None):
+    """Recalcula desde cero (todos los posts o solo post_ids). Devuelve cuántos corrigió."""
+    posts = BlogPost.objects.annotate(
+        real=Count("comentarios", filter=Q(comentarios__status=APPROVED))
+    ).exclude(comentarios_count=F("real"))
+    if post_ids is not None:
+        posts = posts.filter(pk__in=post_ids)
+
+    stale = list(posts.only("id"))
+    for post in stale:
+        post.comentarios_count = post.real
+    BlogPost.objects.bulk_update(stale, ["comentarios_count"], batch_size=500)
+    return len(stale)
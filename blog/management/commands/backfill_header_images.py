@@ -0,0 +1,40 @@
+# blog/management/commands/backfill_header_images.py
+from django.core.management.base import BaseCommand
+
+from blog.models import BlogPost, BlogPostPhoto
+
+
+class Command(BaseCommand):
+    help = (
+        "Recalcula BlogPost.header_foto (cabecera denormalizada) para todos los posts"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **opts):
+        # Una pasada por las fotos publicadas: la primera por post es la cabecera
+        elegidas = {}
+        fotos = (
+            BlogPostPhoto.objects.filter(publicado=True)
+            .order_by("post_id", "-is_header", "orden", "id")
+            .values_list("post_id", "id")
+        )
+        for post_id, foto_id in fotos.iterator(chunk_size=2000):
+            elegidas.setdefault(post_id, foto_id)
+
+        cambiados = []
+        for post in BlogPost.objects.only("id", "header_foto").iterator(
+            chunk_size=2000
+        ):
+            nuevo = elegidas.get(post.pk)
+            if post.header_foto_id != nuevo:
+                post.header_foto_id = nuevo
+                cambiados.append(post)
+
+        BlogPost.objects.bulk_update(
+            cambiados, ["header_foto"], batch_size=opts["batch_size"]
+        )
+        self.stdout.write(
+            self.style.SUCCESS(f"Actualizados {len(cambiados)} posts (header_foto)")
+        )
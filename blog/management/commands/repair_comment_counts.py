@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from blog import comment_counts
+
+
+class Command(BaseCommand):
+    help = "Recalcula BlogPost.comentarios_count (comentarios aprobados) si se desvió"
+
+    def handle(self, *args, **opts):
+        n = comment_counts.recount()
+        self.stdout.write(
+            self.style.SUCCESS(f"Corregidos {n} posts (comentarios_count)")
+        )
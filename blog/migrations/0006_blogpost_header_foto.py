@@ -0,0 +1,45 @@
+# Generated by Django 5.2.3 on 2026-10-18 16:25
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def backfill_header_foto(apps, schema_editor):
+    BlogPost = apps.get_model("blog", "BlogPost")
+    BlogPostPhoto = apps.get_model("blog", "BlogPostPhoto")
+
+    elegidas = {}
+    fotos = (
+        BlogPostPhoto.objects.filter(publicado=True)
+        .order_by("post_id", "-is_header", "orden", "id")
+        .values_list("post_id", "id")
+    )
+    for post_id, foto_id in fotos:
+        elegidas.setdefault(post_id, foto_id)
+
+    posts = list(BlogPost.objects.filter(pk__in=elegidas).only("id"))
+    for post in posts:
+        post.header_foto_id = elegidas[post.pk]
+    BlogPost.objects.bulk_update(posts, ["header_foto"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("blog", "0005_alter_blogheader_breadcrumb_label"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="blogpost",
+            name="header_foto",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="blog.blogpostphoto",
+            ),
+        ),
+        migrations.RunPython(backfill_header_foto, migrations.RunPython.noop),
+    ]
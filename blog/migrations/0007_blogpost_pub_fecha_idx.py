@@ -0,0 +1,19 @@
+# Generated by Django 5.2.3 on 2026-10-18 16:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("blog", "0006_blogpost_header_foto"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="blogpost",
+            index=models.Index(
+                fields=["publicado", "fecha_publicacion"],
+                name="blog_post_pub_fecha_idx",
+            ),
+        ),
+    ]
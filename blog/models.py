@@ -155,26 +155,68 @@ class BlogPost(BaseOrdenPublicado):
     fecha_publicacion = models.DateTimeField(default=timezone.now)
     comentarios_count = models.PositiveIntegerField(default=0)
 
+    # Denormalizado: foto de cabecera (o, si no hay, primera foto publicada).
+    # Lo mantienen al día las señales de BlogPostPhoto (blog/signals.py);
+    # para recalcular todo: manage.py backfill_header_images
+    header_foto = models.ForeignKey(
+        "BlogPostPhoto",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="+",
+    )
+
     class Meta(BaseOrdenPublicado.Meta):
         verbose_name = "Post"
         verbose_name_plural = "Posts"
+        indexes = [
+            # Listados paginados por cursor (blog/pagination.py)
+            models.Index(
+                fields=["publicado", "fecha_publicacion"],
+                name="blog_post_pub_fecha_idx",
+            ),
+        ]
 
     def __str__(self):
         return self.titulo
 
     @property
     def header_image(self):
-        hdr = (
-            self.fotos.filter(publicado=True, is_header=True)
-            .order_by("orden", "id")
-            .first()
-        )
-        if hdr and hdr.imagen:
-            return hdr.imagen
+        # Sin consultas extra si la vista hizo select_related("header_foto")
+        foto = self.header_foto if self.header_foto_id else None
+        if foto and foto.is_header and foto.imagen:
+            return foto.imagen
         if self.portada:
             return self.portada
-        first = self.fotos.filter(publicado=True).order_by("orden", "id").first()
-        return first.imagen if first else None
+        return foto.imagen if foto else None
+
+    def search_document(self):
+        """(título, cuerpo) para core.search; None si no debe aparecer en búsquedas."""
+        if not self.publicado or not self.slug:
+            return None
+        from core.search import to_plain_text
+
+        return self.titulo, to_plain_text(self.resumen, self.cuerpo_html)
+
+    def refresh_header_foto(self, save=True):
+        """Recalcula header_foto desde la galería (1 consulta + 1 update)."""
+        self.header_foto_id = header_foto_id_for(self.pk)
+        if save:
+            BlogPost.objects.filter(pk=self.pk).update(
+                header_foto_id=self.header_foto_id
+            )
+        return self.header_foto_id
+
+
+def header_foto_id_for(post_id):
+    """Foto marcada como cabecera; si no hay, la primera publicada por orden."""
+    return (
+        BlogPostPhoto.objects.filter(post_id=post_id, publicado=True)
+        .order_by("-is_header", "orden", "id")
+        .values_list("id", flat=True)
+        .first()
+    )
 
 
 class BlogPostPhoto(BaseOrdenPublicado):
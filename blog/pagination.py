@@ -0,0 +1,100 @@
+# blog/pagination.py
+"""
+Paginación por cursor (keyset) para los listados del blog.
+
+En vez de OFFSET, cada página se pide "a partir de" la última fila vista sobre el
+par (fecha_publicacion, id), que es único y estable: el coste no crece con el
+número de página y los enlaces no se desplazan al publicar posts nuevos.
+
+    ?after=<cursor>   → página siguiente (posts más antiguos)
+    ?before=<cursor>  → página anterior (posts más recientes)
+
+Lo aprovecha el índice (publicado, fecha_publicacion) de BlogPost.
+"""
+
+import base64
+from datetime import datetime
+
+from django.db.models import Q
+
+PAGE_SIZE = 10
+
+
+def encode_cursor(post):
+    raw = f"{post.fecha_publicacion.isoformat()}|{post.pk}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token):
+    """Devuelve (fecha, id) o None si el cursor no es válido."""
+    try:
+        raw = base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)).decode()
+        fecha, pk = raw.rsplit("|", 1)
+        return datetime.fromisoformat(fecha), int(pk)
+    except (ValueError, UnicodeDecodeError):
+        return None
+
+
+class KeysetPage:
+    """Página de posts con enlaces siguiente/anterior construidos sobre la query."""
+
+    def __init__(self, object_list, request, has_next, has_previous):
+        self.object_list = object_list
+        self.request = request
+        self.has_next = has_next and bool(object_list)
+        self.has_previous = has_previous and bool(object_list)
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def _url(self, key, post):
+        params = self.request.GET.copy()
+        for k in ("after", "before", "page"):
+            params.pop(k, None)
+        params[key] = encode_cursor(post)
+        return f"?{params.urlencode()}"
+
+    @property
+    def next_url(self):
+        return self._url("after", self.object_list[-1]) if self.has_next else ""
+
+    @property
+    def previous_url(self):
+        return self._url("before", self.object_list[0]) if self.has_previous else ""
+
+
+def keyset_page(queryset, request, per_page=PAGE_SIZE):
+    """
+    Pagina `queryset` (más reciente primero) según ?after= / ?before=.
+    Pide per_page + 1 filas para saber si hay otra página sin contar.
+    """
+    after = decode_cursor(request.GET.get("after", ""))
+    before = None if after else decode_cursor(request.GET.get("before", ""))
+
+    if before:
+        fecha, pk = before
+        rows = list(
+            queryset.filter(
+                Q(fecha_publicacion__gt=fecha) | Q(fecha_publicacion=fecha, pk__gt=pk)
+            ).order_by("fecha_publicacion", "pk")[: per_page + 1]
+        )
+        has_previous = len(rows) > per_page
+        rows = rows[:per_page][::-1]
+        return KeysetPage(rows, request, has_next=True, has_previous=has_previous)
+
+    qs = queryset.order_by("-fecha_publicacion", "-pk")
+    if after:
+        fecha, pk = after
+        qs = qs.filter(
+            Q(fecha_publicacion__lt=fecha) | Q(fecha_publicacion=fecha, pk__lt=pk)
+        )
+    rows = list(qs[: per_page + 1])
+    return KeysetPage(
+        rows[:per_page],
+        request,
+        has_next=len(rows) > per_page,
+        has_previous=after is not None,
+    )
@@ -0,0 +1,87 @@
+# blog/sidebar.py
+"""
+Contexto del sidebar del blog (widgets, últimos posts, archivo, tags, categorías)
+cacheado bajo la etiqueta "section:blog_sidebar" (core/cache.py): cualquier cambio
+en lo que el sidebar muestra la sube, así la siguiente petición lo reconstruye y
+las ediciones del admin se ven al instante.
+"""
+
+from django.conf import settings
+from django.db.models import Count, Q
+
+from core import cache as tagcache
+from core.singletons import get_singleton
+
+from .models import BlogCategory, BlogPage, BlogPost, BlogTag
+
+SIDEBAR_TAG = tagcache.section(
+    "blog_sidebar",
+    "blog.BlogPage",
+    "blog.BlogHeader",
+    "blog.BlogPost",
+    "blog.BlogPostPhoto",
+    "blog.BlogTag",
+    "blog.BlogCategory",
+    "blog.BlogSidebarWidget",
+    "proyectos.Project",  # widgets "projects"/"recent_work"
+)
+
+
+def build_sidebar_context():
+    """Arma el contexto del sidebar desde la BD (sin caché)."""
+    # BlogPage + header + widgets publicados (core/singletons.py)
+    page = get_singleton(BlogPage)
+    widgets = page.widgets_publicados if page else []
+
+    # Máximo límite que pidan los widgets de tipo "latest_posts"
+    max_latest = max(
+        [w.limite or 5 for w in widgets if w.tipo == "latest_posts"] or [0]
+    )
+
+    # Una sola consulta para todos los widgets "latest_posts"
+    latest_posts = []
+    if max_latest:
+        latest_posts = list(
+            BlogPost.objects.filter(publicado=True)
+            .exclude(slug__isnull=True)
+            .exclude(slug="")
+            .select_related("autor", "categoria", "header_foto")
+            .prefetch_related("tags", "fotos")
+            .order_by("-fecha_publicacion")[:max_latest]
+        )
+
+    # Archives & taxonomías
+    archives = list(
+        BlogPost.objects.filter(publicado=True).dates(
+            "fecha_publicacion", "month", order="DESC"
+        )
+    )
+    tags = list(
+        BlogTag.objects.annotate(
+            n=Count("posts", filter=Q(posts__publicado=True), distinct=True)
+        ).order_by("nombre")
+    )
+    cats = list(
+        BlogCategory.objects.annotate(
+            n=Count("posts", filter=Q(posts__publicado=True))
+        ).order_by("nombre")
+    )
+
+    return {
+        "page": page,
+        "widgets": widgets,
+        "latest_posts": latest_posts,
+        "archives": archives,
+        "all_tags": tags,
+        "all_categories": cats,
+    }
+
+
+def sidebar_context():
+    """Contexto del sidebar: un hit de caché por petición mientras no cambie nada."""
+    return tagcache.get_or_set(
+        "blog_sidebar",
+        [SIDEBAR_TAG],
+        build_sidebar_context,
+        timeout=getattr(settings, "BLOG_SIDEBAR_CACHE_TIMEOUT", 60 * 60 * 24),
+    )
@@ -1,25 +1,69 @@
-from django.db.models.signals import post_save, post_delete
+from django.db.models.signals import post_delete, post_init, post_save
 from django.dispatch import receiver
 
-from blog.models import BlogComment
+from blog.models import BlogComment, BlogPost, BlogPostPhoto
+from blog import comment_counts
+from core.seeding import seed_loaded
 
 
-def _recount_comments(post):
-    from .models import BlogComment
+# ──────────────────────────────────────────────────────────────────────────────
+# Contador de comentarios aprobados (blog/comment_counts.py)
+# ──────────────────────────────────────────────────────────────────────────────
+def _counted(post_id, status):
+    # (post, estado) tal como lo ve el contador: solo cuentan los aprobados
+    return post_id if status == BlogComment.Status.APPROVED else None
 
-    n = BlogComment.objects.filter(
-        post=post, status=BlogComment.Status.APPROVED
-    ).count()
-    if post.comentarios_count != n:
-        post.comentarios_count = n
-        post.save(update_fields=["comentarios_count", "actualizado"])
+
+@receiver(post_init, sender=BlogComment)
+def _comment_loaded(sender, instance, **kwargs):
+    # Estado con el que salió de la BD; __dict__ para no disparar campos diferidos
+    instance._counted_as = _counted(
+        instance.__dict__.get("post_id"), instance.__dict__.get("status")
+    )
 
 
 @receiver(post_save, sender=BlogComment)
-def _comment_saved(sender, instance, **kwargs):
-    _recount_comments(instance.post)
+def _comment_saved(sender, instance, created, raw=False, **kwargs):
+    now = _counted(instance.post_id, instance.status)
+    if raw:
+        # loaddata: no conocemos el estado previo en BD, se recuenta ese post
+        comment_counts.recount([instance.post_id])
+    else:
+        before = None if created else instance._counted_as
+        if before != now:
+            deltas = {now: 1}
+            deltas[before] = deltas.get(before, 0) - 1
+            comment_counts.apply_deltas(deltas)
+    instance._counted_as = now
 
 
 @receiver(post_delete, sender=BlogComment)
 def _comment_deleted(sender, instance, **kwargs):
-    _recount_comments(instance.post)
+    comment_counts.apply_deltas({instance._counted_as: -1})
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Cabecera denormalizada (BlogPost.header_foto)
+# ──────────────────────────────────────────────────────────────────────────────
+@receiver(post_save, sender=BlogPostPhoto)
+def _photo_saved(sender, instance, **kwargs):
+    if instance.post_id:
+        BlogPost(pk=instance.post_id).refresh_header_foto()
+
+
+@receiver(post_delete, sender=BlogPostPhoto)
+def _photo_deleted(sender, instance, **kwargs):
+    if instance.post_id:
+        BlogPost(pk=instance.post_id).refresh_header_foto()
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Semillas (core/seeding.py): se cargan sin post_save, se recalcula lo derivado
+# ──────────────────────────────────────────────────────────────────────────────
+@receiver(seed_loaded)
+def _blog_seeded(sender, models, **kwargs):
+    if models & {BlogPost, BlogPostPhoto}:
+        for post in BlogPost.objects.only("id"):
+            post.refresh_header_foto()
+    if models & {BlogPost, BlogComment}:
+        comment_counts.recount()
@@ -1 +1,156 @@
-# Create your tests here.
+from datetime import timedelta
+
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase
+from django.utils import timezone
+
+from blog import comment_counts
+from blog.models import BlogComment, BlogPost, BlogPostPhoto, BlogTag
+from blog.pagination import keyset_page
+from blog.sidebar import sidebar_context
+
+
+class SidebarCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_segunda_llamada_sale_de_cache(self):
+        sidebar_context()
+        with self.assertNumQueries(0):
+            sidebar_context()
+
+    def test_editar_tag_invalida_el_sidebar(self):
+        sidebar_context()
+        BlogTag.objects.create(nombre="Tag de prueba A", slug="tag-prueba-a")
+        nombres = [t.nombre for t in sidebar_context()["all_tags"]]
+        self.assertIn("Tag de prueba A", nombres)
+
+    def test_m2m_de_tags_invalida_el_sidebar(self):
+        tag = BlogTag.objects.create(nombre="Tag de prueba B", slug="tag-prueba-b")
+        post = BlogPost.objects.create(titulo="Siembra", slug="siembra-test")
+        before = {t.slug: t.n for t in sidebar_context()["all_tags"]}
+        post.tags.add(tag)
+        after = {t.slug: t.n for t in sidebar_context()["all_tags"]}
+        self.assertEqual(after["tag-prueba-b"], before["tag-prueba-b"] + 1)
+
+
+class HeaderFotoTests(TestCase):
+    def setUp(self):
+        self.post = BlogPost.objects.create(titulo="Galería", slug="galeria-test")
+
+    def _foto(self, **kw):
+        return BlogPostPhoto.objects.create(
+            post=self.post, imagen=f"blog/gallery/{kw.pop('nombre')}.jpg", **kw
+        )
+
+    def test_cabecera_se_mantiene_con_las_senales(self):
+        primera = self._foto(nombre="a", orden=1)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.header_foto_id, primera.pk)
+
+        cabecera = self._foto(nombre="b", orden=2, is_header=True)
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.header_foto_id, cabecera.pk)
+
+        cabecera.delete()
+        self.post.refresh_from_db()
+        self.assertEqual(self.post.header_foto_id, primera.pk)
+
+    def test_header_image_sin_consultas_con_select_related(self):
+        self._foto(nombre="c", is_header=True)
+        post = BlogPost.objects.select_related("header_foto").get(pk=self.post.pk)
+        with self.assertNumQueries(0):
+            self.assertEqual(post.header_image.name, "blog/gallery/c.jpg")
+
+
+class KeysetPaginationTests(TestCase):
+    def setUp(self):
+        ahora = timezone.now()
+        # Dos posts con la misma fecha: el id desempata
+        fechas = [ahora, ahora, ahora - timedelta(days=1), ahora - timedelta(days=2)]
+        self.posts = [
+            BlogPost.objects.create(
+                titulo=f"Keyset {i}", slug=f"keyset-{i}", fecha_publicacion=f
+            )
+            for i, f in enumerate(fechas)
+        ]
+        self.qs = BlogPost.objects.filter(pk__in=[p.pk for p in self.posts])
+        self.rf = RequestFactory()
+
+    def _page(self, url):
+        return keyset_page(self.qs, self.rf.get(url), per_page=2)
+
+    def test_recorre_hacia_adelante_y_atras_sin_saltos(self):
+        p1 = self._page("/blog/")
+        self.assertFalse(p1.has_previous)
+        p2 = self._page(p1.next_url)
+        self.assertFalse(p2.has_next)
+        vistos = [p.pk for p in p1] + [p.pk for p in p2]
+        self.assertEqual(sorted(vistos), sorted(p.pk for p in self.posts))
+        self.assertEqual(len(set(vistos)), 4)
+
+        atras = self._page(p2.previous_url)
+        self.assertEqual([p.pk for p in atras], [p.pk for p in p1])
+        self.assertFalse(atras.has_previous)
+
+    def test_cursor_invalido_vuelve_al_inicio(self):
+        self.assertEqual(
+            [p.pk for p in self._page("/blog/?after=basura")],
+            [p.pk for p in self._page("/blog/")],
+        )
+
+
+class CommentCountTests(TestCase):
+    def setUp(self):
+        self.post = BlogPost.objects.create(titulo="Minga", slug="minga-test")
+
+    def _count(self):
+        self.post.refresh_from_db()
+        return self.post.comentarios_count
+
+    def _comment(self, status=BlogComment.Status.PENDING):
+        return BlogComment.objects.create(post=self.post, cuerpo="Hola", status=status)
+
+    def test_transiciones_de_estado(self):
+        c = self._comment()
+        self.assertEqual(self._count(), 0)
+
+        c.status = BlogComment.Status.APPROVED
+        c.save()
+        self.assertEqual(self._count(), 1)
+
+        c.cuerpo = "Editado"  # guardar sin cambiar estado no recuenta
+        with self.assertNumQueries(1):
+            c.save()
+        self.assertEqual(self._count(), 1)
+
+        c.status = BlogComment.Status.SPAM
+        c.save()
+        self.assertEqual(self._count(), 0)
+
+        aprobado = self._comment(BlogComment.Status.APPROVED)
+        self.assertEqual(self._count(), 1)
+        BlogComment.objects.get(pk=aprobado.pk).delete()
+        self.assertEqual(self._count(), 0)
+
+    def test_moderacion_masiva_con_consultas_constantes(self):
+        for _ in range(5):
+            self._comment(BlogComment.Status.APPROVED)
+        for _ in range(5):
+            self._comment()
+        self.assertEqual(self._count(), 5)
+
+        qs = BlogComment.objects.filter(post=self.post)
+        # savepoint + agrupada + UPDATE comentarios + UPDATE contadores + release
+        with self.assertNumQueries(5):
+            comment_counts.moderate(qs, BlogComment.Status.SPAM)
+        self.assertEqual(self._count(), 0)
+
+        comment_counts.moderate(qs, BlogComment.Status.APPROVED)
+        self.assertEqual(self._count(), 10)
+
+    def test_repair_corrige_la_deriva(self):
+        self._comment(BlogComment.Status.APPROVED)
+        BlogPost.objects.filter(pk=self.post.pk).update(comentarios_count=7)
+        self.assertEqual(comment_counts.recount(), 1)
+        self.assertEqual(self._count(), 1)
@@ -1,10 +1,15 @@
 # blog/views.py
 from django.shortcuts import render, get_object_or_404, redirect
-from .models import BlogPage, BlogCategory, BlogTag, BlogAuthor
+from .models import BlogCategory, BlogTag, BlogAuthor
+from django.conf import settings
 from django.contrib import messages
 from .forms import BlogCommentForm
-from .models import BlogComment, BlogSidebarWidget
-from django.db.models import Count, Q
+from .models import BlogComment
+from .pagination import keyset_page
+from .sidebar import sidebar_context
+from core import outbox, search
+from core.querybudget import query_budget
+from django.db import transaction
 from django.db.models import Prefetch  # <- agrega Prefetch (y Q si lo usas)
 from django.utils import timezone
 from django.contrib.auth.mixins import LoginRequiredMixin, PermissionRequiredMixin
@@ -14,132 +19,70 @@ from .forms import BlogPostForm
 from .models import BlogPost
 
 COMMON_PREFETCH = ("tags", "fotos")
-COMMON_SELECT = ("autor", "categoria")
+COMMON_SELECT = ("autor", "categoria", "header_foto")
 
 
 def _base_ctx():
-    page = BlogPage.objects.select_related("header").prefetch_related("widgets").first()
+    # Sidebar compartido por todas las vistas del blog (cacheado, ver blog/sidebar.py)
+    return dict(sidebar_context())
 
-    # Widgets publicados y ordenados
-    widgets = (
-        page.widgets.filter(publicado=True).order_by("orden")
-        if page
-        else BlogSidebarWidget.objects.none()
-    )
-
-    # Máximo límite que pidan los widgets de tipo "latest_posts"
-    max_latest = max(
-        [w.limite or 5 for w in widgets if w.tipo == "latest_posts"] or [0]
-    )
 
-    # Trae posts publicados hasta el máximo necesario (evitas consultas por widget)
-    latest_posts = (
+def _published_posts():
+    return (
         BlogPost.objects.filter(publicado=True)
         .exclude(slug__isnull=True)
         .exclude(slug="")
-        .select_related("autor", "categoria")
-        .prefetch_related("tags", "fotos")
-        .order_by("-fecha_publicacion")[:max_latest]
+        .select_related(*COMMON_SELECT)
+        .prefetch_related(*COMMON_PREFETCH)
     )
-    if max_latest:
-        latest_posts = (
-            BlogPost.objects.filter(publicado=True)
-            .select_related("autor", "categoria")
-            .prefetch_related("tags", "fotos")
-            .order_by("-fecha_publicacion")[:max_latest]
-        )
 
-    # Archives & taxonomías
-    archives = BlogPost.objects.filter(publicado=True).dates(
-        "fecha_publicacion", "month", order="DESC"
-    )
-    tags = BlogTag.objects.annotate(
-        n=Count("posts", filter=Q(posts__publicado=True), distinct=True)
-    ).order_by("nombre")
-    cats = BlogCategory.objects.annotate(
-        n=Count("posts", filter=Q(posts__publicado=True))
-    ).order_by("nombre")
-
-    return {
-        "page": page,
-        "widgets": widgets,
-        "latest_posts": latest_posts,
-        "archives": archives,
-        "all_tags": tags,
-        "all_categories": cats,
-    }
+
+def _render_list(request, posts, **extra):
+    # Paginación por cursor sobre (fecha_publicacion, id), ver blog/pagination.py
+    page = keyset_page(posts, request)
+    ctx = {"posts": page.object_list, "keyset": page, **extra}
+    ctx.update(_base_ctx())
+    return render(request, "blog/blog_list.html", ctx)
 
 
+@query_budget(queries=20)
 def blog_list(request):
     q = request.GET.get("q", "").strip()
-    posts = (
-        BlogPost.objects.filter(publicado=True)
-        .exclude(slug__isnull=True)
-        .exclude(slug="")
-        .select_related(*COMMON_SELECT)
-        .prefetch_related(*COMMON_PREFETCH)
-        .order_by("-fecha_publicacion")
-    )
-
-    if q:
-        posts = posts.filter(Q(titulo__icontains=q) | Q(resumen__icontains=q))
-
-    ctx = {"posts": posts, "q": q}
+    posts = _published_posts()
+    if not q:
+        return _render_list(request, posts, q=q)
+
+    # Búsqueda de texto completo (core/search.py): ranking + snippets resaltados.
+    # Ordenada por relevancia, así que aquí se pagina por número de página.
+    page_obj = search.search_page(posts, q, page=request.GET.get("page"))
+    ctx = {"posts": page_obj.object_list, "page_obj": page_obj, "q": q}
     ctx.update(_base_ctx())
     return render(request, "blog/blog_list.html", ctx)
 
 
 def blog_list_by_category(request, slug):
     categoria = get_object_or_404(BlogCategory, slug=slug)
-    posts = (
-        BlogPost.objects.filter(publicado=True, categoria=categoria)
-        .select_related(*COMMON_SELECT)
-        .prefetch_related(*COMMON_PREFETCH)
-        .order_by("-fecha_publicacion")
-    )
-    ctx = {"posts": posts, "categoria": categoria}
-    ctx.update(_base_ctx())
-    return render(request, "blog/blog_list.html", ctx)
+    posts = _published_posts().filter(categoria=categoria)
+    return _render_list(request, posts, categoria=categoria)
 
 
 def blog_list_by_tag(request, slug):
     tag = get_object_or_404(BlogTag, slug=slug)
-    posts = (
-        BlogPost.objects.filter(publicado=True, tags=tag)
-        .select_related(*COMMON_SELECT)
-        .prefetch_related(*COMMON_PREFETCH)
-        .order_by("-fecha_publicacion")
-    )
-    ctx = {"posts": posts, "tag": tag}
-    ctx.update(_base_ctx())
-    return render(request, "blog/blog_list.html", ctx)
+    posts = _published_posts().filter(tags=tag)
+    return _render_list(request, posts, tag=tag)
 
 
 def blog_list_by_author(request, slug):
     autor = get_object_or_404(BlogAuthor, slug=slug)
-    posts = (
-        BlogPost.objects.filter(publicado=True, autor=autor)
-        .select_related(*COMMON_SELECT)
-        .prefetch_related(*COMMON_PREFETCH)
-        .order_by("-fecha_publicacion")
-    )
-    ctx = {"posts": posts, "autor": autor}
-    ctx.update(_base_ctx())
-    return render(request, "blog/blog_list.html", ctx)
+    posts = _published_posts().filter(autor=autor)
+    return _render_list(request, posts, autor=autor)
 
 
 def blog_list_by_month(request, year, month):
-    posts = (
-        BlogPost.objects.filter(
-            publicado=True, fecha_publicacion__year=year, fecha_publicacion__month=month
-        )
-        .select_related(*COMMON_SELECT)
-        .prefetch_related(*COMMON_PREFETCH)
-        .order_by("-fecha_publicacion")
+    posts = _published_posts().filter(
+        fecha_publicacion__year=year, fecha_publicacion__month=month
     )
-    ctx = {"posts": posts, "archive_year": year, "archive_month": month}
-    ctx.update(_base_ctx())
-    return render(request, "blog/blog_list.html", ctx)
+    return _render_list(request, posts, archive_year=year, archive_month=month)
 
 
 def blog_detail(request, slug):
@@ -191,7 +134,16 @@ def blog_detail(request, slug):
             if not c.status:
                 c.status = BlogComment.Status.PENDING
 
-            c.save()
+            with transaction.atomic():
+                c.save()
+                if c.status == BlogComment.Status.PENDING:
+                    # Aviso de moderación; lo entrega `manage.py send_outbox`
+                    outbox.enqueue(
+                        f"Comentario pendiente en «{post.titulo}»",
+                        f"De: {c.nombre or 'Anónimo'} <{c.email}>\n\n{c.cuerpo}\n\n"
+                        f"{request.build_absolute_uri(request.path)}",
+                        recipient_list=[settings.DEFAULT_FROM_EMAIL],
+                    )
             messages.success(
                 request, "¡Gracias! Tu comentario quedará visible cuando sea aprobado."
             )
@@ -3,6 +3,11 @@ ASGI config for chambalabamba project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
 
+Modo ASGI (vistas async sin bloquear el worker mientras esperan red):
+
+    gunicorn chambalabamba.asgi:application -k uvicorn_worker.UvicornWorker
+    uvicorn chambalabamba.asgi:application
+
 For more information on this file, see
 https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 """
@@ -11,6 +16,10 @@ import os
 
 from django.core.asgi import get_asgi_application
 
+from core.asgi_static import StaticFilesASGI
+
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "chambalabamba.settings")
+# Quita WhiteNoiseMiddleware (síncrono) de la pila; los estáticos van por ASGI
+os.environ.setdefault("ASGI_MODE", "True")
 
-application = get_asgi_application()
+application = StaticFilesASGI(get_asgi_application())
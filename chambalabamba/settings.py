@@ -18,8 +18,15 @@ MEDIA_ROOT = BASE_DIR / "media"
 MEDIA_ROOT = "/opt/render/project/src/media"
 MEDIA_URL = "/media/"
 
+# Servido de media en producción (core/media.py):
+#   "django"     → FileResponse (gunicorn lo envía con sendfile)
+#   "x-accel"    → nginx con `location /protected-media/ { internal; alias <MEDIA_ROOT>/; }`
+#   "x-sendfile" → Apache mod_xsendfile / lighttpd
+MEDIA_SERVE_MODE = config("MEDIA_SERVE_MODE", default="django")
+MEDIA_ACCEL_PREFIX = config("MEDIA_ACCEL_PREFIX", default="/protected-media/")
+MEDIA_CACHE_MAX_AGE = config("MEDIA_CACHE_MAX_AGE", default=60 * 60 * 24, cast=int)
+
 
-print("BD", BASE_DIR)
 # Seguridad
 SECRET_KEY = config("SECRET_KEY")
 
@@ -79,6 +86,8 @@ LOGOUT_REDIRECT_URL = "home"
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    "core.querybudget.QueryBudgetMiddleware",
+    "inicio.section_headers.SectionHeaderMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.locale.LocaleMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -88,6 +97,30 @@ MIDDLEWARE = [
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
 ]
 
+# Modo ASGI (uvicorn; lo activa chambalabamba/asgi.py): toda la pila de middleware
+# es async y los estáticos los sirve core/asgi_static.py en vez de WhiteNoise,
+# que es solo síncrono y serializaría las peticiones en un hilo.
+# Django no admite conexiones persistentes bajo ASGI (cada petición abre la suya
+# en un hilo nuevo y quedarían sin cerrar hasta agotar max_connections): en este
+# modo se fuerza CONN_MAX_AGE=0 sin health checks (ver "Base de datos"); para
+# reutilizar conexiones, DB_POOL=True
+ASGI_MODE = config("ASGI_MODE", default=False, cast=bool)
+if ASGI_MODE:
+    MIDDLEWARE.remove("whitenoise.middleware.WhiteNoiseMiddleware")
+
+
+# Presupuesto de consultas por petición (core/querybudget.py)
+SERVER_TIMING = config("SERVER_TIMING", default=DEBUG, cast=bool)
+QUERY_BUDGET_QUERIES = config("QUERY_BUDGET_QUERIES", default=50, cast=int)
+QUERY_BUDGET_TIME_MS = config("QUERY_BUDGET_TIME_MS", default=500, cast=int)
+QUERY_BUDGET_DUPLICATES = 3  # repeticiones del mismo SQL que se reportan como N+1
+# Una vista que excede el presupuesto que declaró lanza QueryBudgetExceeded en vez
+# de solo avisar (`manage.py test` lo activa: core/test_runner.py)
+QUERY_BUDGET_RAISE = config("QUERY_BUDGET_RAISE", default=False, cast=bool)
+# Tiempo de cada simple/inclusion tag en Server-Timing (se instala en CoreConfig.ready)
+QUERY_BUDGET_TEMPLATE_TAGS = config(
+    "QUERY_BUDGET_TEMPLATE_TAGS", default=SERVER_TIMING, cast=bool
+)
 
 # CRISPY FORMS
 CRISPY_ALLOWED_TEMPLATE_PACKS = "bootstrap4"
@@ -129,6 +162,26 @@ TEMPLATES = [
         },
     },
 ]
+# En producción, plantillas compiladas una vez por proceso (cached loader
+# explícito; core/warmup.py las precompila todas al arrancar el worker)
+if not DEBUG:
+    TEMPLATES[0]["APP_DIRS"] = False
+    TEMPLATES[0]["OPTIONS"]["loaders"] = [
+        (
+            "django.template.loaders.cached.Loader",
+            [
+                "django.template.loaders.filesystem.Loader",
+                "django.template.loaders.app_directories.Loader",
+            ],
+        )
+    ]
+
+# Warmup al arrancar cada worker (gunicorn.conf.py → core/warmup.py): plantillas
+# y URLs siempre; además footer/sidebar/cabeceras y, opcionalmente, las páginas
+# públicas en la caché de página (con WARMUP_HOST, o el primero de ALLOWED_HOSTS)
+WARMUP_CACHES = config("WARMUP_CACHES", default=True, cast=bool)
+WARMUP_PAGES = config("WARMUP_PAGES", default=False, cast=bool)
+WARMUP_HOST = config("WARMUP_HOST", default="")
 
 WSGI_APPLICATION = "chambalabamba.wsgi.application"
 
@@ -149,7 +202,82 @@ STATIC_ROOT = os.path.join(BASE_DIR, "staticfiles")
 STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
 
 # Base de datos
-DATABASES = {"default": dj_database_url.config(default=config("DATABASE_URL"))}
+# Driver de PostgreSQL: psycopg 3 (requirements: psycopg[binary,pool]), que Django
+# prefiere siempre que está instalado; psycopg2 ya no se usa.
+# Conexiones persistentes (DB_CONN_MAX_AGE s, comprobadas antes de reutilizarse)
+# para no pagar TCP+TLS+auth de PostgreSQL en cada petición. Con DB_POOL=True se
+# usa en su lugar el pool nativo de Django (psycopg 3); `manage.py db_benchmark`
+# mide la diferencia
+# (bajo ASGI_MODE siempre 0: ver arriba)
+DB_CONN_MAX_AGE = 0 if ASGI_MODE else config("DB_CONN_MAX_AGE", default=600, cast=int)
+DB_POOL = config("DB_POOL", default=False, cast=bool)
+DATABASES = {
+    "default": dj_database_url.config(
+        default=config("DATABASE_URL"),
+        conn_max_age=DB_CONN_MAX_AGE,
+        conn_health_checks=DB_CONN_MAX_AGE > 0,
+    )
+}
+if DATABASES["default"]["ENGINE"] == "django.db.backends.postgresql":
+    _db_options = DATABASES["default"].setdefault("OPTIONS", {})
+    _db_options.setdefault(
+        "connect_timeout", config("DB_CONNECT_TIMEOUT", default=5, cast=int)
+    )
+    if DB_POOL:
+        # El pool ya reutiliza conexiones: Django exige CONN_MAX_AGE = 0; con
+        # CONN_HEALTH_CHECKS el pool comprueba cada conexión al prestarla
+        DATABASES["default"]["CONN_MAX_AGE"] = 0
+        DATABASES["default"]["CONN_HEALTH_CHECKS"] = True
+        _db_options["pool"] = {
+            "min_size": config("DB_POOL_MIN_SIZE", default=2, cast=int),
+            "max_size": config("DB_POOL_MAX_SIZE", default=10, cast=int),
+            "timeout": config("DB_POOL_TIMEOUT", default=10, cast=int),
+            # Cierra las ociosas antes de que el servidor (o Render) las corte
+            "max_idle": config("DB_POOL_MAX_IDLE", default=300, cast=int),
+        }
+
+# Caché compartida entre workers (tabla django_cache: `createcachetable`, lo hace
+# init_app.sh). Las invalidaciones por etiqueta (core/cache.py) solo llegan a
+# todos los workers con un backend compartido; con uno local (LocMemCache) las
+# entradas "sin caducidad" caducan a los CACHE_LOCAL_TIMEOUT segundos
+CACHES = {
+    "default": {
+        "BACKEND": config(
+            "CACHE_BACKEND", default="django.core.cache.backends.db.DatabaseCache"
+        ),
+        "LOCATION": config("CACHE_LOCATION", default="django_cache"),
+        "TIMEOUT": config("CACHE_TIMEOUT", default=300, cast=int),
+    }
+}
+CACHE_LOCAL_TIMEOUT = config("CACHE_LOCAL_TIMEOUT", default=60, cast=int)
+# `manage.py test` usa LocMemCache y QUERY_BUDGET_RAISE (core/test_runner.py)
+TEST_RUNNER = "core.test_runner.TestRunner"
+BLOG_SIDEBAR_CACHE_TIMEOUT = config(
+    "BLOG_SIDEBAR_CACHE_TIMEOUT", default=60 * 60 * 24, cast=int
+)
+# Páginas singleton (core/singletons.py): segundos que cada proceso reutiliza su
+# copia en memoria antes de revalidarla contra la caché compartida
+SINGLETON_LOCAL_TTL = config("SINGLETON_LOCAL_TTL", default=5, cast=int)
+
+# Caché de página completa para anónimos (core/pagecache.py)
+PAGE_CACHE_ENABLED = config("PAGE_CACHE_ENABLED", default=True, cast=bool)
+PAGE_CACHE_TIMEOUT = config("PAGE_CACHE_TIMEOUT", default=60 * 10, cast=int)
+# Apps que lee toda página (cabecera, pie con últimos posts, galerías de cabecera)
+PAGE_CACHE_BASE_TAGS = ("contenido", "core", "blog", "inicio")
+# Modelos (o apps) cuyos cambios no invalidan nada cacheado (core/cache.py)
+CACHE_TAG_IGNORE = (
+    "migrations",  # django_migrations: se guarda antes de que exista django_cache
+    "sessions",
+    "admin",
+    "core.outboundemail",
+    "core.searchdocument",
+    "blog.blogcomment",
+    "donaciones.donacion",
+    "donaciones.paypalevent",
+)
+
+# Búsqueda de texto completo (core/search.py): configuración de texto de PostgreSQL
+SEARCH_CONFIG = config("SEARCH_CONFIG", default="spanish")
 
 # Validación de contraseñas
 AUTH_PASSWORD_VALIDATORS = [
@@ -173,6 +301,10 @@ LANGUAGES = [
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+# Datos semilla (core/seeding.py): se cargan con `manage.py seed --parallel`;
+# True para que además los cargue cada `migrate` (como antes)
+SEED_ON_MIGRATE = config("SEED_ON_MIGRATE", default=False, cast=bool)
+
 # Email settings
 EMAIL_BACKEND = "django.core.mail.backends.smtp.EmailBackend"
 EMAIL_HOST = "smtp.zoho.eu"
@@ -182,9 +314,38 @@ EMAIL_USE_SSL = False
 EMAIL_HOST_USER = config("EMAIL_HOST_USER")
 EMAIL_HOST_PASSWORD = config("EMAIL_HOST_PASSWORD")
 DEFAULT_FROM_EMAIL = EMAIL_HOST_USER
+# Segundos por operación SMTP; sin él un servidor colgado bloquea el lote entero
+EMAIL_TIMEOUT = config("EMAIL_TIMEOUT", default=20, cast=int)
+
+# Bandeja de salida (core/outbox.py): las vistas encolan y `manage.py send_outbox`
+# entrega en lotes; reintentos con espera exponencial desde OUTBOX_RETRY_DELAY s
+OUTBOX_BATCH_SIZE = config("OUTBOX_BATCH_SIZE", default=50, cast=int)
+OUTBOX_MAX_ATTEMPTS = config("OUTBOX_MAX_ATTEMPTS", default=6, cast=int)
+OUTBOX_RETRY_DELAY = 60
+# Reserva de un lote (s): cubre el peor caso, cada correo agota EMAIL_TIMEOUT al
+# enviar y otra vez al reabrir la sesión, para que otro worker no lo retome en curso
+OUTBOX_LEASE = config(
+    "OUTBOX_LEASE", default=OUTBOX_BATCH_SIZE * EMAIL_TIMEOUT * 2 + 60, cast=int
+)
+OUTBOX_RETRY_MAX_DELAY = 60 * 60
 
 # PayPal settings
 PAYPAL_RECEIVER_EMAIL = config(
     "PAYPAL_RECEIVER_EMAIL", default="sb-wtmbn45974096@business.example.com"
 )
 PAYPAL_TEST = config("PAYPAL_TEST", default=True, cast=bool)
+
+# API REST (donaciones/paypal_utils.py)
+PAYPAL_CLIENT_ID = config("PAYPAL_ID", default="")
+PAYPAL_SECRET = config("PAYPAL_SECRET", default="")
+PAYPAL_BASE_URL = config("PAYPAL_BASE_URL", default="https://api-m.sandbox.paypal.com")
+PAYPAL_CONNECT_TIMEOUT = 3.05  # s
+PAYPAL_READ_TIMEOUT = config("PAYPAL_READ_TIMEOUT", default=15, cast=float)
+PAYPAL_RETRIES = 2  # reintentos ante 5xx / errores de red
+PAYPAL_WEBHOOK_ID = config("PAYPAL_WEBHOOK_ID", default="")
+PAYPAL_CURRENCY = "USD"  # moneda de las donaciones (se comprueba al volver de PayPal)
+# Webhooks que fallan al aplicarse (donaciones/payments.py): reintento con espera
+# exponencial desde PAYPAL_EVENT_RETRY_DELAY s; se descartan tras MAX_ATTEMPTS
+PAYPAL_EVENT_MAX_ATTEMPTS = config("PAYPAL_EVENT_MAX_ATTEMPTS", default=8, cast=int)
+PAYPAL_EVENT_RETRY_DELAY = 30
+PAYPAL_EVENT_RETRY_MAX_DELAY = 60 * 60
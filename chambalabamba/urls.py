@@ -20,7 +20,9 @@ from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import path, include
 from django.urls import re_path
-from django.views.static import serve
+
+from core import views as core_views
+from core.media import serve_media
 
 urlpatterns = [
     path("i18n/", include("django.conf.urls.i18n")),
@@ -41,6 +43,12 @@ urlpatterns += [
     path("auth/", include("autenticacion.urls")),
     path("proyectos/", include("proyectos.urls")),
     path("cooperaciones/", include(("cooperaciones.urls", "coops"), namespace="coops")),
+    # Miniaturas generadas bajo demanda (core/thumbnails.py)
+    path(
+        "thumbs/<int:width>/<str:fmt>/<path:name>",
+        core_views.thumbnail,
+        name="thumbnail",
+    ),
     # path('login/', auth_views.LoginView.as_view(template_name='autenticacion/login.html'), name='login'),
 ]
 """
@@ -60,7 +68,8 @@ if settings.DEBUG:
 if settings.DEBUG:
     urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
 else:
-    # En producción: servir media con Django
+    # En producción: core.media (X-Accel-Redirect/X-Sendfile o sendfile, ETag,
+    # Range y caché larga; ver MEDIA_SERVE_MODE en settings)
     urlpatterns += [
-        re_path(r"^media/(?P<path>.*)$", serve, {"document_root": settings.MEDIA_ROOT}),
+        re_path(r"^media/(?P<path>.*)$", serve_media),
     ]
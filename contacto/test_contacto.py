@@ -56,7 +56,7 @@ class ContactoTests(TestCase):
         self.assertEqual(args[1], "contacto/donaciones.html")
         self.assertIsInstance(args[2]["form"], ContactForm)
 
-    @patch("contacto.views.send_mail")
+    @patch("contacto.views.outbox.enqueue")
     @patch("contacto.views.render")
     def test_index_view_post_success(self, mock_render, mock_send_mail):
         request = HttpRequest()
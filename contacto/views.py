@@ -1,20 +1,40 @@
+from asgiref.sync import sync_to_async
 from django.shortcuts import render
-from django.core.mail import send_mail
+from django.db import transaction
 from django.conf import settings
 from .forms import ContactForm
 from .models import ContactoStatic
+from core import outbox
+from core.singletons import get_singleton
 import logging
 
 logger = logging.getLogger(__name__)
 
 
-def index(request):
-    static_content = ContactoStatic.objects.first()
+def _save_and_notify(form, notification, confirmation):
+    # Se encolan junto con el mensaje; los entrega `manage.py send_outbox`
+    with transaction.atomic():
+        form.save()  # Save the form data to the database
+        outbox.enqueue(
+            *notification,
+            settings.EMAIL_HOST_USER,
+            [settings.EMAIL_HOST_USER],
+            reply_to=[form.cleaned_data["email"]],
+        )
+        outbox.enqueue(
+            *confirmation,
+            settings.EMAIL_HOST_USER,
+            [form.cleaned_data["email"]],
+        )
+
+
+async def index(request):
+    # Async (modo ASGI): el ORM, la validación del ModelForm y el render (las
+    # plantillas consultan la BD) cruzan a sync con sync_to_async
+    static_content = await sync_to_async(get_singleton)(ContactoStatic)
     if request.method == "POST":
         form = ContactForm(request.POST)
-        if form.is_valid():
-            form.save()  # Save the form data to the database
-
+        if await sync_to_async(form.is_valid)():
             # Send email notifications
             subject = f"Nuevo mensaje de contacto: {form.cleaned_data['subject']}"
             message = f"De: {form.cleaned_data['name']}\n"
@@ -22,35 +42,25 @@ def index(request):
             message += f"Contactos: {form.cleaned_data['phone']}\n\n"
             message += f"Mensaje: {form.cleaned_data['message']}"
 
-            try:
-                send_mail(
-                    subject,
-                    message,
-                    settings.EMAIL_HOST_USER,
-                    [settings.EMAIL_HOST_USER],
-                    fail_silently=False,
-                )
-
-                # Send a confirmation email to the sender
-                confirmation_subject = "Confirmación de recepción de mensaje"
-                confirmation_message = (
-                    "Gracias por contactarnos. Hemos recibido tu mensaje:\n\n"
-                )
-                confirmation_message += f"Asunto: {form.cleaned_data['subject']}\n"
-                confirmation_message += f"Mensaje: {form.cleaned_data['message']}\n\n"
-                confirmation_message += "Nos pondremos en contacto contigo pronto."
+            # Send a confirmation email to the sender
+            confirmation_subject = "Confirmación de recepción de mensaje"
+            confirmation_message = (
+                "Gracias por contactarnos. Hemos recibido tu mensaje:\n\n"
+            )
+            confirmation_message += f"Asunto: {form.cleaned_data['subject']}\n"
+            confirmation_message += f"Mensaje: {form.cleaned_data['message']}\n\n"
+            confirmation_message += "Nos pondremos en contacto contigo pronto."
 
-                send_mail(
-                    confirmation_subject,
-                    confirmation_message,
-                    settings.EMAIL_HOST_USER,
-                    [form.cleaned_data["email"]],
-                    fail_silently=False,
+            try:
+                await sync_to_async(_save_and_notify)(
+                    form,
+                    (subject, message),
+                    (confirmation_subject, confirmation_message),
                 )
 
                 success_message = "¡Mensaje enviado exitosamente!"
                 form = ContactForm()  # Clear the form
-                return render(
+                return await sync_to_async(render)(
                     request,
                     "contacto/index.html",
                     {
@@ -68,6 +78,6 @@ def index(request):
     else:
         form = ContactForm()
 
-    return render(
+    return await sync_to_async(render)(
         request, "contacto/index.html", {"form": form, "static_content": static_content}
     )
@@ -8,7 +8,5 @@ class ContenidoConfig(AppConfig):
     verbose_name = "Contenido-Home"  # ← lo que quieres ver en el admin
 
     def ready(self):
-        from django.db.models.signals import post_migrate
-        from .seeders import _seed_footer_once
-
-        post_migrate.connect(_seed_footer_once, sender=self)
+        from . import seeders  # noqa: F401  (semillas, manage.py seed)
+        from . import footer  # noqa: F401  (etiqueta de caché del footer)
@@ -0,0 +1,147 @@
+# contenido/footer.py
+"""
+Pie de página compilado y cacheado por idioma.
+
+El footer sale en todas las páginas; en vez de consultar FooterSettings,
+FooterMenu + links y los últimos posts, y de parsear named_url_kwargs + reverse()
+por cada link en cada petición, se compila una vez a una estructura de dicts
+(mismas claves que usan las plantillas) y se guarda en la caché:
+
+    get_footer()  → {"about": {...} | None, "menus": [...], "latest_posts": [...]}
+
+La etiqueta "section:footer" (core/cache.py) sube al cambiar cualquier modelo
+Footer* o un post del blog, así que con la caché caliente el footer cuesta 0
+consultas.
+"""
+
+import ast
+import json
+
+from django.apps import apps
+from django.urls import NoReverseMatch, reverse
+from django.utils import translation
+
+from core import cache as tagcache
+
+from .models import FooterMenu, FooterSettings
+
+FOOTER_TAG = tagcache.section(
+    "footer",
+    "contenido.FooterSettings",
+    "contenido.FooterMenu",
+    "contenido.FooterLink",
+    "blog.BlogPost",
+    "blog.BlogPostPhoto",
+)
+
+
+def parse_kwargs(raw):
+    """Acepta JSON, 'null'/'none'/vacío y también dict con comillas simples."""
+    if isinstance(raw, dict):
+        return raw
+    if not raw:
+        return {}
+    s = str(raw).strip()
+    if s.lower() in {"null", "none", ""}:
+        return {}
+    # 1) intenta JSON
+    try:
+        return json.loads(s)
+    except Exception:
+        pass
+    # 2) intenta literal_eval (por si usaron comillas simples)
+    try:
+        val = ast.literal_eval(s)
+        if isinstance(val, dict):
+            return val
+    except Exception:
+        pass
+    return {}
+
+
+def resolve_href(named, raw_kwargs, url):
+    """named_url + kwargs (prioridad) o url; None si no hay ninguno válido."""
+    if named:
+        try:
+            return reverse(named, kwargs=parse_kwargs(raw_kwargs))
+        except NoReverseMatch:
+            # Si el named_url no existe o faltan kwargs, usar URL si está
+            return url or None
+    return url or None
+
+
+def _about():
+    about = FooterSettings.objects.first()
+    if about is None:
+        return None
+    return {
+        "title": about.title,
+        "text": about.text,
+        "link_label": about.link_label,
+        "url": about.url,
+        "named_url": about.named_url,
+        "resolved_href": resolve_href(
+            about.named_url, about.named_url_kwargs, about.url
+        ),
+        "open_in_new_tab": about.open_in_new_tab,
+    }
+
+
+def _menus():
+    menus = []
+    for menu in FooterMenu.objects.prefetch_related("links").order_by("order"):
+        links = sorted(menu.links.all(), key=lambda link: (link.order, link.id))
+        menus.append(
+            {
+                "name": menu.name,
+                "links_resolved": [
+                    {
+                        "label": link.label,
+                        "resolved_href": resolve_href(
+                            link.named_url, link.named_url_kwargs, link.url
+                        )
+                        or "#",
+                        "target_attr": "_blank" if link.open_in_new_tab else None,
+                    }
+                    for link in links
+                ],
+            }
+        )
+    return menus
+
+
+def _latest_posts(limit):
+    BlogPost = apps.get_model("blog", "BlogPost")
+    posts = (
+        BlogPost.objects.filter(publicado=True)
+        .select_related("header_foto")
+        .order_by("-fecha_publicacion")[:limit]
+    )
+    items = []
+    for p in posts:
+        url = resolve_href("blog_detail", {"slug": p.slug}, None) if p.slug else None
+        image = p.header_image
+        items.append(
+            {
+                "title": p.titulo,
+                "url": url or "#",
+                "date": p.fecha_publicacion,
+                "image": image.url if image else None,
+            }
+        )
+    return items
+
+
+def build_footer(posts=2):
+    """Compila el footer desde la BD (sin caché) para el idioma activo."""
+    return {"about": _about(), "menus": _menus(), "latest_posts": _latest_posts(posts)}
+
+
+def get_footer(posts=2):
+    return tagcache.get_or_set(
+        "footer",
+        [FOOTER_TAG],
+        lambda: build_footer(posts),
+        translation.get_language() or "",
+        posts,
+    )
@@ -1 +1,32 @@
-# Create your tests here.
+from django.core.cache import cache
+from django.template import Context, Template
+from django.test import TestCase
+
+from contenido.models import FooterLink, FooterMenu
+
+FOOTER = Template(
+    "{% load footer_tags blog_extras %}{% render_footer %}{% latest_posts_footer 2 %}"
+)
+
+
+class FooterCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.menu = FooterMenu.objects.create(name="Menú de prueba", order=99)
+        FooterLink.objects.create(
+            menu=self.menu,
+            label="Blog",
+            named_url="blog_by_tag",
+            named_url_kwargs="{'slug': 'eco'}",
+        )
+
+    def test_warm_footer_costs_no_queries(self):
+        html = FOOTER.render(Context())
+        self.assertIn('href="/blog/blog/tag/eco/"', html)
+        with self.assertNumQueries(0):
+            self.assertEqual(FOOTER.render(Context()), html)
+
+    def test_rebuilt_when_links_change(self):
+        FOOTER.render(Context())
+        FooterLink.objects.create(menu=self.menu, label="Externo", url="https://x.org")
+        self.assertIn('href="https://x.org"', FOOTER.render(Context()))
@@ -1,5 +1,4 @@
 from django.apps import AppConfig
-from django.db.models.signals import post_migrate
 
 
 class CooperacionesConfig(AppConfig):
@@ -8,10 +7,4 @@ class CooperacionesConfig(AppConfig):
     label = "cooperaciones"
 
     def ready(self):
-        from .seeders import _seed_cooperaciones_once
-
-        post_migrate.connect(
-            _seed_cooperaciones_once,
-            sender=self,
-            dispatch_uid="coops_post_migrate_seed",
-        )
+        from . import seeders  # noqa: F401  (semillas, manage.py seed)
@@ -1,7 +1,7 @@
 # cooperaciones/templatetags/coops_extras.py
 from django import template
 from cooperaciones.models import Cooperacion
-from inicio.models import SectionHeader  # 👈 leeremos del admin de Inicio
+from inicio.section_headers import get_section_header  # 👈 admin de Inicio
 
 register = template.Library()
 
@@ -11,11 +11,7 @@ def _home_cooperaciones(
     seccion_key="home_cooperaciones", subtitle=None, title=None, limit=None
 ):
     # Lee configuración desde SectionHeader si existe y está publicado
-    header = (
-        SectionHeader.objects.filter(seccion=seccion_key, publicado=True)
-        .only("title", "subtitle", "limit")
-        .first()
-    )
+    header = get_section_header(seccion_key)
 
     if header:
         if not title:
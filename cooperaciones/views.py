@@ -1,10 +1,14 @@
 # cooperaciones/views.py
 from django.shortcuts import render, get_object_or_404
+from core.singletons import get_singleton
+from core.pagecache import cache_page_anon
+
 from .models import CabeceraCoops, Cooperacion
 
 
+@cache_page_anon("cooperaciones")
 def lista(request):
-    cab = CabeceraCoops.objects.filter(publicado=True).first()
+    cab = get_singleton(CabeceraCoops)
     coops = (
         Cooperacion.objects.filter(publicado=True)
         .select_related("categoria")
@@ -13,6 +17,7 @@ def lista(request):
     return render(request, "cooperaciones/lista.html", {"cab": cab, "coops": coops})
 
 
+@cache_page_anon("cooperaciones")
 def detalle(request, slug):
     coop = get_object_or_404(
         Cooperacion.objects.select_related("categoria").prefetch_related("fotos"),
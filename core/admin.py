@@ -1 +1,29 @@
-# Register your models here.
+from django.contrib import admin
+
+from . import outbox
+from .models import OutboundEmail
+
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = (
+        "subject",
+        "destinatarios",
+        "status",
+        "attempts",
+        "created",
+        "sent_at",
+    )
+    list_filter = ("status",)
+    search_fields = ("subject", "to")
+    readonly_fields = ("attempts", "last_error", "created", "sent_at")
+    actions = ["reintentar"]
+
+    @admin.display(description="Para")
+    def destinatarios(self, obj):
+        return ", ".join(obj.to)
+
+    @admin.action(description="Reintentar el envío")
+    def reintentar(self, request, queryset):
+        n = outbox.retry(queryset)
+        self.message_user(request, f"{n} correos vuelven a la cola.")
@@ -16,9 +16,28 @@ def _copy_media_after_migrate(sender, **kwargs):
         print(f"[seed_media] Error al copiar media semilla: {e}")
 
 
+def _seed_after_migrate(sender, **kwargs):
+    # Las semillas se cargan con `manage.py seed`; aquí solo si se pide
+    if not getattr(settings, "SEED_ON_MIGRATE", False):
+        return
+    from .seeding import seed_after_migrate
+
+    seed_after_migrate(sender, **kwargs)
+
+
 class CoreConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "core"
 
     def ready(self):
+        from .cache import connect_signals
+        from .singletons import register_pages
+
+        register_pages()  # páginas singleton cacheadas (core/singletons.py)
+        connect_signals()  # invalidación por etiquetas (core/cache.py)
+        if getattr(settings, "QUERY_BUDGET_TEMPLATE_TAGS", False):
+            from .querybudget import instrument_template_tags
+
+            instrument_template_tags()  # tiempos de templatetags en Server-Timing
         post_migrate.connect(_copy_media_after_migrate, sender=self)
+        post_migrate.connect(_seed_after_migrate, sender=self)
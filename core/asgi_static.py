@@ -0,0 +1,75 @@
+# core/asgi_static.py
+"""
+Archivos estáticos de WhiteNoise servidos desde ASGI.
+
+WhiteNoiseMiddleware (6.x) es solo síncrono: en una pila ASGI obliga a Django a
+pasar cada petición por el hilo de sync_to_async y se pierde la concurrencia de
+las vistas async. En modo ASGI (settings.ASGI_MODE) se quita de MIDDLEWARE y
+chambalabamba/asgi.py envuelve la aplicación con StaticFilesASGI, que usa la
+misma configuración y los mismos archivos (comprimidos, cabeceras de caché,
+nombres con hash inmutables) pero responde directamente por ASGI:
+
+    application = StaticFilesASGI(get_asgi_application())
+"""
+
+from asgiref.sync import sync_to_async
+from whitenoise.middleware import WhiteNoiseMiddleware
+
+CHUNK_SIZE = 64 * 1024
+
+
+def _meta(scope):
+    """Cabeceras ASGI en el formato de request.META que espera WhiteNoise."""
+    meta = {}
+    for name, value in scope.get("headers", []):
+        key = name.decode("latin-1").upper().replace("-", "_")
+        meta[f"HTTP_{key}"] = value.decode("latin-1")
+    return meta
+
+
+class StaticFilesASGI:
+    def __init__(self, application):
+        self.application = application
+        # Solo para reutilizar su configuración y su índice de archivos
+        self.whitenoise = WhiteNoiseMiddleware()
+
+    def _find(self, path):
+        if self.whitenoise.autorefresh:
+            return self.whitenoise.find_file(path)
+        return self.whitenoise.files.get(path)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["method"] in ("GET", "HEAD"):
+            static_file = self._find(scope["path"])
+            if static_file is not None:
+                return await self._serve(static_file, scope, send)
+        return await self.application(scope, receive, send)
+
+    async def _serve(self, static_file, scope, send):
+        response = static_file.get_response(scope["method"], _meta(scope))
+        await send(
+            {
+                "type": "http.response.start",
+                "status": int(response.status),
+                "headers": [
+                    (key.lower().encode("latin-1"), str(value).encode("latin-1"))
+                    for key, value in response.headers
+                ],
+            }
+        )
+        body = response.file
+        if body is None:
+            await send({"type": "http.response.body", "body": b""})
+            return
+        try:
+            read = sync_to_async(body.read, thread_sensitive=False)
+            while True:
+                chunk = await read(CHUNK_SIZE)
+                more = len(chunk) == CHUNK_SIZE
+                await send(
+                    {"type": "http.response.body", "body": chunk, "more_body": more}
+                )
+                if not more:
+                    break
+        finally:
+            body.close()
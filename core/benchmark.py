@@ -0,0 +1,364 @@
+# core/benchmark.py
+"""
+Benchmark de las rutas públicas: latencia, consultas y bytes por URL con nombre.
+
+    manage.py benchmark --scale 10 --iterations 20 --output benchmarks/baseline.json
+    manage.py benchmark_compare benchmarks/baseline.json benchmarks/actual.json
+
+  * Corre en una base de datos de prueba desechable (como `manage.py test`): se
+    siembra con los conjuntos de core/seeding.py y, con --scale N, cada fila de
+    los modelos de SCALED_MODELS se clona hasta tener N veces las sembradas
+    (también con --keepdb: las copias ya hechas no se repiten);
+    --load-data N añade además el volumen sintético de core/loadgen.py.
+  * Recorre todas las rutas con nombre de chambalabamba/urls.py (menos SKIP_*);
+    las que llevan argumentos los toman de SAMPLES (primer objeto publicado).
+  * Por ruta: una petición en frío (caché vacía) y `iterations` en caliente con
+    el test client; se guardan p50/p95 (ms), consultas (frío y caliente), bytes
+    y estado HTTP en un JSON.
+  * compare() marca como regresión la ruta cuyo p95, consultas o bytes crecen
+    más que el umbral (o cuyo estado cambia).
+"""
+
+import json
+import platform
+import re
+import statistics
+import time
+from datetime import UTC, datetime
+
+import django
+from django.apps import apps
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.urls import URLResolver, get_resolver, reverse
+
+# Rutas que no son páginas públicas de lectura
+SKIP_NAMESPACES = {"admin"}
+SKIP_ROUTES = {
+    "set_language",  # solo POST
+    "thumbnail",  # archivos, no páginas
+    "ckeditor_upload",
+    "ckeditor_browse",
+    "donacion_paypal",  # llama a PayPal
+    "paypal_webhook",
+    "blog_create",  # requieren sesión
+    "blog_update",
+    "logout",
+    "perfil",
+    "perfil_editar",
+    "area_residentes",
+}
+
+# Sufijo de las copias de scale_dataset en sus campos únicos
+CLONE_SUFFIX = re.compile(r"-x\d+$")
+
+# Modelos que escalan con --scale (los que crecen en producción)
+SCALED_MODELS = [
+    "blog.BlogPost",
+    "tienda.Producto",
+    "inicio.Gallery",
+    "cooperaciones.Cooperacion",
+    "participa.Estancia",
+    "visitas.GuidedVisit",
+]
+
+
+def _first(label, **filters):
+    return apps.get_model(label)._base_manager.filter(**filters).order_by("pk").first()
+
+
+def _slug_of(label, **filters):
+    def sample():
+        obj = _first(label, **filters)
+        return {"slug": obj.slug} if obj else None
+
+    return sample
+
+
+def _blog_month():
+    post = (
+        apps.get_model("blog.BlogPost")
+        .objects.filter(publicado=True)
+        .order_by("-fecha_publicacion")
+        .first()
+    )
+    if post is None:
+        return None
+    return {"year": post.fecha_publicacion.year, "month": post.fecha_publicacion.month}
+
+
+# Ruta → función que devuelve sus kwargs (None si no hay datos)
+SAMPLES = {
+    "gallery_detail": _slug_of("inicio.Gallery", publicado=True),
+    "nosotros:pilar_detail": _slug_of("nosotros.PilarPage"),
+    "nosotros:topic_detail": _slug_of("nosotros.TopicPage"),
+    "eventos:taller_detail": _slug_of("eventos.TallerDetail"),
+    "eventos:festival_detail": _slug_of("eventos.Festival"),
+    "blog_detail": _slug_of("blog.BlogPost", publicado=True),
+    "blog_by_category": _slug_of("blog.BlogCategory"),
+    "blog_by_tag": _slug_of("blog.BlogTag"),
+    "blog_by_author": _slug_of("blog.BlogAuthor"),
+    "blog_by_month": _blog_month,
+    "participa:estancia_detail": _slug_of("participa.Estancia", publicado=True),
+    "visitas:detalle-visitas": _slug_of("visitas.GuidedVisit", publicado=True),
+    "coops:detalle": _slug_of("cooperaciones.Cooperacion", publicado=True),
+    "tienda:detalle-producto": _slug_of("tienda.Producto", publicado=True),
+}
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Datos
+# ──────────────────────────────────────────────────────────────────────────────
+def scale_dataset(multiplier, labels=SCALED_MODELS, batch_size=500):
+    """
+    Clona las filas sembradas hasta tener `multiplier` veces cada modelo.
+
+    Las copias llevan el sufijo "-x<n>" en sus campos únicos de texto (slug): solo
+    se clonan las filas sin sufijo y se saltan las copias que ya existen, así que
+    repetir con la misma BD (`benchmark --keepdb`) no duplica nada.
+    """
+    from core.seeding import _refresh_derived
+
+    created = {}
+    for label in labels:
+        model = apps.get_model(label)
+        unique = [
+            f
+            for f in model._meta.concrete_fields
+            if f.unique
+            and not f.primary_key
+            and f.get_internal_type() in ("CharField", "SlugField")
+        ]
+        if not unique:
+            raise ValueError(
+                f"{label} no tiene un campo único de texto para marcar copias"
+            )
+        marker = unique[0].attname
+        existing = set(model._base_manager.values_list(marker, flat=True))
+        originals = [
+            o
+            for o in model._base_manager.all()
+            if not CLONE_SUFFIX.search(getattr(o, marker) or "")
+        ]
+        m2m = [
+            f
+            for f in model._meta.many_to_many
+            if f.remote_field.through._meta.auto_created
+        ]
+        related = {
+            f.name: {
+                o.pk: list(getattr(o, f.name).values_list("pk", flat=True))
+                for o in originals
+            }
+            for f in m2m
+        }
+        copies, sources = [], []
+        for n in range(1, max(int(multiplier), 1)):
+            for obj in originals:
+                clone = model(
+                    **{
+                        f.attname: getattr(obj, f.attname)
+                        for f in model._meta.concrete_fields
+                        if not f.primary_key
+                    }
+                )
+                for f in unique:
+                    value = f"{getattr(obj, f.attname)}-x{n}"
+                    setattr(clone, f.attname, value[-f.max_length :])
+                if getattr(clone, marker) in existing:
+                    continue
+                copies.append(clone)
+                sources.append(obj.pk)
+        model._base_manager.bulk_create(copies, batch_size=batch_size)
+        for f in m2m:
+            through = f.remote_field.through
+            source, target = f.m2m_field_name(), f.m2m_reverse_field_name()
+            through._base_manager.bulk_create(
+                [
+                    through(**{f"{source}_id": clone.pk, f"{target}_id": pk})
+                    for clone, original in zip(copies, sources)
+                    for pk in related[f.name][original]
+                ],
+                batch_size=batch_size,
+            )
+        created[label] = len(copies)
+    _refresh_derived({apps.get_model(label) for label in labels})
+    return created
+
+
+def prepare_dataset(scale=1):
+    """Siembra la BD (conjuntos de core/seeding.py) y la escala."""
+    from core import seeding
+
+    seeding.run()
+    return scale_dataset(scale) if scale > 1 else {}
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Rutas
+# ──────────────────────────────────────────────────────────────────────────────
+def walk_routes(patterns=None, namespace=None):
+    """(nombre con namespace, namespace, parámetros) de cada ruta con nombre."""
+    if patterns is None:
+        patterns = get_resolver().url_patterns
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            ns = namespace
+            if pattern.namespace:
+                ns = (
+                    f"{namespace}:{pattern.namespace}"
+                    if namespace
+                    else pattern.namespace
+                )
+            yield from walk_routes(pattern.url_patterns, ns)
+        elif pattern.name:
+            name = f"{namespace}:{pattern.name}" if namespace else pattern.name
+            yield name, namespace, set(pattern.pattern.regex.groupindex)
+
+
+def public_routes():
+    """[(nombre, url o None si faltan datos para sus argumentos)] sin repetidos."""
+    routes = {}
+    for name, namespace, params in walk_routes():
+        root = (namespace or "").split(":")[0]
+        if name in routes or name in SKIP_ROUTES or root in SKIP_NAMESPACES:
+            continue
+        kwargs = {}
+        if params:
+            sample = SAMPLES.get(name)
+            kwargs = sample() if sample else None
+        routes[name] = reverse(name, kwargs=kwargs) if kwargs is not None else None
+    return list(routes.items())
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Medición
+# ──────────────────────────────────────────────────────────────────────────────
+def percentile(samples, pct):
+    samples = sorted(samples)
+    return samples[min(len(samples) - 1, int(len(samples) * pct / 100))]
+
+
+def _size(response):
+    if response.streaming:
+        return sum(len(chunk) for chunk in response.streaming_content)
+    return len(response.content)
+
+
+def _request(client, url):
+    with CaptureQueriesContext(connection) as ctx:
+        start = time.perf_counter()
+        response = client.get(url)
+        size = _size(response)
+        elapsed = (time.perf_counter() - start) * 1000
+    return response.status_code, elapsed, len(ctx), size
+
+
+def measure(url, iterations=10, client=None):
+    """Una petición en frío y `iterations` en caliente contra `url`."""
+    # Un 500 se mide y se apunta como estado, no corta el benchmark
+    client = client or Client(raise_request_exception=False)
+    cache.clear()
+    status, cold_ms, cold_queries, _ = _request(client, url)
+    timings, queries, size = [], 0, 0
+    for _ in range(max(iterations, 1)):
+        status, ms, queries, size = _request(client, url)
+        timings.append(ms)
+    return {
+        "url": url,
+        "status": status,
+        "cold_ms": round(cold_ms, 2),
+        "p50_ms": round(statistics.median(timings), 2),
+        "p95_ms": round(percentile(timings, 95), 2),
+        "queries_cold": cold_queries,
+        "queries": queries,
+        "bytes": size,
+    }
+
+
+def run(iterations=10, only=None, scale=1, stdout=None):
+    results = {}
+    for name, url in public_routes():
+        if only and name not in only:
+            continue
+        if url is None:
+            results[name] = {"url": None, "skipped": "sin datos para sus argumentos"}
+        else:
+            results[name] = measure(url, iterations)
+        if stdout:
+            stdout.write(format_row(name, results[name]))
+    return {
+        "meta": {
+            "created": datetime.now(UTC).isoformat(timespec="seconds"),
+            "scale": scale,
+            "iterations": iterations,
+            "only": sorted(only or ()),
+            "database": connection.vendor,
+            "django": django.get_version(),
+            "python": platform.python_version(),
+        },
+        "routes": results,
+    }
+
+
+def format_row(name, row):
+    if row.get("url") is None:
+        return f"{name:32} —  {row.get('skipped', '')}"
+    return (
+        f"{name:32} {row['status']}  p50 {row['p50_ms']:7.2f} ms  "
+        f"p95 {row['p95_ms']:7.2f} ms  q {row['queries_cold']:>3}/{row['queries']:<3} "
+        f"{row['bytes']:>8} B"
+    )
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Comparación
+# ──────────────────────────────────────────────────────────────────────────────
+def load(path):
+    with open(path) as fh:
+        return json.load(fh)
+
+
+def save(path, data):
+    with open(path, "w") as fh:
+        json.dump(data, fh, indent=2, sort_keys=True)
+        fh.write("\n")
+
+
+def compare(baseline, current, threshold=0.2, min_ms=5.0):
+    """
+    Lista de regresiones ("ruta: motivo"). Cuenta como regresión:
+      * p95 más de `threshold` por encima (y al menos min_ms, para no saltar por ruido);
+      * más consultas en caliente, o más de `threshold` en frío;
+      * más de `threshold` de bytes;
+      * un estado HTTP distinto, o una ruta medida que ya no se mide.
+    Si la medición actual se limitó a algunas rutas, solo se comparan esas.
+    """
+    problems = []
+    base_routes, cur_routes = baseline["routes"], current["routes"]
+    only = set(current.get("meta", {}).get("only") or ())
+    for name, base in sorted(base_routes.items()):
+        if base.get("url") is None or (only and name not in only):
+            continue
+        cur = cur_routes.get(name)
+        if cur is None or cur.get("url") is None:
+            problems.append(f"{name}: ya no se mide")
+            continue
+        if cur["status"] != base["status"]:
+            problems.append(f"{name}: estado {base['status']} → {cur['status']}")
+        if (
+            cur["p95_ms"] > base["p95_ms"] * (1 + threshold)
+            and cur["p95_ms"] - base["p95_ms"] >= min_ms
+        ):
+            problems.append(f"{name}: p95 {base['p95_ms']} → {cur['p95_ms']} ms")
+        if cur["queries"] > base["queries"]:
+            problems.append(f"{name}: consultas {base['queries']} → {cur['queries']}")
+        if cur["queries_cold"] > base["queries_cold"] * (1 + threshold):
+            problems.append(
+                f"{name}: consultas en frío {base['queries_cold']} → {cur['queries_cold']}"
+            )
+        if cur["bytes"] > base["bytes"] * (1 + threshold):
+            problems.append(f"{name}: bytes {base['bytes']} → {cur['bytes']}")
+    return problems
@@ -0,0 +1,219 @@
+# core/cache.py
+"""
+Caché con invalidación por etiquetas.
+
+Cada entrada declara de qué depende con etiquetas; cada etiqueta tiene una
+versión en la caché compartida y la clave de la entrada incluye las versiones,
+así que invalidar es solo subir la versión (cache.incr, atómico) y lo viejo
+caduca solo:
+
+    from core import cache as tagcache
+
+    GALERIAS = tagcache.model_tag("inicio.Gallery")      # "model:inicio.gallery"
+    SIDEBAR = tagcache.section("blog_sidebar", "blog.BlogPost", "blog.BlogTag")
+
+    posts = tagcache.get_or_set("sidebar", [SIDEBAR], build_sidebar)
+
+    @tagcache.cached(GALERIAS)
+    def galerias(seccion): ...
+
+Etiquetas:
+
+  * "model:<app>.<modelo>" y "app:<app>": las sube cualquier post_save,
+    post_delete o m2m_changed del modelo (connect_signals, desde CoreConfig.ready);
+  * "section:<nombre>": agrupa modelos (section()); la sube un cambio en
+    cualquiera de ellos;
+  * cualquier otra la sube solo invalidate().
+
+Los modelos de CACHE_TAG_IGNORE (bandeja de correo, sesiones...) no suben nada.
+Las versiones iniciales se basan en el reloj: si el backend expulsa una versión,
+la nueva nunca coincide con una entrada vieja que siga en caché.
+
+Con un backend local al proceso (LocMemCache) la versión que sube una edición
+solo la ve el worker que la atendió: ahí las entradas sin caducidad se guardan
+como mucho CACHE_LOCAL_TIMEOUT segundos (entry_timeout).
+"""
+
+import hashlib
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache, caches
+from django.core.cache.backends.locmem import LocMemCache
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+TAG_KEY = "tagcache:tag:{tag}"
+CHANGED_KEY = "tagcache:changed"  # momento del último cambio de un modelo
+ENTRY_KEY = "tagcache:{name}:{parts}:{versions}"
+
+_NONE = "__none__"  # un None también se cachea
+_sections = {}  # label del modelo → {"section:...", ...}
+_epoch = 0  # invalidaciones hechas por este proceso (ver local_epoch)
+
+
+def _label(model):
+    if isinstance(model, str):
+        return model.lower()
+    return model._meta.label_lower
+
+
+def model_tag(model):
+    """Etiqueta de un modelo (clase o "app.Modelo")."""
+    return f"model:{_label(model)}"
+
+
+def app_tag(app_label):
+    return f"app:{app_label}"
+
+
+def section(name, *models):
+    """Declara la etiqueta "section:<name>", que sube al cambiar cualquiera de models."""
+    tag = f"section:{name}"
+    for model in models:
+        _sections.setdefault(_label(model), set()).add(tag)
+    return tag
+
+
+def tags_for(model):
+    """Etiquetas que sube un cambio en el modelo."""
+    label = _label(model)
+    return {f"model:{label}", f"app:{label.split('.')[0]}", *_sections.get(label, ())}
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Versiones
+# ──────────────────────────────────────────────────────────────────────────────
+def _fresh():
+    return int(time.time() * 1000)
+
+
+def snapshot(tags):
+    """(versiones de las etiquetas en orden, momento del último cambio o 0)."""
+    keys = [TAG_KEY.format(tag=t) for t in tags]
+    found = cache.get_many([*keys, CHANGED_KEY])
+    missing = [k for k in keys if k not in found]
+    for key in missing:
+        cache.add(key, _fresh(), timeout=None)
+    if missing:
+        found.update(cache.get_many(missing))
+    return [found.get(k, 0) for k in keys], found.get(CHANGED_KEY, 0)
+
+
+def versions(tags):
+    return snapshot(tags)[0]
+
+
+def local_epoch():
+    """Cambia cada vez que este proceso invalida algo: quien guarde copias en
+    memoria puede revalidarlas al momento en vez de esperar a su TTL."""
+    return _epoch
+
+
+def invalidate(*tags):
+    global _epoch
+    _epoch += 1
+    for tag in tags:
+        key = TAG_KEY.format(tag=tag)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, _fresh(), timeout=None)
+
+
+def invalidate_models(*models):
+    tags = set()
+    for model in models:
+        tags.update(tags_for(model))
+    invalidate(*sorted(tags))
+    cache.set(CHANGED_KEY, time.time(), timeout=None)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Entradas
+# ──────────────────────────────────────────────────────────────────────────────
+def make_key(name, tags, *parts):
+    raw = "|".join(map(str, parts))
+    digest = hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest()[:16]
+    return ENTRY_KEY.format(
+        name=name, parts=digest, versions="-".join(map(str, versions(tags)))
+    )
+
+
+def process_local():
+    """True si la caché por defecto vive en la memoria de cada proceso."""
+    return isinstance(caches["default"], LocMemCache)
+
+
+def entry_timeout(timeout=None):
+    """Caducidad de una entrada: sin caducidad (None) solo en cachés compartidas."""
+    if timeout is None and process_local():
+        return getattr(settings, "CACHE_LOCAL_TIMEOUT", 60)
+    return timeout
+
+
+def get_or_set(name, tags, builder, *parts, timeout=None):
+    """Valor cacheado de builder() bajo name + parts; sin caducidad por defecto."""
+    key = make_key(name, tags, *parts)
+    value = cache.get(key)
+    if value is None:
+        value = builder()
+        cache.set(
+            key, _NONE if value is None else value, timeout=entry_timeout(timeout)
+        )
+    elif value == _NONE:
+        value = None
+    return value
+
+
+def cached(*tags, timeout=None, name=None):
+    """Decorador: cachea la función por sus argumentos bajo `tags`."""
+
+    def decorator(func):
+        entry = name or f"{func.__module__}.{func.__qualname__}"
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            return get_or_set(
+                entry,
+                tags,
+                lambda: func(*args, **kwargs),
+                *args,
+                *sorted(kwargs.items()),
+                timeout=timeout,
+            )
+
+        wrapper.cache_tags = tags
+        wrapper.uncached = func
+        return wrapper
+
+    return decorator
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Señales
+# ──────────────────────────────────────────────────────────────────────────────
+def _ignored(label):
+    ignore = getattr(settings, "CACHE_TAG_IGNORE", ())
+    return label in ignore or label.split(".")[0] in ignore
+
+
+def _model_changed(sender, **kwargs):
+    if not _ignored(_label(sender)):
+        invalidate_models(sender)
+
+
+def _m2m_changed(sender, instance, action, model, **kwargs):
+    if not action.startswith("post_"):
+        return
+    # Cambia la tabla intermedia, el objeto editado y el otro lado de la relación
+    changed = [m for m in {sender, type(instance), model} if not _ignored(_label(m))]
+    if changed:
+        invalidate_models(*changed)
+
+
+def connect_signals():
+    """Cualquier modelo guardado/borrado sube sus etiquetas (CoreConfig.ready)."""
+    post_save.connect(_model_changed, dispatch_uid="tagcache_save")
+    post_delete.connect(_model_changed, dispatch_uid="tagcache_delete")
+    m2m_changed.connect(_m2m_changed, dispatch_uid="tagcache_m2m")
@@ -0,0 +1,496 @@
+# core/loadgen.py
+"""
+Datos sintéticos en volumen para pruebas de escala.
+
+Las semillas traen unas pocas filas de demo y así no se ve ningún problema de
+escala. generate() crea, con bulk_create por bloques (una transacción por bloque):
+
+  * posts del blog con etiquetas, fotos (la primera como cabecera) y comentarios;
+  * productos con imágenes;
+  * galerías de inicio con items;
+  * estancias con fotos, visitas guiadas con fotos y donaciones.
+
+    manage.py generate_load_data --posts 10000 --products 2000 --galleries 500
+    manage.py generate_load_data --scale 5          # Volumes() × 5
+    manage.py generate_load_data --purge            # borra lo generado
+
+Las imágenes apuntan a unos pocos placeholders diminutos (PLACEHOLDERS por
+carpeta de upload_to) escritos una sola vez en MEDIA_ROOT. Todo lo generado lleva
+slug "carga-<corrida>-..." (las donaciones, email @carga.invalid) para poder
+borrarlo con purge(). Como no hay post_save, al final se recalculan los datos
+derivados igual que tras cargar semillas (búsqueda y caché).
+"""
+
+import io
+import random
+import time
+from dataclasses import dataclass, fields
+from datetime import timedelta
+from decimal import Decimal
+from pathlib import Path
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import OuterRef, Subquery
+from django.utils import timezone
+from PIL import Image
+
+from blog.models import (
+    BlogAuthor,
+    BlogCategory,
+    BlogComment,
+    BlogPost,
+    BlogPostPhoto,
+    BlogTag,
+)
+from donaciones.models import Donacion
+from inicio.models import Gallery, GalleryItem
+from participa.models import Estancia, EstanciaFoto
+from tienda.models import Producto, ProductoCategoria, ProductoImagen
+from visitas.models import GuidedVisit, GuidedVisitPhoto
+
+PREFIX = "carga"
+EMAIL_DOMAIN = "carga.invalid"
+PLACEHOLDERS = 6
+CHUNK_SIZE = 1000
+# Secciones de Gallery que se listan en páginas públicas
+GALLERY_SECTIONS = ("home_ultimos_eventos", "participa_estancias")
+
+LOREM = (
+    "Sembramos, cosechamos y compartimos saberes en comunidad. La minga junta "
+    "manos y la tierra responde con alimento, agua limpia y encuentros. "
+)
+_WORDS = LOREM.split()
+
+
+@dataclass
+class Volumes:
+    posts: int = 1000
+    tags: int = 50
+    tags_per_post: int = 3
+    photos_per_post: int = 2
+    comments_per_post: int = 5
+    products: int = 200
+    images_per_product: int = 3
+    galleries: int = 50
+    items_per_gallery: int = 12
+    estancias: int = 30
+    photos_per_estancia: int = 4
+    visits: int = 30
+    photos_per_visit: int = 4
+    donations: int = 2000
+
+    def scaled(self, factor):
+        """Multiplica las cantidades de filas raíz (no las de cada hijo)."""
+        per_parent = {f.name for f in fields(self) if "_per_" in f.name}
+        return Volumes(
+            **{
+                f.name: getattr(self, f.name) * (1 if f.name in per_parent else factor)
+                for f in fields(self)
+            }
+        )
+
+
+def chunks(total, size=CHUNK_SIZE):
+    """range(total) partido en rangos de `size`."""
+    for start in range(0, total, size):
+        yield range(start, min(start + size, total))
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Imágenes
+# ──────────────────────────────────────────────────────────────────────────────
+def placeholders(upload_to, count=PLACEHOLDERS):
+    """Nombres (relativos a MEDIA_ROOT) de `count` JPEG de 16×12 en upload_to."""
+    folder = Path(settings.MEDIA_ROOT) / upload_to
+    folder.mkdir(parents=True, exist_ok=True)
+    names = []
+    for i in range(count):
+        path = folder / f"{PREFIX}-{i}.jpg"
+        if not path.exists():
+            color = (40 + 35 * i % 200, 120 + 20 * i % 120, 60 + 50 * i % 180)
+            buf = io.BytesIO()
+            Image.new("RGB", (16, 12), color).save(buf, "JPEG", quality=60)
+            path.write_bytes(buf.getvalue())
+        names.append(f"{upload_to.rstrip('/')}/{path.name}")
+    return names
+
+
+def _images(model, field="imagen"):
+    return placeholders(model._meta.get_field(field).upload_to)
+
+
+def _text(rng, words=40):
+    return " ".join(rng.choices(_WORDS, k=words))
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Generadores
+# ──────────────────────────────────────────────────────────────────────────────
+class Generator:
+    def __init__(self, volumes, chunk_size=CHUNK_SIZE, seed=0, stdout=None):
+        self.v = volumes
+        self.chunk_size = chunk_size
+        self.rng = random.Random(seed)
+        # Identifica la corrida: los slugs no chocan con los de corridas anteriores
+        self.run = f"{PREFIX}-{int(time.time() * 1000) % 16**8:08x}"
+        self.now = timezone.now()
+        self.stdout = stdout
+        self.counts = {}
+
+    def _log(self, label, n):
+        self.counts[label] = self.counts.get(label, 0) + n
+
+    def _bulk(self, model, objs):
+        model._base_manager.bulk_create(objs, batch_size=self.chunk_size)
+        self._log(model._meta.label, len(objs))
+        return objs
+
+    def _ago(self, days=365):
+        return self.now - timedelta(minutes=self.rng.randrange(days * 24 * 60))
+
+    def _slug(self, kind, i):
+        return f"{self.run}-{kind}-{i}"
+
+    # Blog ------------------------------------------------------------------
+    def blog(self):
+        v = self.v
+        if not v.posts:
+            return
+        tags = self._bulk(
+            BlogTag,
+            [
+                BlogTag(nombre=f"{self.run} tag {i}", slug=self._slug("tag", i))
+                for i in range(max(v.tags, 1))
+            ],
+        )
+        cats = self._bulk(
+            BlogCategory,
+            [
+                BlogCategory(nombre=f"Categoría {i}", slug=self._slug("cat", i))
+                for i in range(8)
+            ],
+        )
+        authors = self._bulk(
+            BlogAuthor,
+            [
+                BlogAuthor(nombre=f"Autora {i}", slug=self._slug("autor", i))
+                for i in range(12)
+            ],
+        )
+        covers = _images(BlogPost, "portada")
+        photos = _images(BlogPostPhoto)
+        Tagged = BlogPost.tags.through
+        # uno de cada cinco comentarios queda pendiente (no cuenta)
+        approved = v.comments_per_post - v.comments_per_post // 5
+
+        for block in chunks(v.posts, self.chunk_size):
+            with transaction.atomic():
+                posts = []
+                for i in block:
+                    published = self._ago()
+                    posts.append(
+                        BlogPost(
+                            titulo=f"Post de carga {i}",
+                            slug=self._slug("post", i),
+                            autor=self.rng.choice(authors),
+                            categoria=self.rng.choice(cats),
+                            resumen=_text(self.rng, 25),
+                            cuerpo_html=f"<p>{_text(self.rng, 200)}</p>",
+                            portada=covers[i % len(covers)],
+                            fecha_publicacion=published,
+                            creado=published,
+                            actualizado=published,
+                            publicado=i % 20 != 0,
+                            comentarios_count=approved,
+                        )
+                    )
+                self._bulk(BlogPost, posts)
+
+                rows = []
+                for post in posts:
+                    for tag in self.rng.sample(tags, min(v.tags_per_post, len(tags))):
+                        rows.append(Tagged(blogpost_id=post.pk, blogtag_id=tag.pk))
+                self._bulk(Tagged, rows)
+
+                self._bulk(
+                    BlogPostPhoto,
+                    [
+                        BlogPostPhoto(
+                            post=post,
+                            imagen=photos[(post.pk + n) % len(photos)],
+                            titulo=f"Foto {n}",
+                            is_header=n == 0,
+                            orden=n,
+                            creado=post.creado,
+                            actualizado=post.creado,
+                        )
+                        for post in posts
+                        for n in range(v.photos_per_post)
+                    ],
+                )
+                if v.photos_per_post:
+                    # Un UPDATE por bloque en vez de refresh_header_foto() por post
+                    BlogPost._base_manager.filter(pk__in=[p.pk for p in posts]).update(
+                        header_foto=Subquery(
+                            BlogPostPhoto.objects.filter(
+                                post=OuterRef("pk"), is_header=True
+                            ).values("pk")[:1]
+                        )
+                    )
+
+                self._bulk(
+                    BlogComment,
+                    [
+                        BlogComment(
+                            post=post,
+                            nombre=f"Visitante {n}",
+                            email=f"visitante{n}@{EMAIL_DOMAIN}",
+                            cuerpo=_text(self.rng, 30),
+                            status=(
+                                BlogComment.Status.APPROVED
+                                if n < approved
+                                else BlogComment.Status.PENDING
+                            ),
+                            creado=post.creado + timedelta(hours=n + 1),
+                            actualizado=post.creado + timedelta(hours=n + 1),
+                        )
+                        for post in posts
+                        for n in range(v.comments_per_post)
+                    ],
+                )
+
+    # Tienda ----------------------------------------------------------------
+    def tienda(self):
+        v = self.v
+        if not v.products:
+            return
+        cats = self._bulk(
+            ProductoCategoria,
+            [
+                ProductoCategoria(
+                    nombre=f"Categoría {i}", slug=self._slug("pcat", i), orden=i
+                )
+                for i in range(6)
+            ],
+        )
+        covers = _images(Producto, "imagen_portada")
+        images = _images(ProductoImagen)
+        for block in chunks(v.products, self.chunk_size):
+            with transaction.atomic():
+                productos = self._bulk(
+                    Producto,
+                    [
+                        Producto(
+                            categoria=cats[i % len(cats)],
+                            titulo=f"Producto de carga {i}",
+                            slug=self._slug("producto", i),
+                            descripcion_corta=_text(self.rng, 12)[:240],
+                            descripcion=_text(self.rng, 80),
+                            imagen_portada=covers[i % len(covers)],
+                            precio=Decimal(self.rng.randrange(100, 5000)) / 100,
+                            orden=i,
+                        )
+                        for i in block
+                    ],
+                )
+                self._bulk(
+                    ProductoImagen,
+                    [
+                        ProductoImagen(
+                            producto=p,
+                            imagen=images[(p.pk + n) % len(images)],
+                            orden=n,
+                        )
+                        for p in productos
+                        for n in range(v.images_per_product)
+                    ],
+                )
+
+    # Galerías, estancias y visitas ----------------------------------------
+    def galerias(self):
+        v = self.v
+        covers = _images(Gallery, "portada")
+        items = _images(GalleryItem)
+        for block in chunks(v.galleries, self.chunk_size):
+            with transaction.atomic():
+                galerias = self._bulk(
+                    Gallery,
+                    [
+                        Gallery(
+                            titulo=f"Galería de carga {i}",
+                            slug=self._slug("galeria", i),
+                            seccion=GALLERY_SECTIONS[i % len(GALLERY_SECTIONS)],
+                            descripcion_breve=_text(self.rng, 10)[:200],
+                            portada=covers[i % len(covers)],
+                            orden=i + 1,
+                        )
+                        for i in block
+                    ],
+                )
+                self._bulk(
+                    GalleryItem,
+                    [
+                        GalleryItem(
+                            galeria=g,
+                            imagen=items[(g.pk + n) % len(items)],
+                            orden=n,
+                        )
+                        for g in galerias
+                        for n in range(v.items_per_gallery)
+                    ],
+                )
+
+    def estancias(self):
+        v = self.v
+        covers = _images(Estancia, "portada")
+        photos = _images(EstanciaFoto)
+        for block in chunks(v.estancias, self.chunk_size):
+            with transaction.atomic():
+                estancias = self._bulk(
+                    Estancia,
+                    [
+                        Estancia(
+                            titulo=f"Estancia de carga {i}",
+                            slug=self._slug("estancia", i),
+                            resumen=_text(self.rng, 20),
+                            descripcion=_text(self.rng, 120),
+                            portada=covers[i % len(covers)],
+                            precio=Decimal(self.rng.randrange(1000, 9000)) / 100,
+                            orden=i,
+                        )
+                        for i in block
+                    ],
+                )
+                self._bulk(
+                    EstanciaFoto,
+                    [
+                        EstanciaFoto(
+                            estancia=e,
+                            imagen=photos[(e.pk + n) % len(photos)],
+                            orden=n,
+                        )
+                        for e in estancias
+                        for n in range(v.photos_per_estancia)
+                    ],
+                )
+
+    def visitas(self):
+        v = self.v
+        covers = _images(GuidedVisit, "portada")
+        photos = _images(GuidedVisitPhoto)
+        for block in chunks(v.visits, self.chunk_size):
+            with transaction.atomic():
+                visitas = self._bulk(
+                    GuidedVisit,
+                    [
+                        GuidedVisit(
+                            titulo=f"Visita de carga {i}",
+                            slug=self._slug("visita", i),
+                            breve=_text(self.rng, 10)[:200],
+                            descripcion_html=f"<p>{_text(self.rng, 120)}</p>",
+                            portada=covers[i % len(covers)],
+                            duracion_minutos=90,
+                            orden=i,
+                        )
+                        for i in block
+                    ],
+                )
+                self._bulk(
+                    GuidedVisitPhoto,
+                    [
+                        GuidedVisitPhoto(
+                            visita=visita,
+                            imagen=photos[(visita.pk + n) % len(photos)],
+                            is_header=n == 0,
+                            orden=n,
+                        )
+                        for visita in visitas
+                        for n in range(v.photos_per_visit)
+                    ],
+                )
+
+    # Donaciones ------------------------------------------------------------
+    def donaciones(self):
+        estados = Donacion.Estado.values
+        for block in chunks(self.v.donations, self.chunk_size):
+            with transaction.atomic():
+                donaciones = []
+                for i in block:
+                    estado = self.rng.choice(estados)
+                    donaciones.append(
+                        Donacion(
+                            nombre=f"Donante {i}",
+                            email=f"{self.run}-{i}@{EMAIL_DOMAIN}",
+                            monto=Decimal(self.rng.choice([5, 10, 20, 50, 100])),
+                            paypal_id=f"{self.run.upper()}-{i}",
+                            estado=estado,
+                            completado=estado == Donacion.Estado.COMPLETADA,
+                        )
+                    )
+                self._bulk(Donacion, donaciones)
+                # creado_en es auto_now_add: se reparte en el último año después
+                for donacion in donaciones:
+                    donacion.creado_en = self._ago()
+                Donacion.objects.bulk_update(
+                    donaciones, ["creado_en"], batch_size=self.chunk_size
+                )
+
+    def generate(self):
+        for step in (
+            self.blog,
+            self.tienda,
+            self.galerias,
+            self.estancias,
+            self.visitas,
+            self.donaciones,
+        ):
+            start = time.perf_counter()
+            step()
+            if self.stdout:
+                self.stdout.write(
+                    f"{step.__name__}: {time.perf_counter() - start:.2f} s"
+                )
+        return self.counts
+
+
+def _refresh(models):
+    from core.seeding import _refresh_derived
+
+    _refresh_derived(models)
+
+
+def generate(volumes=None, chunk_size=CHUNK_SIZE, seed=0, stdout=None):
+    """Genera los volúmenes pedidos. Devuelve {label del modelo: filas creadas}."""
+    gen = Generator(volumes or Volumes(), chunk_size, seed, stdout)
+    counts = gen.generate()
+    _refresh({BlogPost, Producto})
+    return counts
+
+
+def purge():
+    """Borra todo lo generado (en cascada fotos, items, comentarios...)."""
+    counts = {}
+    with transaction.atomic():
+        for model in (
+            BlogPost,
+            BlogTag,
+            BlogCategory,
+            BlogAuthor,
+            Producto,
+            ProductoCategoria,
+            Gallery,
+            Estancia,
+            GuidedVisit,
+        ):
+            _, deleted = model._base_manager.filter(
+                slug__startswith=f"{PREFIX}-"
+            ).delete()
+            for label, n in deleted.items():
+                counts[label] = counts.get(label, 0) + n
+        _, deleted = Donacion.objects.filter(
+            email__endswith=f"@{EMAIL_DOMAIN}"
+        ).delete()
+        counts.update(deleted)
+    _refresh({BlogPost, Producto})
+    return counts
@@ -0,0 +1,66 @@
+# core/management/commands/benchmark.py
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.test.utils import setup_test_environment, teardown_test_environment
+
+from core import benchmark, loadgen
+
+
+class Command(BaseCommand):
+    help = (
+        "Mide p50/p95, consultas y bytes de cada ruta pública en una BD de prueba "
+        "sembrada (core/benchmark.py)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "routes", nargs="*", help="Solo estas rutas (nombre, p.ej. blog_list)"
+        )
+        parser.add_argument(
+            "--scale",
+            type=int,
+            default=1,
+            help="Multiplica las filas sembradas de los modelos que crecen",
+        )
+        parser.add_argument(
+            "--load-data",
+            type=int,
+            default=0,
+            metavar="SCALE",
+            help="Añade datos sintéticos (generate_load_data --scale SCALE)",
+        )
+        parser.add_argument("--iterations", type=int, default=10)
+        parser.add_argument("--output", help="Guarda el resultado en este JSON")
+        parser.add_argument(
+            "--keepdb",
+            action="store_true",
+            help="Reutiliza la BD de prueba (y sus datos) entre ejecuciones",
+        )
+
+    def handle(self, *args, **opts):
+        setup_test_environment()
+        old_name = connection.creation.create_test_db(
+            verbosity=0, autoclobber=True, serialize=False, keepdb=opts["keepdb"]
+        )
+        try:
+            created = benchmark.prepare_dataset(opts["scale"])
+            if opts["load_data"]:
+                volumes = loadgen.Volumes().scaled(opts["load_data"])
+                created.update(loadgen.generate(volumes))
+            for label, count in created.items():
+                self.stdout.write(f"{label}: +{count} filas")
+            result = benchmark.run(
+                iterations=opts["iterations"],
+                only=set(opts["routes"]),
+                scale=opts["scale"],
+                stdout=self.stdout,
+            )
+        finally:
+            connection.creation.destroy_test_db(
+                old_name, verbosity=0, keepdb=opts["keepdb"]
+            )
+            teardown_test_environment()
+
+        if opts["output"]:
+            benchmark.save(opts["output"], result)
+            self.stdout.write(self.style.SUCCESS(f"Guardado en {opts['output']}"))
@@ -0,0 +1,39 @@
+# core/management/commands/benchmark_compare.py
+from django.core.management.base import BaseCommand, CommandError
+
+from core import benchmark
+
+
+class Command(BaseCommand):
+    help = "Compara dos JSON de `manage.py benchmark` y falla si alguna ruta empeora"
+
+    def add_arguments(self, parser):
+        parser.add_argument("baseline")
+        parser.add_argument("current")
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.2,
+            help="Empeoramiento tolerado (0.2 = 20%%) en p95, consultas en frío y bytes",
+        )
+        parser.add_argument(
+            "--min-ms",
+            type=float,
+            default=5.0,
+            help="Diferencia mínima de p95 para contar como regresión (ruido)",
+        )
+
+    def handle(self, *args, **opts):
+        baseline = benchmark.load(opts["baseline"])
+        current = benchmark.load(opts["current"])
+        for name, row in sorted(current["routes"].items()):
+            self.stdout.write(benchmark.format_row(name, row))
+
+        problems = benchmark.compare(
+            baseline, current, threshold=opts["threshold"], min_ms=opts["min_ms"]
+        )
+        if problems:
+            for problem in problems:
+                self.stderr.write(problem)
+            raise CommandError(f"{len(problems)} regresiones frente a la línea base")
+        self.stdout.write(self.style.SUCCESS("Sin regresiones"))
@@ -0,0 +1,60 @@
+# core/management/commands/benchmark_server.py
+from datetime import UTC, datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core import benchmark, serverbench
+
+
+class Command(BaseCommand):
+    help = (
+        "Compara los perfiles de gunicorn.conf.py (rps, p50/p95, arranque y "
+        "memoria) contra la BD configurada (core/serverbench.py)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "paths", nargs="*", help="Rutas a pedir (por defecto, las públicas)"
+        )
+        parser.add_argument(
+            "--profiles", nargs="+", default=["sync", "gthread", "asgi"]
+        )
+        parser.add_argument("--requests", type=int, default=500)
+        parser.add_argument("--concurrency", type=int, default=8)
+        parser.add_argument(
+            "--workers", type=int, help="WEB_CONCURRENCY igual para todos"
+        )
+        parser.add_argument("--output", help="Guarda el resultado en este JSON")
+
+    def handle(self, *args, **opts):
+        paths = opts["paths"] or serverbench.default_paths()
+        if not paths:
+            raise CommandError("No hay rutas que pedir")
+        results = {}
+        for profile in opts["profiles"]:
+            try:
+                results[profile] = serverbench.run_profile(
+                    profile,
+                    paths,
+                    requests=opts["requests"],
+                    concurrency=opts["concurrency"],
+                    workers=opts["workers"],
+                )
+            except RuntimeError as exc:
+                raise CommandError(f"{profile}: {exc}") from exc
+            self.stdout.write(serverbench.format_row(profile, results[profile]))
+
+        if opts["output"]:
+            benchmark.save(
+                opts["output"],
+                {
+                    "meta": {
+                        "created": datetime.now(UTC).isoformat(timespec="seconds"),
+                        "paths": paths,
+                        "requests": opts["requests"],
+                        "concurrency": opts["concurrency"],
+                    },
+                    "profiles": results,
+                },
+            )
+            self.stdout.write(self.style.SUCCESS(f"Guardado en {opts['output']}"))
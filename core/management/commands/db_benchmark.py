@@ -0,0 +1,90 @@
+# core/management/commands/db_benchmark.py
+import statistics
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+def _ms(samples):
+    samples = sorted(samples)
+    p95 = samples[min(len(samples) - 1, int(len(samples) * 0.95))]
+    return f"p50 {statistics.median(samples):7.2f} ms · p95 {p95:7.2f} ms"
+
+
+class Command(BaseCommand):
+    help = (
+        "Mide cuánto cuesta abrir una conexión a la BD frente a reutilizarla "
+        "(CONN_MAX_AGE) o sacarla del pool (DB_POOL)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--iterations", type=int, default=30)
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, **opts):
+        connection = connections[opts["database"]]
+        n = opts["iterations"]
+        settings_dict = connection.settings_dict
+        self.stdout.write(
+            f"{connection.vendor} · CONN_MAX_AGE={settings_dict['CONN_MAX_AGE']} · "
+            f"CONN_HEALTH_CHECKS={settings_dict['CONN_HEALTH_CHECKS']} · "
+            f"pool={'sí' if settings_dict['OPTIONS'].get('pool') else 'no'}"
+        )
+
+        # 1) Conexión nueva por petición (sin CONN_MAX_AGE ni pool)
+        params = connection.get_connection_params()
+        fresh = []
+        for _ in range(n):
+            start = time.perf_counter()
+            raw = connection.Database.connect(**params)
+            cur = raw.cursor()
+            cur.execute("SELECT 1")
+            cur.fetchone()
+            fresh.append((time.perf_counter() - start) * 1000)
+            raw.close()
+
+        # 2) Conexión persistente: solo la consulta (y el health check, si lo hay).
+        # Con CONN_MAX_AGE=0 (sin persistencia, o modo pool) no hay reutilización
+        # entre peticiones: close_if_unusable_or_obsolete cerraría la conexión en
+        # cada vuelta y se mediría otra cosa
+        persistent = settings_dict["CONN_MAX_AGE"] != 0
+        reused = []
+        if persistent:
+            connection.ensure_connection()
+            for _ in range(n):
+                start = time.perf_counter()
+                connection.close_if_unusable_or_obsolete()
+                connection.health_check_done = False
+                with connection.cursor() as cur:
+                    cur.execute("SELECT 1")
+                    cur.fetchone()
+                reused.append((time.perf_counter() - start) * 1000)
+
+        self.stdout.write(f"Conexión nueva:       {_ms(fresh)}")
+        if persistent:
+            self.stdout.write(f"Conexión reutilizada: {_ms(reused)}")
+        else:
+            self.stdout.write(
+                "Conexión reutilizada: — (CONN_MAX_AGE=0, no se reutiliza)"
+            )
+
+        # 3) Pool: devolver y volver a pedir la conexión en cada iteración
+        pooled = []
+        if getattr(connection, "pool", None) is not None:
+            for _ in range(n):
+                connection.close()
+                start = time.perf_counter()
+                with connection.cursor() as cur:
+                    cur.execute("SELECT 1")
+                    cur.fetchone()
+                pooled.append((time.perf_counter() - start) * 1000)
+            self.stdout.write(f"Conexión del pool:    {_ms(pooled)}")
+
+        best = reused or pooled
+        if best:
+            saved = statistics.median(fresh) - statistics.median(best)
+            how = "reutilizar" if reused else "usar el pool"
+            self.stdout.write(
+                self.style.SUCCESS(f"Ahorro por petición al {how}: {saved:.2f} ms")
+            )
@@ -0,0 +1,60 @@
+# core/management/commands/generate_load_data.py
+from dataclasses import fields
+
+from django.core.management.base import BaseCommand
+
+from core import loadgen
+
+
+class Command(BaseCommand):
+    help = (
+        "Genera datos sintéticos en volumen (posts, productos, galerías, estancias, "
+        "visitas, donaciones) con bulk_create por bloques (core/loadgen.py)"
+    )
+
+    def add_arguments(self, parser):
+        defaults = loadgen.Volumes()
+        for f in fields(loadgen.Volumes):
+            parser.add_argument(
+                f"--{f.name.replace('_', '-')}",
+                type=int,
+                default=None,
+                help=f"Por defecto {getattr(defaults, f.name)} (× --scale)",
+            )
+        parser.add_argument(
+            "--scale",
+            type=int,
+            default=1,
+            help="Multiplica los volúmenes por defecto de las filas raíz",
+        )
+        parser.add_argument("--chunk-size", type=int, default=loadgen.CHUNK_SIZE)
+        parser.add_argument(
+            "--seed", type=int, default=0, help="Semilla del generador aleatorio"
+        )
+        parser.add_argument(
+            "--purge",
+            action="store_true",
+            help="Borra lo generado en corridas anteriores y no genera nada",
+        )
+
+    def handle(self, *args, **opts):
+        if opts["purge"]:
+            deleted = loadgen.purge()
+            for label, n in sorted(deleted.items()):
+                self.stdout.write(f"{label}: -{n}")
+            return
+
+        volumes = loadgen.Volumes().scaled(opts["scale"])
+        for f in fields(volumes):
+            if opts[f.name] is not None:
+                setattr(volumes, f.name, opts[f.name])
+
+        counts = loadgen.generate(
+            volumes,
+            chunk_size=opts["chunk_size"],
+            seed=opts["seed"],
+            stdout=self.stdout if opts["verbosity"] > 1 else None,
+        )
+        for label, n in sorted(counts.items()):
+            self.stdout.write(f"{label}: +{n}")
+        self.stdout.write(self.style.SUCCESS(f"{sum(counts.values())} filas creadas"))
@@ -0,0 +1,84 @@
+# core/management/commands/generate_thumbnails.py
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from django.apps import apps
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import ImageField
+
+from core import thumbnails
+
+
+def _image_names():
+    """Nombres distintos de todas las ImageField con archivo en disco."""
+    names = set()
+    for model in apps.get_models():
+        for field in model._meta.fields:
+            if isinstance(field, ImageField):
+                names.update(
+                    model._default_manager.exclude(**{field.name: ""})
+                    .exclude(**{f"{field.name}__isnull": True})
+                    .values_list(field.name, flat=True)
+                    .distinct()
+                )
+    return sorted(n for n in names if default_storage.exists(n))
+
+
+class Command(BaseCommand):
+    help = "Genera los derivados (srcset AVIF/WebP/JPEG) de todas las ImageField"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers", type=int, default=os.cpu_count() or 1, help="Procesos"
+        )
+        parser.add_argument(
+            "--presets",
+            nargs="+",
+            default=list(thumbnails.PRESETS),
+            help="Presets a generar (por defecto todos)",
+        )
+        parser.add_argument(
+            "--force", action="store_true", help="Regenera aunque ya existan"
+        )
+
+    def handle(self, *args, **opts):
+        unknown = set(opts["presets"]) - set(thumbnails.PRESETS)
+        if unknown:
+            raise CommandError(f"Presets desconocidos: {', '.join(sorted(unknown))}")
+        widths = sorted({w for p in opts["presets"] for w in thumbnails.PRESETS[p]})
+
+        jobs = []
+        for name in _image_names():
+            for fmt in thumbnails.formats_for(name):
+                for width in widths:
+                    dst = thumbnails.derivative_name(name, width, fmt)
+                    if opts["force"] or not default_storage.exists(dst):
+                        jobs.append(
+                            (
+                                default_storage.path(name),
+                                default_storage.path(dst),
+                                width,
+                                fmt,
+                            )
+                        )
+
+        if not jobs:
+            self.stdout.write(self.style.SUCCESS("Miniaturas al día"))
+            return
+
+        errors = 0
+        with ProcessPoolExecutor(max_workers=max(1, opts["workers"])) as pool:
+            futures = {pool.submit(thumbnails.render_file, *job): job for job in jobs}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    errors += 1
+                    self.stderr.write(f"[thumbs] {futures[future][0]}: {e}")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Generadas {len(jobs) - errors} miniaturas ({errors} errores)"
+            )
+        )
@@ -15,6 +15,18 @@ python manage.py load_seed_media
 
 echo "--- ✅ Media Initialization Complete ---"
 
+# 2a. Shared cache table (CACHES in settings: DatabaseCache)
+echo "Step 2a: Creating cache table..."
+python manage.py createcachetable
+
+# 2b. Load versioned seed data (fixtures) not loaded yet
+echo "Step 2b: Loading seed data..."
+python manage.py seed --parallel
+
+# 2c. Backfill the search index for content created before it existed
+echo "Step 2c: Building search index (if empty)..."
+python manage.py rebuild_search_index --if-empty
+
 # 3. Create Superuser (Idempotent)
 echo "Step 3: Checking for Admin User..."
 python manage.py shell <<EOF
@@ -36,6 +48,6 @@ else:
     print(f"--- 👤 Superuser '{username}' already exists ---")
 EOF
 
-# 4. Start Gunicorn
+# 4. Start Gunicorn (perfil según GUNICORN_PROFILE / ASGI_MODE: gunicorn.conf.py)
 echo "Step 4: Launching Gunicorn..."
-exec gunicorn chambalabamba.wsgi:application --bind 0.0.0.0:$PORT --workers 2 --timeout 120
+exec gunicorn -c gunicorn.conf.py
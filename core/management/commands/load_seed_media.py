@@ -1,14 +1,37 @@
 # core/management/commands/load_seed_media.py
 from django.core.management.base import BaseCommand
-from core.utils.seed_media import copy_seed_media
+from django.template.defaultfilters import filesizeformat
+
+from core.utils.seed_media import sync_seed_media
 
 
 class Command(BaseCommand):
-    help = "Copia imágenes semilla hacia MEDIA_ROOT"
+    help = "Sincroniza las imágenes semilla hacia MEDIA_ROOT (core/utils/seed_media.py)"
 
     def add_arguments(self, parser):
-        parser.add_argument("--force", action="store_true")
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Pisa también destinos que no escribió la sincronización",
+        )
+        parser.add_argument("--workers", type=int, default=8)
+        parser.add_argument(
+            "--no-link",
+            action="store_true",
+            help="Copia siempre (sin reflink/hardlink)",
+        )
 
     def handle(self, *args, **opts):
-        n = copy_seed_media(force=opts["force"])
-        self.stdout.write(self.style.SUCCESS(f"Copiados {n} archivos"))
+        report = sync_seed_media(
+            force=opts["force"], workers=opts["workers"], link=not opts["no_link"]
+        )
+        for error in report.errors:
+            self.stderr.write(error)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Copiados {report.copied} · enlazados {report.linked} · "
+                f"sin cambios {report.skipped} · respetados {report.kept} "
+                f"({filesizeformat(report.bytes_written)} escritos, "
+                f"{filesizeformat(report.bytes_saved)} ahorrados)"
+            )
+        )
@@ -0,0 +1,34 @@
+# core/management/commands/rebuild_search_index.py
+from django.core.management.base import BaseCommand
+
+from core import search
+from core.models import SearchDocument
+
+
+class Command(BaseCommand):
+    help = (
+        "Reconstruye el índice de búsqueda (SearchDocument) de los modelos registrados"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--if-empty",
+            action="store_true",
+            help=(
+                "Solo los modelos con filas pero sin ningún documento (backfill "
+                "idempotente para cada despliegue; init_app.sh)"
+            ),
+        )
+
+    def handle(self, *args, **opts):
+        for model in search.registered_models():
+            label = model._meta.label
+            if opts["if_empty"]:
+                if SearchDocument.objects.filter(label=label.lower()).exists():
+                    self.stdout.write(f"{label}: índice ya poblado, se omite")
+                    continue
+                if not model._default_manager.exists():
+                    self.stdout.write(f"{label}: sin filas, se omite")
+                    continue
+            n = search.rebuild(model)
+            self.stdout.write(self.style.SUCCESS(f"{label}: {n} documentos indexados"))
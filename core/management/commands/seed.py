@@ -0,0 +1,52 @@
+# core/management/commands/seed.py
+from django.core.management.base import BaseCommand, CommandError
+
+from core import seeding
+
+
+class Command(BaseCommand):
+    help = "Carga los datos semilla versionados que falten (core.seeding)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "names", nargs="*", help="Conjuntos a cargar (y sus dependencias)"
+        )
+        parser.add_argument(
+            "--parallel",
+            action="store_true",
+            help="Carga a la vez los conjuntos independientes (no en SQLite)",
+        )
+        parser.add_argument("--workers", type=int, default=4)
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Recarga los conjuntos indicados aunque ya estén en seed_run",
+        )
+        parser.add_argument(
+            "--list", action="store_true", help="Muestra los conjuntos y su estado"
+        )
+
+    def handle(self, *args, **opts):
+        if opts["list"]:
+            applied = seeding.applied_tags()
+            for seed_set in seeding.registered_seeds():
+                mark = "✔" if seed_set.tag in applied else "·"
+                deps = f" ← {', '.join(seed_set.depends)}" if seed_set.depends else ""
+                self.stdout.write(f"{mark} {seed_set.tag}{deps}")
+            return
+
+        try:
+            results = seeding.run(
+                opts["names"] or None,
+                parallel=opts["parallel"],
+                force=opts["force"],
+                workers=opts["workers"],
+            )
+        except LookupError as exc:
+            raise CommandError(exc)
+        for name, count in results.items():
+            if count is None:
+                if opts["verbosity"] > 1:
+                    self.stdout.write(f"{name}: ya cargado")
+            else:
+                self.stdout.write(self.style.SUCCESS(f"{name}: {count} objetos"))
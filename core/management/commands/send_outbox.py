@@ -0,0 +1,32 @@
+# core/management/commands/send_outbox.py
+import time
+
+from django.core.management.base import BaseCommand
+
+from core import outbox
+
+
+class Command(BaseCommand):
+    help = "Entrega los correos de la bandeja de salida (core.outbox)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="No termina: vuelve a mirar la cola cada --sleep segundos",
+        )
+        parser.add_argument("--sleep", type=float, default=10)
+        parser.add_argument("--batch-size", type=int, default=None)
+        parser.add_argument("--max-attempts", type=int, default=None)
+
+    def handle(self, *args, **opts):
+        try:
+            while True:
+                sent, failed = outbox.drain(opts["batch_size"], opts["max_attempts"])
+                if sent or failed or opts["verbosity"] > 1:
+                    self.stdout.write(f"Enviados: {sent} · Fallidos: {failed}")
+                if not opts["loop"]:
+                    return
+                time.sleep(opts["sleep"])
+        except KeyboardInterrupt:
+            self.stdout.write("Interrumpido")
@@ -0,0 +1,39 @@
+# core/management/commands/warmup.py
+from django.core.management.base import BaseCommand
+
+from core import warmup
+
+
+class Command(BaseCommand):
+    help = (
+        "Precompila las plantillas, puebla el resolver de URLs y, opcionalmente, "
+        "llena las cachés de footer/sidebar/cabeceras y de página (core/warmup.py)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--caches",
+            action="store_true",
+            help="Llena footer, sidebar del blog y cabeceras de sección",
+        )
+        parser.add_argument(
+            "--pages",
+            action="store_true",
+            help="Pide las páginas públicas para llenar la caché de página",
+        )
+        parser.add_argument(
+            "--host", help="Host de las peticiones de --pages (WARMUP_HOST)"
+        )
+
+    def handle(self, *args, **opts):
+        stats = warmup.run(caches=opts["caches"])
+        self.stdout.write(
+            f"Plantillas: {stats['templates']} compiladas, "
+            f"{stats['template_errors']} con errores"
+        )
+        self.stdout.write(f"URLs: {stats['urls']} reverse() resueltos")
+        if opts["caches"]:
+            self.stdout.write(f"Cachés: {', '.join(stats['caches'])}")
+        if opts["pages"]:
+            self.stdout.write(f"Páginas: {warmup.prime_pages(opts['host'])} con 200")
+        self.stdout.write(self.style.SUCCESS(f"Warmup en {stats['seconds']} s"))
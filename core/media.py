@@ -0,0 +1,166 @@
+# core/media.py
+"""
+Servido de MEDIA_ROOT en producción (sustituye a django.views.static.serve).
+
+Según settings.MEDIA_SERVE_MODE:
+
+  * "x-accel"    → nginx: respuesta vacía con X-Accel-Redirect hacia
+                   MEDIA_ACCEL_PREFIX (location `internal` que apunta a MEDIA_ROOT).
+  * "x-sendfile" → Apache/lighttpd: cabecera X-Sendfile con la ruta absoluta.
+  * "django"     → sin proxy: FileResponse; gunicorn lo envía con os.sendfile()
+                   (wsgi.file_wrapper) sin pasar los bytes por Python.
+
+En todos los modos: ETag/Last-Modified con respuestas 304, Range (un solo rango,
+206/416, If-Range) y Cache-Control con MEDIA_CACHE_MAX_AGE. Nada es `immutable`:
+ni la subida (django_cleanup borra el archivo viejo y el nuevo puede reutilizar el
+nombre) ni las miniaturas (core/thumbnails.py, nombre según el original) llevan
+hash de contenido; la revalidación con ETag es barata.
+"""
+
+import mimetypes
+import os
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import FileResponse, Http404, HttpResponse, HttpResponseNotModified
+from django.utils._os import safe_join
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from django.views.decorators.http import require_safe
+
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def _mode():
+    return getattr(settings, "MEDIA_SERVE_MODE", "django")
+
+
+def _cache_control():
+    return f"public, max-age={getattr(settings, 'MEDIA_CACHE_MAX_AGE', 60 * 60 * 24)}"
+
+
+def parse_range(header, size):
+    """(inicio, fin) inclusivo para `bytes=a-b`; None si no aplica, False si inválido."""
+    m = _RANGE_RE.match(header.strip()) if header else None
+    if not m or m.groups() == ("", ""):
+        return None  # sin Range, multi-rango o sintaxis no soportada → 200 completo
+    start, end = m.groups()
+    if start == "":  # sufijo: últimos N bytes
+        length = int(end)
+        if length == 0:
+            return False
+        return max(size - length, 0), size - 1
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+    if start >= size or start > end:
+        return False
+    return start, end
+
+
+class _FileRange:
+    """
+    Vista acotada de un archivo para respuestas 206. Expone fileno() para que
+    gunicorn use sendfile desde la posición actual (limitado por Content-Length);
+    sin file_wrapper, read() nunca pasa del final del rango.
+    """
+
+    def __init__(self, fh, start, length):
+        fh.seek(start)
+        self.fh = fh
+        self.remaining = length
+
+    def read(self, size=-1):
+        if self.remaining <= 0:
+            return b""
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.fh.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def fileno(self):
+        return self.fh.fileno()
+
+    def close(self):
+        self.fh.close()
+
+
+@require_safe
+def serve_media(request, path):
+    try:
+        fullpath = safe_join(settings.MEDIA_ROOT, path)
+    except SuspiciousFileOperation:
+        raise Http404("Archivo no encontrado")
+    try:
+        st = os.stat(fullpath)
+    except OSError:
+        raise Http404("Archivo no encontrado")
+    if not os.path.isfile(fullpath):
+        raise Http404("Archivo no encontrado")
+
+    etag = quote_etag(f"{st.st_mtime_ns:x}-{st.st_size:x}")
+    last_modified = int(st.st_mtime)
+    headers = {
+        "ETag": etag,
+        "Last-Modified": http_date(last_modified),
+        "Cache-Control": _cache_control(),
+        "Accept-Ranges": "bytes",
+    }
+
+    not_modified = get_conditional_response(
+        request, etag=etag, last_modified=last_modified
+    )
+    if not_modified is not None:
+        if isinstance(not_modified, HttpResponseNotModified):
+            for k in ("ETag", "Last-Modified", "Cache-Control"):
+                not_modified.headers[k] = headers[k]
+        return not_modified
+
+    content_type, encoding = mimetypes.guess_type(fullpath)
+    content_type = content_type or "application/octet-stream"
+
+    # Delegar al proxy: él se encarga de Range y del envío
+    mode = _mode()
+    if mode in ("x-accel", "x-sendfile"):
+        response = HttpResponse(content_type=content_type, headers=headers)
+        if mode == "x-accel":
+            prefix = getattr(settings, "MEDIA_ACCEL_PREFIX", "/protected-media/")
+            response["X-Accel-Redirect"] = prefix.rstrip("/") + "/" + quote(path)
+        else:
+            response["X-Sendfile"] = fullpath
+        return response
+
+    # Range (If-Range: solo si el validador sigue vigente)
+    byte_range = None
+    if_range = request.headers.get("If-Range")
+    if if_range is None or if_range == etag:
+        byte_range = parse_range(request.headers.get("Range"), st.st_size)
+    if byte_range is False:
+        response = HttpResponse(status=416, headers=headers)
+        response["Content-Range"] = f"bytes */{st.st_size}"
+        return response
+
+    if request.method == "HEAD":
+        response = HttpResponse(content_type=content_type, headers=headers)
+        response["Content-Length"] = st.st_size
+        return response
+
+    fh = open(fullpath, "rb")
+    if byte_range:
+        start, end = byte_range
+        length = end - start + 1
+        response = FileResponse(
+            _FileRange(fh, start, length), status=206, content_type=content_type
+        )
+        response["Content-Range"] = f"bytes {start}-{end}/{st.st_size}"
+    else:
+        length = st.st_size
+        response = FileResponse(fh, content_type=content_type)
+    for k, v in headers.items():
+        response[k] = v
+    response["Content-Length"] = length
+    if encoding:
+        response["Content-Encoding"] = encoding
+    return response
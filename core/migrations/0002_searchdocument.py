@@ -0,0 +1,73 @@
+# Generated by Django 5.2.3 on 2026-10-18 16:27
+
+import django.contrib.postgres.search
+from django.db import migrations, models
+from django.db.utils import OperationalError
+
+
+def create_search_index(apps, schema_editor):
+    conn = schema_editor.connection
+    if conn.vendor == "postgresql":
+        schema_editor.execute(
+            "CREATE INDEX IF NOT EXISTS core_searchdocument_vector_gin "
+            "ON core_searchdocument USING GIN (search_vector)"
+        )
+    elif conn.vendor == "sqlite":
+        try:
+            schema_editor.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS core_searchdocument_fts "
+                "USING fts5(title, body, tokenize='unicode61 remove_diacritics 2')"
+            )
+        except OperationalError:
+            # SQLite sin FTS5: core.search cae al backend icontains
+            pass
+
+
+def drop_search_index(apps, schema_editor):
+    conn = schema_editor.connection
+    if conn.vendor == "postgresql":
+        schema_editor.execute("DROP INDEX IF EXISTS core_searchdocument_vector_gin")
+    elif conn.vendor == "sqlite":
+        schema_editor.execute("DROP TABLE IF EXISTS core_searchdocument_fts")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="SearchDocument",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("label", models.CharField(max_length=100)),
+                ("object_id", models.PositiveBigIntegerField()),
+                ("title", models.CharField(blank=True, default="", max_length=255)),
+                ("body", models.TextField(blank=True, default="")),
+                (
+                    "search_vector",
+                    django.contrib.postgres.search.SearchVectorField(
+                        editable=False, null=True
+                    ),
+                ),
+                ("updated", models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("label", "object_id"), name="unique_search_document"
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
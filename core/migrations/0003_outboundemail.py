@@ -0,0 +1,66 @@
+# Generated by Django 5.2.3 on 2026-10-18 16:42
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("core", "0002_searchdocument"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="OutboundEmail",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("subject", models.CharField(max_length=255)),
+                ("body", models.TextField(blank=True, default="")),
+                ("html_body", models.TextField(blank=True, default="")),
+                (
+                    "from_email",
+                    models.CharField(blank=True, default="", max_length=254),
+                ),
+                ("to", models.JSONField(default=list)),
+                ("reply_to", models.JSONField(blank=True, default=list)),
+                (
+                    "status",
+                    models.CharField(
+                        choices=[
+                            ("pending", "Pendiente"),
+                            ("sent", "Enviado"),
+                            ("failed", "Fallido"),
+                        ],
+                        default="pending",
+                        max_length=10,
+                    ),
+                ),
+                ("attempts", models.PositiveSmallIntegerField(default=0)),
+                (
+                    "next_attempt_at",
+                    models.DateTimeField(default=django.utils.timezone.now),
+                ),
+                ("last_error", models.TextField(blank=True, default="")),
+                ("created", models.DateTimeField(auto_now_add=True)),
+                ("sent_at", models.DateTimeField(blank=True, null=True)),
+            ],
+            options={
+                "verbose_name": "correo saliente",
+                "verbose_name_plural": "correos salientes",
+                "ordering": ["-created"],
+                "indexes": [
+                    models.Index(
+                        fields=["status", "next_attempt_at"], name="core_outbox_due_idx"
+                    )
+                ],
+            },
+        ),
+    ]
@@ -1,5 +1,7 @@
 # core/models.py
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.utils import timezone
 
 
 class PageHeader(models.Model):
@@ -11,3 +13,68 @@ class PageHeader(models.Model):
 
     def __str__(self):
         return self.slug
+
+
+class SearchDocument(models.Model):
+    """
+    Documento de búsqueda (uno por objeto indexado). Lo mantiene core/search.py;
+    search_vector solo se usa en PostgreSQL (índice GIN creado en la migración).
+    En SQLite el texto se indexa en la tabla FTS5 core_searchdocument_fts.
+    """
+
+    label = models.CharField(max_length=100)  # ej: "blog.blogpost"
+    object_id = models.PositiveBigIntegerField()
+    title = models.CharField(max_length=255, blank=True, default="")
+    body = models.TextField(blank=True, default="")
+    search_vector = SearchVectorField(null=True, editable=False)
+    updated = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["label", "object_id"], name="unique_search_document"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.label}#{self.object_id}"
+
+
+class OutboundEmail(models.Model):
+    """
+    Correo pendiente de envío (bandeja de salida). Las vistas lo encolan con
+    core.outbox.enqueue y lo entrega el worker `manage.py send_outbox`.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = "pending", "Pendiente"
+        SENT = "sent", "Enviado"
+        FAILED = "failed", "Fallido"
+
+    subject = models.CharField(max_length=255)
+    body = models.TextField(blank=True, default="")
+    html_body = models.TextField(blank=True, default="")
+    from_email = models.CharField(max_length=254, blank=True, default="")
+    to = models.JSONField(default=list)
+    reply_to = models.JSONField(default=list, blank=True)
+    status = models.CharField(
+        max_length=10, choices=Status.choices, default=Status.PENDING
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True, default="")
+    created = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ["-created"]
+        indexes = [
+            models.Index(
+                fields=["status", "next_attempt_at"], name="core_outbox_due_idx"
+            )
+        ]
+        verbose_name = "correo saliente"
+        verbose_name_plural = "correos salientes"
+
+    def __str__(self):
+        return f"{self.subject} → {', '.join(self.to)}"
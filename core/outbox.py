@@ -0,0 +1,198 @@
+# core/outbox.py
+"""
+Bandeja de salida de correo respaldada en la BD.
+
+Las vistas no hablan con el SMTP (smtp.zoho.eu puede tardar decenas de segundos
+y bloquear un worker de gunicorn): guardan el mensaje y responden al momento.
+
+    from core import outbox
+    outbox.enqueue(asunto, texto, settings.DEFAULT_FROM_EMAIL, [destinatario])
+
+El worker lo entrega en lotes reutilizando una sola sesión SMTP por lote:
+
+    manage.py send_outbox --loop
+
+Un envío fallido se reintenta con espera exponencial (OUTBOX_RETRY_DELAY,
+doble en cada intento, hasta OUTBOX_RETRY_MAX_DELAY); tras OUTBOX_MAX_ATTEMPTS
+queda como "fallido" y se puede reintentar desde el admin.
+
+Encolado dentro de la misma transacción que lo que notifica (transaction.atomic),
+nunca se envía un correo de algo que luego se deshizo (ni se pierde uno hecho).
+"""
+
+import logging
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from .models import OutboundEmail
+
+logger = logging.getLogger("core.outbox")
+
+Status = OutboundEmail.Status
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def enqueue(
+    subject,
+    message,
+    from_email=None,
+    recipient_list=(),
+    html_message=None,
+    reply_to=None,
+):
+    """Como django.core.mail.send_mail, pero deja el correo en la bandeja de salida."""
+    return OutboundEmail.objects.create(
+        subject=subject[:255],
+        body=message or "",
+        html_body=html_message or "",
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        to=list(recipient_list),
+        reply_to=list(reply_to or []),
+    )
+
+
+def build_message(email, connection=None):
+    msg = EmailMultiAlternatives(
+        email.subject,
+        email.body,
+        email.from_email,
+        email.to,
+        reply_to=email.reply_to or None,
+        connection=connection,
+    )
+    if email.html_body:
+        msg.attach_alternative(email.html_body, "text/html")
+    return msg
+
+
+def retry_delay(attempts):
+    """Espera antes del intento siguiente al número `attempts` (1, 2, 3...)."""
+    base = _setting("OUTBOX_RETRY_DELAY", 60)
+    return timedelta(
+        seconds=min(
+            base * 2 ** (attempts - 1), _setting("OUTBOX_RETRY_MAX_DELAY", 3600)
+        )
+    )
+
+
+def claim(batch_size):
+    """
+    Reserva hasta batch_size correos vencidos. En PostgreSQL varias instancias del
+    worker no se pisan (SKIP LOCKED); la reserva dura OUTBOX_LEASE segundos, así
+    que si el worker muere a mitad de lote otro retoma los que no llegó a enviar.
+    """
+    now = timezone.now()
+    with transaction.atomic():
+        ids = list(
+            OutboundEmail.objects.filter(
+                status=Status.PENDING, next_attempt_at__lte=now
+            )
+            .order_by("next_attempt_at", "id")
+            .select_for_update(skip_locked=True)
+            .values_list("id", flat=True)[:batch_size]
+        )
+        if ids:
+            lease = timedelta(seconds=_setting("OUTBOX_LEASE", 300))
+            OutboundEmail.objects.filter(pk__in=ids).update(next_attempt_at=now + lease)
+    return list(OutboundEmail.objects.filter(pk__in=ids).order_by("id"))
+
+
+def _fail(email, error, max_attempts):
+    email.attempts += 1
+    email.last_error = f"{type(error).__name__}: {error}"[:2000]
+    if email.attempts >= max_attempts:
+        email.status = Status.FAILED
+        logger.error(
+            "Correo %s descartado tras %s intentos: %s",
+            email.pk,
+            email.attempts,
+            email.last_error,
+        )
+    else:
+        email.next_attempt_at = timezone.now() + retry_delay(email.attempts)
+        logger.warning(
+            "Correo %s falló (intento %s): %s",
+            email.pk,
+            email.attempts,
+            email.last_error,
+        )
+    email.save(update_fields=["attempts", "last_error", "status", "next_attempt_at"])
+
+
+def _sent(email):
+    OutboundEmail.objects.filter(pk=email.pk).update(
+        status=Status.SENT,
+        sent_at=timezone.now(),
+        attempts=F("attempts") + 1,
+        last_error="",
+    )
+
+
+def send_batch(batch_size=None, max_attempts=None, connection=None):
+    """
+    Envía un lote con una sola conexión del EMAIL_BACKEND. Devuelve
+    (enviados, fallidos); (0, 0) si no había nada pendiente.
+    """
+    batch_size = batch_size or _setting("OUTBOX_BATCH_SIZE", 50)
+    max_attempts = max_attempts or _setting("OUTBOX_MAX_ATTEMPTS", 6)
+    emails = claim(batch_size)
+    if not emails:
+        return 0, 0
+
+    connection = connection or get_connection(fail_silently=False)
+    try:
+        connection.open()
+    except Exception as exc:
+        # Servidor caído: todo el lote vuelve a la cola con su espera
+        for email in emails:
+            _fail(email, exc, max_attempts)
+        return 0, len(emails)
+
+    sent = failed = 0
+    try:
+        for email in emails:
+            try:
+                connection.send_messages([build_message(email, connection)])
+            except Exception as exc:
+                _fail(email, exc, max_attempts)
+                failed += 1
+                # La sesión SMTP puede haber quedado inservible: se abre otra
+                connection.close()
+                try:
+                    connection.open()
+                except Exception:
+                    pass
+            else:
+                # Al momento: si el worker muere o se pasa de OUTBOX_LEASE a mitad
+                # de lote, lo ya entregado no se vuelve a enviar
+                _sent(email)
+                sent += 1
+    finally:
+        connection.close()
+    return sent, failed
+
+
+def drain(batch_size=None, max_attempts=None, connection=None):
+    """Envía lotes hasta vaciar lo vencido. Devuelve (enviados, fallidos)."""
+    total_sent = total_failed = 0
+    while True:
+        sent, failed = send_batch(batch_size, max_attempts, connection)
+        if not sent and not failed:
+            return total_sent, total_failed
+        total_sent += sent
+        total_failed += failed
+
+
+def retry(queryset):
+    """Vuelve a poner en cola correos fallidos (acción del admin)."""
+    return queryset.exclude(status=Status.SENT).update(
+        status=Status.PENDING, attempts=0, next_attempt_at=timezone.now()
+    )
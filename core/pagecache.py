@@ -0,0 +1,162 @@
+# core/pagecache.py
+"""
+Caché de página completa para visitantes anónimos.
+
+Casi todo el tráfico público es anónimo y ve exactamente lo mismo; en lugar de
+renderizar plantillas y lanzar 15–40 consultas por visita, la respuesta entera
+se guarda en la caché y se sirve tal cual:
+
+    from core.pagecache import cache_page_anon
+
+    @cache_page_anon("eventos", "proyectos")
+    def escuela_viva(request): ...
+
+  * La clave varía por host, idioma activo (LocaleMiddleware), ruta y query string.
+  * Nunca se usa con sesión o mensajes pendientes (cookies SESSION_COOKIE_NAME /
+    "messages"; usuarios autenticados incluidos) ni para métodos distintos de
+    GET/HEAD. No se guarda una respuesta que ponga cookies o use el token CSRF.
+  * Invalidación por etiquetas (core/cache.py): "eventos" equivale a app:eventos,
+    que sube al guardar/borrar cualquier modelo de la app y cambia la clave de
+    las páginas que la declaran (más PAGE_CACHE_BASE_TAGS: cabecera, pie,
+    galerías...). También valen etiquetas completas ("section:footer"). Los
+    modelos de CACHE_TAG_IGNORE (bandeja de correo, comentarios...) no invalidan.
+  * Contra estampidas: al caducar, un solo proceso regenera (cache.add como
+    cerrojo) mientras el resto sirve la última versión (stale) o espera un poco.
+"""
+
+import hashlib
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.utils import translation
+
+from core import cache as tagcache
+
+PAGE_KEY = "pagecache:page:{base}:{gens}"
+LAST_KEY = "pagecache:last:{base}"  # última versión, aunque sea de otra generación
+LOCK_KEY = "pagecache:lock:{base}"
+
+# Cabeceras que no se guardan con la página
+_SKIP_HEADERS = {"set-cookie", "server-timing", "x-page-cache"}
+
+
+def _setting(name, default):
+    return getattr(settings, name, default)
+
+
+def page_tags(tags):
+    """Etiquetas de core/cache.py: "eventos" es la app (app:eventos)."""
+    return sorted({t if ":" in t else tagcache.app_tag(t) for t in tags})
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Peticiones
+# ──────────────────────────────────────────────────────────────────────────────
+def is_cacheable_request(request):
+    if request.method not in ("GET", "HEAD"):
+        return False
+    cookies = request.COOKIES
+    return settings.SESSION_COOKIE_NAME not in cookies and "messages" not in cookies
+
+
+def is_cacheable_response(request, response):
+    return (
+        response.status_code == 200
+        and not response.streaming
+        and not response.cookies
+        and not request.META.get("CSRF_COOKIE_NEEDS_UPDATE")
+        and "private" not in response.get("Cache-Control", "")
+        and "no-store" not in response.get("Cache-Control", "")
+    )
+
+
+def base_key(request):
+    raw = "|".join(
+        (
+            request.get_host(),
+            translation.get_language() or "",
+            request.path,
+            "&".join(sorted(request.GET.urlencode().split("&"))),
+        )
+    )
+    return hashlib.md5(raw.encode(), usedforsecurity=False).hexdigest()
+
+
+def _freeze(response):
+    headers = [(k, v) for k, v in response.items() if k.lower() not in _SKIP_HEADERS]
+    return response.status_code, headers, response.content
+
+
+def _thaw(entry, state):
+    status, headers, content = entry
+    response = HttpResponse(content, status=status)
+    for k, v in headers:
+        response[k] = v
+    response["X-Page-Cache"] = state
+    return response
+
+
+def cache_page_anon(*tags, timeout=None):
+    """Cachea la vista para anónimos; `tags` = apps cuyos modelos lee la página."""
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if not _setting("PAGE_CACHE_ENABLED", True) or not is_cacheable_request(
+                request
+            ):
+                return view(request, *args, **kwargs)
+
+            all_tags = page_tags([*_setting("PAGE_CACHE_BASE_TAGS", ()), *tags])
+            gens, changed = tagcache.snapshot(all_tags)
+            base = base_key(request)
+            key = PAGE_KEY.format(base=base, gens="-".join(map(str, gens)))
+
+            entry = cache.get(key)
+            if entry is not None:
+                return _thaw(entry, "hit")
+
+            lock = LOCK_KEY.format(base=base)
+            if not cache.add(lock, 1, timeout=_setting("PAGE_CACHE_LOCK_TIMEOUT", 10)):
+                # Otro proceso la está generando
+                stale = cache.get(LAST_KEY.format(base=base))
+                if stale is not None:
+                    return _thaw(stale, "stale")
+                deadline = time.monotonic() + _setting("PAGE_CACHE_LOCK_WAIT", 2)
+                while time.monotonic() < deadline:
+                    time.sleep(0.05)
+                    entry = cache.get(key)
+                    if entry is not None:
+                        return _thaw(entry, "hit")
+                return view(request, *args, **kwargs)
+
+            try:
+                response = view(request, *args, **kwargs)
+                if hasattr(response, "render") and callable(response.render):
+                    response = response.render()
+                if is_cacheable_response(request, response):
+                    ttl = timeout or _setting("PAGE_CACHE_TIMEOUT", 600)
+                    # Justo tras un cambio otros workers pueden tener todavía
+                    # singletons viejos en memoria: esa versión dura poco
+                    recent = _setting("SINGLETON_LOCAL_TTL", 5)
+                    if time.time() - changed < recent:
+                        ttl = min(ttl, recent)
+                    entry = _freeze(response)
+                    cache.set(key, entry, timeout=ttl)
+                    cache.set(
+                        LAST_KEY.format(base=base),
+                        entry,
+                        timeout=_setting("PAGE_CACHE_STALE_TIMEOUT", 60 * 60 * 24),
+                    )
+                    response["X-Page-Cache"] = "miss"
+                return response
+            finally:
+                cache.delete(lock)
+
+        wrapper.page_cache_tags = tags
+        return wrapper
+
+    return decorator
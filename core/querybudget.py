@@ -0,0 +1,219 @@
+# core/querybudget.py
+"""
+Presupuesto de consultas por petición y detector de N+1.
+
+QueryBudgetMiddleware registra, para cada petición:
+
+  * número de consultas y tiempo total en BD (todas las conexiones);
+  * "huellas" de consultas repetidas (mismo SQL con distintos parámetros: N+1);
+  * con QUERY_BUDGET_TEMPLATE_TAGS, tiempo de cada templatetag simple/inclusion
+    (gallery_headers, products_tabs...); CoreConfig.ready instala la medición una
+    vez por proceso.
+
+Con SERVER_TIMING=True lo expone en la cabecera `Server-Timing` (visible en las
+DevTools del navegador). Si la petición supera su presupuesto se registra un
+warning en el logger "core.querybudget"; con QUERY_BUDGET_RAISE=True (lo activa
+core/test_runner.py en `manage.py test`) una vista que excede el presupuesto que
+declaró lanza QueryBudgetExceeded.
+
+    from core.querybudget import query_budget
+
+    @query_budget(queries=15, time_ms=200)
+    def home(request): ...
+"""
+
+import contextvars
+import logging
+import re
+import time
+from collections import Counter
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.template import library
+
+logger = logging.getLogger("core.querybudget")
+
+_current = contextvars.ContextVar("query_budget_recorder", default=None)
+
+_IN_LIST_RE = re.compile(r"\(\s*%s(?:\s*,\s*%s)+\s*\)")
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+def query_budget(queries=None, time_ms=None):
+    """Declara el presupuesto de una vista (consultas y/o ms de BD)."""
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            return view(*args, **kwargs)
+
+        wrapper.query_budget = {"queries": queries, "time_ms": time_ms}
+        return wrapper
+
+    return decorator
+
+
+def fingerprint(sql):
+    # Mismo SQL con distinto número de elementos en IN (...) cuenta como igual
+    return _IN_LIST_RE.sub("(...)", sql)
+
+
+class Recorder:
+    def __init__(self):
+        self.count = 0
+        self.db_time = 0.0
+        self.fingerprints = Counter()
+        self.tags = Counter()
+
+    # connection.execute_wrapper
+    def __call__(self, execute, sql, params, many, context):
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - start
+            self.count += 1
+            self.fingerprints[fingerprint(sql)] += 1
+
+    def duplicates(self):
+        threshold = getattr(settings, "QUERY_BUDGET_DUPLICATES", 3)
+        return [
+            (sql, n) for sql, n in self.fingerprints.most_common() if n >= threshold
+        ]
+
+    def server_timing(self, total):
+        parts = [
+            f'db;dur={self.db_time * 1000:.1f};desc="{self.count} queries"',
+            f'dup;desc="{len(self.duplicates())} repeated"',
+        ]
+        for tag, seconds in self.tags.most_common(10):
+            parts.append(f"tag-{tag};dur={seconds * 1000:.1f}")
+        parts.append(f"total;dur={total * 1000:.1f}")
+        return ", ".join(parts)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Tiempos de templatetags (simple_tag / inclusion_tag)
+# ──────────────────────────────────────────────────────────────────────────────
+def _timed_render(render):
+    @wraps(render)
+    def wrapper(self, context):
+        recorder = _current.get()
+        if recorder is None:
+            return render(self, context)
+        start = time.perf_counter()
+        try:
+            return render(self, context)
+        finally:
+            recorder.tags[self.func.__name__] += time.perf_counter() - start
+
+    wrapper._query_budget_timed = True
+    return wrapper
+
+
+def instrument_template_tags():
+    """Mide el render de simple_tag/inclusion_tag (todas las librerías del proceso)."""
+    for node in (library.SimpleNode, library.InclusionNode):
+        if not getattr(node.render, "_query_budget_timed", False):
+            node.render = _timed_render(node.render)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Middleware
+# ──────────────────────────────────────────────────────────────────────────────
+def _record(execute, sql, params, many, context):
+    # Instalado en todas las conexiones: cuenta para la petición en curso (si la
+    # hay). Va por contextvar y no por connection.execute_wrapper() en la vista
+    # porque en ASGI el ORM corre en otro hilo (sync_to_async), con su conexión.
+    recorder = _current.get()
+    if recorder is None:
+        return execute(sql, params, many, context)
+    return recorder(execute, sql, params, many, context)
+
+
+def _install(connection, **kwargs):
+    if _record not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_record)
+
+
+class QueryBudgetMiddleware:
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+        connection_created.connect(_install, dispatch_uid="query_budget_install")
+        for conn in connections.all(initialized_only=True):
+            _install(conn)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        recorder = Recorder()
+        token = _current.set(recorder)
+        start = time.perf_counter()
+        try:
+            request._query_recorder = recorder
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self._finish(request, response, recorder, start)
+
+    async def __acall__(self, request):
+        recorder = Recorder()
+        token = _current.set(recorder)
+        start = time.perf_counter()
+        try:
+            request._query_recorder = recorder
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self._finish(request, response, recorder, start)
+
+    def _finish(self, request, response, recorder, start):
+        total = time.perf_counter() - start
+        if getattr(settings, "SERVER_TIMING", settings.DEBUG):
+            response["Server-Timing"] = recorder.server_timing(total)
+        self._check(request, recorder)
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        request._query_budget = getattr(view_func, "query_budget", None)
+
+    def _check(self, request, recorder):
+        declared = getattr(request, "_query_budget", None)
+        budget = declared or {
+            "queries": getattr(settings, "QUERY_BUDGET_QUERIES", 50),
+            "time_ms": getattr(settings, "QUERY_BUDGET_TIME_MS", 500),
+        }
+        problems = []
+        if budget["queries"] is not None and recorder.count > budget["queries"]:
+            problems.append(f"{recorder.count} consultas (máx. {budget['queries']})")
+        db_ms = recorder.db_time * 1000
+        if budget["time_ms"] is not None and db_ms > budget["time_ms"]:
+            problems.append(f"{db_ms:.0f} ms en BD (máx. {budget['time_ms']})")
+
+        dups = recorder.duplicates()
+        if dups:
+            logger.info(
+                "%s: consultas repetidas (posible N+1): %s",
+                request.path,
+                "; ".join(f"{n}× {sql[:120]}" for sql, n in dups[:5]),
+            )
+        if not problems:
+            return
+
+        message = f"{request.path} excede su presupuesto: {', '.join(problems)}"
+        if declared and getattr(settings, "QUERY_BUDGET_RAISE", False):
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
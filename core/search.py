@@ -0,0 +1,399 @@
+# core/search.py
+"""
+Búsqueda de texto completo para el blog y la tienda.
+
+Cada modelo registrado mantiene un SearchDocument por objeto (título + cuerpo en
+texto plano), actualizado por señales al guardar/borrar. El motor depende de la BD:
+
+  * PostgreSQL: columna tsvector (pesos A/B) con índice GIN, ts_rank + ts_headline.
+  * SQLite: tabla virtual FTS5 (core_searchdocument_fts) con bm25 + snippet().
+  * Otro motor (o FTS5 no disponible): icontains sobre SearchDocument.
+
+Uso:
+    from core import search
+    search.register(BlogPost)          # en AppConfig.ready(); el modelo define
+                                       # search_document() -> (titulo, cuerpo) | None
+    page = search.search_page(qs, q, page=request.GET.get("page"), per_page=10)
+    # page.object_list: instancias de qs con .search_rank y .search_snippet
+"""
+
+import html
+import logging
+import re
+
+from django.conf import settings
+from django.core.paginator import Paginator
+from django.db import connection, transaction
+from django.db.models import F, Q
+from django.db.models.signals import post_delete, post_save
+from django.db.utils import DatabaseError
+from django.utils.html import escape, strip_tags
+from django.utils.safestring import mark_safe
+
+logger = logging.getLogger("core.search")
+
+FTS_TABLE = "core_searchdocument_fts"
+
+# Marcadores internos para el resaltado: se escapa el snippet y luego se
+# reemplazan por <mark>, así el contenido indexado nunca llega crudo al HTML.
+_START, _STOP = "\x02", "\x03"
+
+_registry = {}
+
+
+def _label(model):
+    return model._meta.label_lower
+
+
+def _config():
+    return getattr(settings, "SEARCH_CONFIG", "spanish")
+
+
+def to_plain_text(*parts):
+    """Une y limpia fragmentos (HTML de CKEditor incluido) para indexar."""
+    text = " ".join(html.unescape(strip_tags(p or "")) for p in parts)
+    return re.sub(r"\s+", " ", text).strip()
+
+
+def highlight(snippet):
+    """Escapa el snippet y convierte los marcadores internos en <mark>."""
+    if not snippet:
+        return ""
+    safe = escape(snippet).replace(_START, "<mark>").replace(_STOP, "</mark>")
+    return mark_safe(safe)
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Backends
+# ──────────────────────────────────────────────────────────────────────────────
+class BaseBackend:
+    """
+    icontains sobre SearchDocument. `scope` es el queryset de la vista: los
+    resultados se limitan a sus pks con una subconsulta, así el conteo y la
+    paginación respetan los filtros (publicado, categoría, ...).
+    """
+
+    def index(self, doc):
+        pass
+
+    def index_many(self, docs):
+        for doc in docs:
+            self.index(doc)
+
+    def remove(self, doc_ids):
+        pass
+
+    def count(self, label, q, scope):
+        return self._docs(label, q, scope).count()
+
+    def hits(self, label, q, scope, offset, limit):
+        """Lista de (object_id, rank, snippet) ordenada por relevancia."""
+        docs = self._docs(label, q, scope).order_by("-updated", "-id")
+        return [
+            (obj_id, 0.0, body[:200])
+            for obj_id, body in docs.values_list("object_id", "body")[
+                offset : offset + limit
+            ]
+        ]
+
+    def _scoped(self, label, scope):
+        from core.models import SearchDocument
+
+        return SearchDocument.objects.filter(
+            label=label, object_id__in=scope.order_by().values("pk")
+        )
+
+    def _docs(self, label, q, scope):
+        return self._scoped(label, scope).filter(
+            Q(title__icontains=q) | Q(body__icontains=q)
+        )
+
+
+class PostgresBackend(BaseBackend):
+    def _vector(self):
+        from django.contrib.postgres.search import SearchVector
+
+        cfg = _config()
+        return SearchVector("title", weight="A", config=cfg) + SearchVector(
+            "body", weight="B", config=cfg
+        )
+
+    def _query(self, q):
+        from django.contrib.postgres.search import SearchQuery
+
+        return SearchQuery(q, config=_config(), search_type="websearch")
+
+    def index(self, doc):
+        from core.models import SearchDocument
+
+        SearchDocument.objects.filter(pk=doc.pk).update(search_vector=self._vector())
+
+    def index_many(self, docs):
+        from core.models import SearchDocument
+
+        SearchDocument.objects.filter(pk__in=[d.pk for d in docs]).update(
+            search_vector=self._vector()
+        )
+
+    def _docs(self, label, q, scope):
+        return self._scoped(label, scope).filter(search_vector=self._query(q))
+
+    def hits(self, label, q, scope, offset, limit):
+        from django.contrib.postgres.search import SearchHeadline, SearchRank
+
+        query = self._query(q)
+        docs = (
+            self._docs(label, q, scope)
+            .annotate(
+                rank=SearchRank(F("search_vector"), query),
+                snippet=SearchHeadline(
+                    "body",
+                    query,
+                    config=_config(),
+                    start_sel=_START,
+                    stop_sel=_STOP,
+                    max_words=30,
+                    min_words=12,
+                ),
+            )
+            .order_by("-rank", "-updated")
+        )
+        return list(
+            docs.values_list("object_id", "rank", "snippet")[offset : offset + limit]
+        )
+
+
+class SQLiteFTSBackend(BaseBackend):
+    @staticmethod
+    def _match(q):
+        # Cada palabra como término entre comillas con prefijo: la sintaxis FTS5
+        # del usuario (NEAR, AND, *, ...) no se interpreta.
+        words = re.findall(r"\w+", q)
+        return " ".join(f'"{w}"*' for w in words)
+
+    def index(self, doc):
+        with connection.cursor() as cur:
+            cur.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid = %s", [doc.pk])
+            cur.execute(
+                f"INSERT INTO {FTS_TABLE}(rowid, title, body) VALUES (%s, %s, %s)",
+                [doc.pk, doc.title, doc.body],
+            )
+
+    def index_many(self, docs):
+        # Documentos recién creados (rebuild): no hay filas previas que borrar
+        with connection.cursor() as cur:
+            cur.executemany(
+                f"INSERT INTO {FTS_TABLE}(rowid, title, body) VALUES (%s, %s, %s)",
+                [(d.pk, d.title, d.body) for d in docs],
+            )
+
+    def remove(self, doc_ids):
+        if not doc_ids:
+            return
+        marks = ", ".join(["%s"] * len(doc_ids))
+        with connection.cursor() as cur:
+            cur.execute(f"DELETE FROM {FTS_TABLE} WHERE rowid IN ({marks})", doc_ids)
+
+    @staticmethod
+    def _where(label, scope):
+        scope_sql, scope_params = scope.order_by().values("pk").query.sql_with_params()
+        sql = (
+            f"FROM {FTS_TABLE} f JOIN core_searchdocument d ON d.id = f.rowid "
+            f"WHERE {FTS_TABLE} MATCH %s AND d.label = %s "
+            f"AND d.object_id IN ({scope_sql})"
+        )
+        return sql, [label, *scope_params]
+
+    def count(self, label, q, scope):
+        match = self._match(q)
+        if not match:
+            return 0
+        where, params = self._where(label, scope)
+        with connection.cursor() as cur:
+            cur.execute(f"SELECT COUNT(*) {where}", [match, *params])
+            return cur.fetchone()[0]
+
+    def hits(self, label, q, scope, offset, limit):
+        match = self._match(q)
+        if not match:
+            return []
+        where, params = self._where(label, scope)
+        with connection.cursor() as cur:
+            cur.execute(
+                f"SELECT d.object_id, -bm25({FTS_TABLE}, 10.0, 1.0) AS score, "
+                f"snippet({FTS_TABLE}, 1, %s, %s, '…', 24) {where} "
+                "ORDER BY score DESC LIMIT %s OFFSET %s",
+                [_START, _STOP, match, *params, limit, offset],
+            )
+            return cur.fetchall()
+
+
+_fts5_by_db = {}
+
+
+def fts5_available():
+    # Se consulta una vez por base de datos (la de tests tiene otro NAME)
+    name = connection.settings_dict["NAME"]
+    if name not in _fts5_by_db:
+        with connection.cursor() as cur:
+            _fts5_by_db[name] = FTS_TABLE in connection.introspection.table_names(cur)
+    return _fts5_by_db[name]
+
+
+def get_backend():
+    vendor = connection.vendor
+    if vendor == "postgresql":
+        return PostgresBackend()
+    if vendor == "sqlite" and fts5_available():
+        return SQLiteFTSBackend()
+    return BaseBackend()
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Indexado
+# ──────────────────────────────────────────────────────────────────────────────
+def index_instance(instance):
+    """Crea/actualiza (o borra si ya no es indexable) el documento del objeto."""
+    from core.models import SearchDocument
+
+    label = _label(type(instance))
+    content = instance.search_document()
+    if content is None:
+        remove_instance(instance)
+        return None
+
+    title, body = content
+    with transaction.atomic():
+        doc, _ = SearchDocument.objects.update_or_create(
+            label=label,
+            object_id=instance.pk,
+            defaults={"title": title[:255], "body": body},
+        )
+        get_backend().index(doc)
+    return doc
+
+
+def remove_instance(instance):
+    from core.models import SearchDocument
+
+    docs = SearchDocument.objects.filter(
+        label=_label(type(instance)), object_id=instance.pk
+    )
+    ids = list(docs.values_list("id", flat=True))
+    if ids:
+        get_backend().remove(ids)
+        docs.delete()
+
+
+def rebuild(model, chunk_size=500):
+    """Reindexa todos los objetos de un modelo registrado. Devuelve cuántos."""
+    from core.models import SearchDocument
+
+    label = _label(model)
+    backend = get_backend()
+    n = 0
+    with transaction.atomic():
+        stale = list(
+            SearchDocument.objects.filter(label=label).values_list("id", flat=True)
+        )
+        backend.remove(stale)
+        SearchDocument.objects.filter(label=label).delete()
+
+        # En bloques: bulk_create de los documentos y un solo indexado por bloque
+        batch = []
+        for obj in model._default_manager.iterator(chunk_size=chunk_size):
+            content = obj.search_document()
+            if content is not None:
+                title, body = content
+                batch.append(
+                    SearchDocument(
+                        label=label, object_id=obj.pk, title=title[:255], body=body
+                    )
+                )
+            if len(batch) >= chunk_size:
+                backend.index_many(SearchDocument.objects.bulk_create(batch))
+                n, batch = n + len(batch), []
+        if batch:
+            backend.index_many(SearchDocument.objects.bulk_create(batch))
+            n += len(batch)
+    return n
+
+
+def _on_save(sender, instance, **kwargs):
+    try:
+        index_instance(instance)
+    except DatabaseError:
+        # Nunca rompemos el guardado del admin por el índice (se repara con
+        # manage.py rebuild_search_index)
+        logger.exception("No se pudo indexar %s#%s", _label(sender), instance.pk)
+
+
+def _on_delete(sender, instance, **kwargs):
+    try:
+        remove_instance(instance)
+    except DatabaseError:
+        logger.exception("No se pudo desindexar %s#%s", _label(sender), instance.pk)
+
+
+def register(model):
+    """Registra un modelo con search_document() y conecta sus señales."""
+    label = _label(model)
+    _registry[label] = model
+    post_save.connect(_on_save, sender=model, dispatch_uid=f"search_save_{label}")
+    post_delete.connect(_on_delete, sender=model, dispatch_uid=f"search_delete_{label}")
+
+
+def registered_models():
+    return list(_registry.values())
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Consulta
+# ──────────────────────────────────────────────────────────────────────────────
+class SearchResults:
+    """
+    Secuencia perezosa compatible con Paginator: solo pide a la BD el conteo y
+    la ventana de la página, y la hidrata con el queryset de la vista
+    (select_related/prefetch incluidos) manteniendo el orden por relevancia.
+    """
+
+    def __init__(self, queryset, q):
+        self.queryset = queryset
+        self.q = q.strip()
+        self.label = _label(queryset.model)
+        self.backend = get_backend()
+        self._count = None
+
+    def count(self):
+        if self._count is None:
+            self._count = (
+                self.backend.count(self.label, self.q, self.queryset) if self.q else 0
+            )
+        return self._count
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, key):
+        if not isinstance(key, slice):
+            return self[key : key + 1][0]
+        start = key.start or 0
+        stop = key.stop if key.stop is not None else self.count()
+        if stop <= start or not self.q:
+            return []
+        hits = self.backend.hits(self.label, self.q, self.queryset, start, stop - start)
+        objs = self.queryset.in_bulk([obj_id for obj_id, _, _ in hits])
+        results = []
+        for obj_id, rank, snippet in hits:
+            obj = objs.get(obj_id)
+            if obj is None:  # borrado entre el conteo y la hidratación
+                continue
+            obj.search_rank = rank
+            obj.search_snippet = highlight(snippet)
+            results.append(obj)
+        return results
+
+
+def search_page(queryset, q, page=1, per_page=10):
+    """Página de resultados (django.core.paginator.Page) ordenados por relevancia."""
+    return Paginator(SearchResults(queryset, q), per_page).get_page(page)
@@ -0,0 +1,293 @@
+# core/seeding.py
+"""
+Datos semilla (fixtures) versionados, cargados en bloque.
+
+Cada app declara sus conjuntos en su módulo seeders (importado en AppConfig.ready):
+
+    from core.seeding import register_seed
+
+    register_seed("blog:all", 6, [FIXTURES / "blog_all.json"], depends=["proyectos:all"])
+
+y se cargan con
+
+    manage.py seed --parallel
+
+  * La etiqueta "<nombre>:v<versión>" se apunta en la tabla seed_run (la misma que
+    usaban los antiguos post_migrate), así que un conjunto ya cargado no se repite;
+    subir la versión lo vuelve a cargar.
+  * Cada conjunto va en una sola transacción: se leen sus fixtures y se escriben
+    con bulk_create / bulk_update por modelo (no un save() + señales por objeto
+    como loaddata), más las tablas m2m y el reinicio de secuencias.
+  * `depends` ordena los conjuntos; con --parallel los que no dependen entre sí se
+    cargan a la vez en hilos (en SQLite, que no admite escritores concurrentes,
+    se cargan en serie).
+  * `migrate` ya no siembra nada salvo que SEED_ON_MIGRATE=True.
+
+Como no se envían post_save, al terminar se reindexa la búsqueda de los modelos
+cargados y se vacía la caché; las apps con datos derivados escuchan seed_loaded.
+"""
+
+import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from graphlib import TopologicalSorter
+from pathlib import Path
+
+from django.core import serializers
+from django.core.cache import cache
+from django.core.management.color import no_style
+from django.db import DEFAULT_DB_ALIAS, IntegrityError, connections, transaction
+from django.dispatch import Signal
+
+logger = logging.getLogger("core.seeding")
+
+LEDGER_TABLE = "seed_run"
+BATCH_SIZE = 500
+
+# Tras cargar (y confirmar) un conjunto: sender=SeedSet, seed_set, models
+seed_loaded = Signal()
+
+
+@dataclass(frozen=True)
+class SeedSet:
+    name: str
+    version: int
+    fixtures: tuple
+    depends: tuple = ()
+
+    @property
+    def tag(self):
+        return f"{self.name}:v{self.version}"
+
+
+_registry = {}
+
+
+def register_seed(name, version, fixtures, depends=()):
+    """Declara (o redeclara) el conjunto `name`; fixtures = rutas a .json."""
+    seed_set = SeedSet(
+        name, int(version), tuple(Path(f) for f in fixtures), tuple(depends)
+    )
+    _registry[name] = seed_set
+    return seed_set
+
+
+def registered_seeds():
+    """Todos los conjuntos, en un orden que respeta `depends`."""
+    return [_registry[name] for name in _order(_registry)]
+
+
+def _order(names):
+    graph = {}
+    for name in sorted(names):
+        seed_set = _registry[name]
+        missing = [d for d in seed_set.depends if d not in _registry]
+        if missing:
+            raise LookupError(f"{name} depende de conjuntos no registrados: {missing}")
+        graph[name] = seed_set.depends
+    return list(TopologicalSorter(graph).static_order())
+
+
+def _with_dependencies(names):
+    pending, selected = list(names), set()
+    while pending:
+        name = pending.pop()
+        if name not in _registry:
+            raise LookupError(f"Conjunto de semillas desconocido: {name}")
+        if name not in selected:
+            selected.add(name)
+            pending.extend(_registry[name].depends)
+    return selected
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Ledger (seed_run)
+# ──────────────────────────────────────────────────────────────────────────────
+def ensure_ledger(using=DEFAULT_DB_ALIAS):
+    with connections[using].cursor() as cur:
+        cur.execute(f"CREATE TABLE IF NOT EXISTS {LEDGER_TABLE}(tag TEXT PRIMARY KEY)")
+
+
+def applied_tags(using=DEFAULT_DB_ALIAS):
+    ensure_ledger(using)
+    with connections[using].cursor() as cur:
+        cur.execute(f"SELECT tag FROM {LEDGER_TABLE}")
+        return {row[0] for row in cur.fetchall()}
+
+
+def _claim_tag(cur, tag, force):
+    """Apunta la etiqueta; False si ya estaba (otro proceso la cargó antes)."""
+    if force:
+        cur.execute(f"DELETE FROM {LEDGER_TABLE} WHERE tag=%s", [tag])
+    try:
+        with transaction.atomic(using=cur.db.alias):
+            cur.execute(f"INSERT INTO {LEDGER_TABLE}(tag) VALUES(%s)", [tag])
+    except IntegrityError:
+        return False
+    return True
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Carga en bloque
+# ──────────────────────────────────────────────────────────────────────────────
+def _deserialize(paths, using):
+    for path in paths:
+        with open(path, "rb") as fh:
+            yield from serializers.deserialize(
+                "json", fh, using=using, ignorenonexistent=True
+            )
+
+
+def _bulk_save(model, items, using):
+    """Inserta los pk nuevos y actualiza los existentes (como loaddata, sin save())."""
+    manager = model._base_manager.using(using)
+    instances = {}
+    for item in items:
+        instances[item.object.pk] = item.object  # el último gana, como en loaddata
+    existing = set(
+        manager.filter(pk__in=[pk for pk in instances if pk is not None]).values_list(
+            "pk", flat=True
+        )
+    )
+    new = [obj for pk, obj in instances.items() if pk not in existing]
+    old = [obj for pk, obj in instances.items() if pk in existing]
+
+    # bulk_create aplica auto_now(_add): se conservan las fechas del fixture
+    stamped = [
+        f
+        for f in model._meta.concrete_fields
+        if getattr(f, "auto_now", False) or getattr(f, "auto_now_add", False)
+    ]
+    stamps = [[getattr(obj, f.attname) for f in stamped] for obj in new]
+    manager.bulk_create(new, batch_size=BATCH_SIZE)
+    if stamped and new:
+        for obj, values in zip(new, stamps):
+            for f, value in zip(stamped, values):
+                if value is not None:
+                    setattr(obj, f.attname, value)
+        manager.bulk_update(new, [f.name for f in stamped], batch_size=BATCH_SIZE)
+
+    fields = [f.name for f in model._meta.concrete_fields if not f.primary_key]
+    if old and fields:
+        manager.bulk_update(old, fields, batch_size=BATCH_SIZE)
+
+    for field in model._meta.many_to_many:
+        through = field.remote_field.through
+        if not through._meta.auto_created:
+            continue
+        rows = {
+            item.object.pk: item.m2m_data[field.name]
+            for item in items
+            if field.name in item.m2m_data
+        }
+        if not rows:
+            continue
+        source, target = field.m2m_field_name(), field.m2m_reverse_field_name()
+        through._base_manager.using(using).filter(
+            **{f"{source}__in": list(rows)}
+        ).delete()
+        through._base_manager.using(using).bulk_create(
+            [
+                through(**{f"{source}_id": pk, f"{target}_id": related})
+                for pk, related_pks in rows.items()
+                for related in related_pks
+            ],
+            batch_size=BATCH_SIZE,
+            ignore_conflicts=True,
+        )
+
+
+def load_set(seed_set, force=False, using=DEFAULT_DB_ALIAS):
+    """
+    Carga el conjunto en una transacción. Devuelve (objetos cargados, modelos);
+    None si ya estaba apuntado en seed_run y no se pide `force`.
+    """
+    connection = connections[using]
+    ensure_ledger(using)
+    with transaction.atomic(using=using), connection.cursor() as cur:
+        if not _claim_tag(cur, seed_set.tag, force):
+            return None
+
+        by_model = {}
+        for item in _deserialize(seed_set.fixtures, using):
+            by_model.setdefault(type(item.object), []).append(item)
+
+        with connection.constraint_checks_disabled():
+            for model, items in by_model.items():
+                _bulk_save(model, items, using)
+        connection.check_constraints(table_names=[m._meta.db_table for m in by_model])
+
+        # pk explícitos: las secuencias (PostgreSQL) deben seguir después
+        for sql in connection.ops.sequence_reset_sql(no_style(), list(by_model)):
+            cur.execute(sql)
+
+    count = sum(len(items) for items in by_model.values())
+    logger.info("Semillas %s: %s objetos", seed_set.tag, count)
+    seed_loaded.send(sender=SeedSet, seed_set=seed_set, models=set(by_model))
+    return count, set(by_model)
+
+
+def _load_in_thread(seed_set, force, using):
+    try:
+        return load_set(seed_set, force, using)
+    finally:
+        # Cada hilo abre su propia conexión
+        connections[using].close()
+
+
+def run(names=None, parallel=False, force=False, workers=4, using=DEFAULT_DB_ALIAS):
+    """
+    Carga los conjuntos pedidos (todos por defecto) más sus dependencias.
+    Devuelve {nombre: objetos cargados o None si ya estaba}.
+    """
+    selected = _with_dependencies(names) if names else set(_registry)
+    forced = set(names or _registry) if force else set()
+    if connections[using].vendor == "sqlite":
+        parallel = False  # un solo escritor a la vez
+    ensure_ledger(using)
+
+    results, models = {}, set()
+
+    def collect(name, result):
+        results[name] = result[0] if result else None
+        if result:
+            models.update(result[1])
+
+    if not parallel or workers < 2:
+        for name in _order(selected):
+            collect(name, load_set(_registry[name], name in forced, using))
+    else:
+        sorter = TopologicalSorter({name: _registry[name].depends for name in selected})
+        sorter.prepare()
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            running = {}
+            while sorter.is_active():
+                for name in sorter.get_ready():
+                    future = pool.submit(
+                        _load_in_thread, _registry[name], name in forced, using
+                    )
+                    running[future] = name
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    collect(name, future.result())
+                    sorter.done(name)
+
+    if models:
+        _refresh_derived(models)
+    return {name: results[name] for name in _order(selected)}
+
+
+def _refresh_derived(models):
+    from core import search
+
+    for model in search.registered_models():
+        if model in models:
+            search.rebuild(model)
+    # Singletons, footer, sidebar, páginas... todo lo cacheado puede estar viejo
+    cache.clear()
+
+
+def seed_after_migrate(sender, **kwargs):
+    """post_migrate opcional (SEED_ON_MIGRATE) para entornos sin paso de seed."""
+    run(using=kwargs.get("using", DEFAULT_DB_ALIAS))
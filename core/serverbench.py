@@ -0,0 +1,212 @@
+# core/serverbench.py
+"""
+Comparación de los perfiles de gunicorn.conf.py bajo carga real.
+
+    manage.py benchmark_server --profiles sync gthread asgi --concurrency 16
+
+Por perfil: arranca `gunicorn -c gunicorn.conf.py` (GUNICORN_PROFILE=<perfil>)
+en un puerto local contra la BD configurada, espera a que responda y lanza
+`requests` peticiones con `concurrency` clientes sobre las rutas elegidas
+(por defecto las públicas sin argumentos, ver core/benchmark.py). Apunta:
+
+  * arranque: segundos hasta el primer 200 (preload + warmup se notan aquí);
+  * rps, p50/p95 (ms) y errores (estado ≠ 2xx/3xx o excepción);
+  * memoria: PSS (Linux) de master + workers al terminar; con preload_app las
+    páginas compartidas por copy-on-write se reparten entre procesos.
+"""
+
+import itertools
+import os
+import signal
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+import httpx
+from django.conf import settings
+
+from core.benchmark import percentile, public_routes
+from core.warmup import default_host
+
+CONFIG = Path(settings.BASE_DIR) / "gunicorn.conf.py"
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def default_paths():
+    return [url for _, url in public_routes() if url]
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Proceso
+# ──────────────────────────────────────────────────────────────────────────────
+def _children(pid):
+    try:
+        tasks = Path(f"/proc/{pid}/task").iterdir()
+        return [
+            int(child)
+            for task in tasks
+            for child in (task / "children").read_text().split()
+        ]
+    except OSError:
+        return []
+
+
+def _pss_kb(pid):
+    try:
+        for line in Path(f"/proc/{pid}/smaps_rollup").read_text().splitlines():
+            if line.startswith("Pss:"):
+                return int(line.split()[1])
+    except OSError:
+        return None
+    return None
+
+
+def memory_mb(pid):
+    """PSS total (MB) del master y sus hijos; None fuera de Linux."""
+    sizes = [_pss_kb(p) for p in [pid, *_children(pid)]]
+    if not sizes or None in sizes:
+        return None
+    return round(sum(sizes) / 1024, 1)
+
+
+def start(profile, port, workers=None):
+    env = {**os.environ, "GUNICORN_PROFILE": profile, "PORT": str(port)}
+    if workers:
+        env["WEB_CONCURRENCY"] = str(workers)
+    # stderr a un archivo, no a un pipe: bajo carga los avisos (presupuesto de
+    # consultas, warmup...) llenarían el pipe sin leer y bloquearían a gunicorn
+    log = tempfile.TemporaryFile(mode="w+")
+    process = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "-c", str(CONFIG)],
+        cwd=settings.BASE_DIR,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=log,
+        text=True,
+    )
+    process.log = log
+    return process
+
+
+def output(process):
+    """Lo que gunicorn ha escrito en stderr hasta ahora."""
+    process.log.flush()
+    process.log.seek(0)
+    return process.log.read()
+
+
+def wait_ready(process, base_url, path, host, timeout=60):
+    """Segundos hasta la primera respuesta correcta de `path`."""
+    started = time.perf_counter()
+    while time.perf_counter() - started < timeout:
+        if process.poll() is not None:
+            raise RuntimeError(f"gunicorn terminó al arrancar:\n{output(process)}")
+        try:
+            response = httpx.get(base_url + path, headers={"Host": host}, timeout=5)
+            if response.status_code < 400:
+                return time.perf_counter() - started
+        except httpx.TransportError:
+            pass
+        time.sleep(0.1)
+    raise RuntimeError(f"gunicorn no respondió en {timeout} s")
+
+
+def stop(process):
+    process.send_signal(signal.SIGTERM)
+    try:
+        process.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
+    process.log.close()
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Carga
+# ──────────────────────────────────────────────────────────────────────────────
+def load(base_url, paths, host, requests=500, concurrency=8):
+    """`requests` GET repartidos entre `concurrency` clientes (hilos)."""
+    urls = itertools.cycle(paths)
+    lock = threading.Lock()
+    timings, errors = [], 0
+
+    def client():
+        nonlocal errors
+        with httpx.Client(
+            base_url=base_url, headers={"Host": host}, timeout=30
+        ) as http:
+            while True:
+                with lock:
+                    if len(timings) + errors >= requests:
+                        return
+                    path = next(urls)
+                start = time.perf_counter()
+                try:
+                    ok = http.get(path).status_code < 400
+                except httpx.HTTPError:
+                    ok = False
+                elapsed = (time.perf_counter() - start) * 1000
+                with lock:
+                    if ok:
+                        timings.append(elapsed)
+                    else:
+                        errors += 1
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=client) for _ in range(max(concurrency, 1))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    return {
+        "requests": len(timings) + errors,
+        "errors": errors,
+        "rps": round((len(timings) + errors) / elapsed, 1),
+        "p50_ms": round(statistics.median(timings), 2) if timings else None,
+        "p95_ms": round(percentile(timings, 95), 2) if timings else None,
+    }
+
+
+def run_profile(profile, paths, requests=500, concurrency=8, workers=None):
+    port, host = free_port(), default_host()
+    base_url = f"http://127.0.0.1:{port}"
+    process = start(profile, port, workers)
+    try:
+        startup = wait_ready(process, base_url, paths[0], host)
+        # Una pasada para que todos los workers hayan servido cada ruta
+        load(
+            base_url,
+            paths,
+            host,
+            requests=len(paths) * concurrency,
+            concurrency=concurrency,
+        )
+        result = load(base_url, paths, host, requests, concurrency)
+        result["startup_s"] = round(startup, 2)
+        result["memory_mb"] = memory_mb(process.pid)
+        result["workers"] = len(_children(process.pid)) or None
+    finally:
+        stop(process)
+    return result
+
+
+def format_row(profile, row):
+    memory = f"{row['memory_mb']:7.1f} MB" if row["memory_mb"] else "      — MB"
+    p50 = f"{row['p50_ms']:7.2f}" if row["p50_ms"] is not None else "      —"
+    p95 = f"{row['p95_ms']:7.2f}" if row["p95_ms"] is not None else "      —"
+    return (
+        f"{profile:8} {row['rps']:7.1f} rps  p50 {p50} ms  p95 {p95} ms  "
+        f"err {row['errors']:>3}  arranque {row['startup_s']:5.2f} s  "
+        f"{row['workers'] or '?'} workers  {memory}"
+    )
@@ -0,0 +1,170 @@
+# core/singletons.py
+"""
+Cargador cacheado de páginas "singleton" (EscuelaPage, TiendaLanding, BlogPage...).
+
+Sustituye el patrón `Modelo.objects.filter(publicado=True).first()` repetido en
+vistas y templatetags, que costaba una consulta por página y otra por cada
+sección OneToOne/FK recorrida en la plantilla:
+
+    from core.singletons import get_singleton
+    page = get_singleton(EscuelaPage)   # o None si no está configurada
+
+La página se trae en una sola consulta (select_related de todas sus secciones
+OneToOne/FK + los prefetch registrados) y se guarda en dos niveles:
+
+  * caché compartida, bajo la etiqueta "section:singleton:<modelo>" (core/cache.py);
+  * memoria del proceso, revalidada contra la versión de la etiqueta cada
+    SINGLETON_LOCAL_TTL segundos.
+
+Guardar/borrar la página o cualquiera de sus secciones sube la etiqueta, así
+que lo editado en el admin se ve en la siguiente petición (en otros workers,
+como mucho tras SINGLETON_LOCAL_TTL).
+"""
+
+import time
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Prefetch
+
+from core import cache as tagcache
+
+OBJ_KEY = "singleton:{label}:v{gen}"
+_MISSING = "__missing__"  # la página no existe (también se cachea)
+
+# label → opciones de register_singleton (filters, prefetch, watch)
+PAGES = {
+    "eventos.EscuelaPage": {"prefetch": ["intro__gallery_images", "sidebar__projects"]},
+    "eventos.TalleresPage": {},
+    "eventos.ArtesPage": {"prefetch": ["diversity__artes", "gallery__images"]},
+    "eventos.RetirosPage": {
+        "prefetch": [
+            "types_section__types",
+            "activities_section__activities",
+            "gallery_section__images",
+            "testimonial_section__testimonials",
+        ]
+    },
+    "eventos.TerapiasPage": {},
+    "eventos.FestivalesPage": {},
+    "tienda.TiendaLanding": {"filters": {"publicado": True}},
+    "visitas.VisitsLanding": {"filters": {"publicado": True}},
+    "donaciones.DonacionesStatic": {"filters": {"publicado": True}},
+    "contacto.ContactoStatic": {},
+    "participa.VoluntariadoPage": {"filters": {"publicado": True}},
+    "participa.ParticipaPage": {},
+    "cooperaciones.CabeceraCoops": {"filters": {"publicado": True}},
+    "blog.BlogPage": {
+        "prefetch": [
+            lambda: Prefetch(
+                "widgets",
+                queryset=apps.get_model("blog", "BlogSidebarWidget")
+                .objects.filter(publicado=True)
+                .prefetch_related("proyectos")
+                .order_by("orden"),
+                to_attr="widgets_publicados",
+            )
+        ],
+        "watch": ["proyectos.Project"],
+    },
+}
+
+_registry = {}  # label → _Singleton
+_local = {}  # label → (gen, obj, revalidado_en, tagcache.local_epoch())
+
+
+class _Singleton:
+    def __init__(self, model, filters=None, prefetch=(), watch=()):
+        self.model = model
+        self.label = model._meta.label_lower
+        self.filters = filters or {}
+        self.prefetch = prefetch
+        self.select = [
+            f.name
+            for f in model._meta.get_fields()
+            if f.related_model and (f.one_to_one or (f.many_to_one and f.concrete))
+        ]
+        self.watch = {model, *(apps.get_model(w) for w in watch)}
+        self.watch.update(
+            model._meta.get_field(name).related_model for name in self.select
+        )
+        for lookup in self.prefetch:
+            self.watch.update(_lookup_models(model, lookup))
+        self.tag = tagcache.section(f"singleton:{self.label}", *self.watch)
+
+    def load(self):
+        prefetch = [p() if callable(p) else p for p in self.prefetch]
+        return (
+            self.model._default_manager.filter(**self.filters)
+            .select_related(*self.select)
+            .prefetch_related(*prefetch)
+            .first()
+        )
+
+
+def _lookup_models(model, lookup):
+    """Modelos que recorre un lookup de prefetch ("intro__gallery_images")."""
+    if not isinstance(lookup, str):
+        lookup = lookup().prefetch_through
+    for part in lookup.split("__"):
+        model = model._meta.get_field(part).related_model
+        yield model
+
+
+def _local_ttl():
+    return getattr(settings, "SINGLETON_LOCAL_TTL", 5)
+
+
+def get_singleton(model):
+    """Instancia de la página registrada (con sus secciones) o None."""
+    single = _registry[model._meta.label_lower]
+    label = single.label
+
+    local = _local.get(label)
+    now = time.monotonic()
+    epoch = tagcache.local_epoch()
+    # Lo que se editó en este mismo proceso se ve al momento
+    if local and now - local[2] < _local_ttl() and local[3] == epoch:
+        return local[1]
+
+    gen = tagcache.versions([single.tag])[0]
+    if local and local[0] == gen:
+        _local[label] = (gen, local[1], now, epoch)
+        return local[1]
+
+    key = OBJ_KEY.format(label=label, gen=gen)
+    obj = cache.get(key)
+    if obj is None:
+        obj = single.load()
+        cache.set(
+            key, _MISSING if obj is None else obj, timeout=tagcache.entry_timeout()
+        )
+    elif obj == _MISSING:
+        obj = None
+
+    _local[label] = (gen, obj, now, epoch)
+    return obj
+
+
+def invalidate_singleton(model):
+    single = _registry[model._meta.label_lower]
+    _local.pop(single.label, None)
+    tagcache.invalidate(single.tag)
+
+
+def register_singleton(model, filters=None, prefetch=(), watch=()):
+    """Registra la página; la invalidan cambios en ella y en sus secciones."""
+    single = _Singleton(model, filters, prefetch, watch)
+    _registry[single.label] = single
+    return single
+
+
+def register_pages():
+    """Registra PAGES (se llama desde CoreConfig.ready)."""
+    for label, options in PAGES.items():
+        try:
+            model = apps.get_model(label)
+        except LookupError:
+            continue
+        register_singleton(model, **options)
@@ -1,6 +1,7 @@
 # core/templatetags/gallery_headers.py
 from django import template
-from inicio.models import SectionHeader, Gallery  # <-- ajusta al app real
+from inicio.models import Gallery  # <-- ajusta al app real
+from inicio.section_headers import get_section_header
 
 register = template.Library()
 
@@ -14,7 +15,7 @@ def gallery_headers_estancias(context, seccion, title="", subtitle="", limit=6):
       3) Defaults ("Estancias", "")
     """
     # Asegura que 'seccion' venga como value de choices (p.ej. 'participa_estancias')
-    sh = SectionHeader.objects.filter(seccion=seccion, publicado=True).first()
+    sh = get_section_header(seccion)
 
     header_title = sh.title if sh and sh.title else (title or "Estancias")
     header_subtitle = sh.subtitle if sh and sh.subtitle else (subtitle or "")
@@ -0,0 +1,50 @@
+# core/templatetags/thumbnails.py
+from django import template
+
+from core import thumbnails
+
+register = template.Library()
+
+
+def _name(image):
+    # Acepta un FieldFile (ImageField) o directamente el nombre en storage
+    return getattr(image, "name", image) or ""
+
+
+@register.filter
+def thumbnail_url(image, preset="card"):
+    """URL del derivado más grande del preset en el formato clásico (jpg/png)."""
+    name = _name(image)
+    if not name:
+        return ""
+    width = thumbnails.PRESETS[preset][-1]
+    return thumbnails.thumbnail_url(name, width, thumbnails.fallback_format(name))
+
+
+@register.filter
+def srcset(image, preset="card"):
+    name = _name(image)
+    if not name:
+        return ""
+    return thumbnails.srcset(name, preset, thumbnails.fallback_format(name))
+
+
+@register.inclusion_tag("components/_picture.html")
+def picture(image, preset="card", alt="", css_class="", sizes="100vw", loading="lazy"):
+    """<picture> con fuentes AVIF/WebP y <img> de respaldo, todo con srcset."""
+    name = _name(image)
+    if not name:
+        return {"name": ""}
+    return {
+        "name": name,
+        "sources": [
+            {"type": f"image/{fmt}", "srcset": thumbnails.srcset(name, preset, fmt)}
+            for fmt in thumbnails.MODERN_FORMATS
+        ],
+        "src": thumbnail_url(name, preset),
+        "fallback_srcset": srcset(name, preset),
+        "sizes": sizes,
+        "alt": alt,
+        "css_class": css_class,
+        "loading": loading,
+    }
@@ -0,0 +1,30 @@
+# core/test_runner.py
+"""
+Runner de `manage.py test` (TEST_RUNNER en settings).
+
+Las pruebas de caché cuentan las consultas de contenido de un acierto (footer,
+sidebar, singletons...); con la caché por defecto en BD cada lectura de caché
+también sería una consulta. Durante las pruebas la caché es LocMemCache.
+
+Además QUERY_BUDGET_RAISE: una vista que excede el presupuesto que declaró
+(core/querybudget.py) hace fallar su prueba.
+"""
+
+from django.test.runner import DiscoverRunner
+from django.test.utils import override_settings
+
+TEST_SETTINGS = {
+    "CACHES": {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}},
+    "QUERY_BUDGET_RAISE": True,
+}
+
+
+class TestRunner(DiscoverRunner):
+    def setup_test_environment(self, **kwargs):
+        super().setup_test_environment(**kwargs)
+        self._test_settings = override_settings(**TEST_SETTINGS)
+        self._test_settings.enable()
+
+    def teardown_test_environment(self, **kwargs):
+        self._test_settings.disable()
+        super().teardown_test_environment(**kwargs)
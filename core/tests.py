@@ -1 +1,668 @@
-# Create your tests here.
+import json
+import os
+import runpy
+import subprocess
+import sys
+import tempfile
+from io import StringIO
+from pathlib import Path
+from unittest import mock
+
+from django.conf import settings
+from django.core import mail
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.mail.backends.locmem import EmailBackend
+from django.db import connection
+from django.core.files.storage import default_storage
+from django.http import HttpResponse
+from django.middleware.csrf import get_token
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import path
+from PIL import Image
+
+from blog.models import BlogPost, BlogTag
+from core import benchmark, loadgen
+from core import cache as tagcache
+from core import outbox, search, seeding, serverbench, warmup
+from core import thumbnails
+from core.media import serve_media
+from core.querybudget import QueryBudgetExceeded, query_budget
+from core.models import OutboundEmail, PageHeader, SearchDocument
+from core.pagecache import cache_page_anon
+from core.singletons import get_singleton, invalidate_singleton
+from core.utils.seed_media import copy_seed_media, sync_seed_media
+from eventos.models import TalleresHeader, TalleresPage
+
+
+class SearchTests(TestCase):
+    def setUp(self):
+        self.post = BlogPost.objects.create(
+            titulo="Huerta comunitaria",
+            slug="huerta-comunitaria-test",
+            publicado=True,
+            resumen="Cosechamos calabazas y maíz en la minga de otoño.",
+        )
+
+    def _buscar(self, q):
+        qs = BlogPost.objects.filter(publicado=True)
+        return list(search.search_page(qs, q).object_list)
+
+    def test_encuentra_y_resalta(self):
+        resultados = self._buscar("calabaza")
+        self.assertEqual([p.pk for p in resultados], [self.post.pk])
+        self.assertIn("<mark>", resultados[0].search_snippet)
+
+    def test_despublicar_lo_saca_del_indice(self):
+        self.post.publicado = False
+        self.post.save()
+        self.assertEqual(self._buscar("calabaza"), [])
+
+    def test_sin_fts5_no_se_vuelve_a_consultar(self):
+        name = connection.settings_dict["NAME"]
+        with mock.patch.dict(search._fts5_by_db, {name: False}):
+            with self.assertNumQueries(0):
+                self.assertFalse(search.fts5_available())
+
+    def test_backfill_si_el_indice_esta_vacio(self):
+        # Contenido anterior al índice (p.ej. recién migrado): no hay documentos
+        search.get_backend().remove(
+            list(SearchDocument.objects.values_list("id", flat=True))
+        )
+        SearchDocument.objects.all().delete()
+        self.assertEqual(self._buscar("calabaza"), [])
+
+        call_command("rebuild_search_index", "--if-empty", stdout=StringIO())
+        self.assertEqual([p.pk for p in self._buscar("calabaza")], [self.post.pk])
+        out = StringIO()
+        call_command("rebuild_search_index", "--if-empty", stdout=out)
+        self.assertIn("se omite", out.getvalue())
+
+
+class SingletonTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        TalleresPage.objects.all().delete()
+        self.header = TalleresHeader.objects.create(
+            title="Talleres", background="eventos/h.jpg"
+        )
+        TalleresPage.objects.create(header=self.header)
+        invalidate_singleton(TalleresPage)
+
+    def test_pagina_y_secciones_en_una_consulta_y_luego_cacheada(self):
+        with self.assertNumQueries(1):
+            page = get_singleton(TalleresPage)
+            self.assertEqual(page.header.title, "Talleres")
+        with self.assertNumQueries(0):
+            get_singleton(TalleresPage)
+
+    def test_guardar_una_seccion_invalida(self):
+        get_singleton(TalleresPage)
+        self.header.title = "Talleres de verano"
+        self.header.save()
+        self.assertEqual(get_singleton(TalleresPage).header.title, "Talleres de verano")
+
+
+class ThumbnailTests(TestCase):
+    def setUp(self):
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        self.settings_override = override_settings(MEDIA_ROOT=media.name)
+        self.settings_override.enable()
+        self.addCleanup(self.settings_override.disable)
+        Image.new("RGB", (2000, 1000), "green").save(f"{media.name}/foto.jpg")
+
+    def test_genera_bajo_demanda_sin_ampliar(self):
+        url = thumbnails.thumbnail_url("foto.jpg", 640, "webp")
+        self.assertEqual(url, "/thumbs/640/webp/foto.jpg")
+
+        r = self.client.get(url)
+        self.assertRedirects(
+            r, "/media/thumbs/foto-640w.webp", fetch_redirect_response=False
+        )
+        with Image.open(default_storage.path("thumbs/foto-640w.webp")) as im:
+            self.assertEqual((im.format, im.size), ("WEBP", (640, 320)))
+        # Ya existe: la plantilla apunta directo al archivo
+        self.assertEqual(
+            thumbnails.thumbnail_url("foto.jpg", 640, "webp"),
+            "/media/thumbs/foto-640w.webp",
+        )
+
+    def test_rechaza_anchos_y_rutas_no_validas(self):
+        self.assertEqual(self.client.get("/thumbs/641/webp/foto.jpg").status_code, 404)
+        self.assertEqual(
+            self.client.get("/thumbs/640/webp/../settings.py").status_code, 404
+        )
+
+
+class MediaServingTests(TestCase):
+    def setUp(self):
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        override = override_settings(
+            MEDIA_ROOT=media.name, MEDIA_SERVE_MODE="django", MEDIA_CACHE_MAX_AGE=86400
+        )
+        override.enable()
+        self.addCleanup(override.disable)
+        with open(f"{media.name}/logo.png", "wb") as fh:
+            fh.write(bytes(range(100)))
+        self.rf = RequestFactory()
+
+    def _get(self, path="logo.png", **headers):
+        return serve_media(self.rf.get("/media/" + path, headers=headers), path)
+
+    def test_etag_y_304(self):
+        r = self._get()
+        self.assertEqual(b"".join(r.streaming_content), bytes(range(100)))
+        self.assertEqual(r["Cache-Control"], "public, max-age=86400")
+        self.assertEqual(self._get(If_None_Match=r["ETag"]).status_code, 304)
+
+    def test_range(self):
+        r = self._get(Range="bytes=10-19")
+        self.assertEqual(r.status_code, 206)
+        self.assertEqual(r["Content-Range"], "bytes 10-19/100")
+        self.assertEqual(b"".join(r.streaming_content), bytes(range(10, 20)))
+        self.assertEqual(
+            self._get(Range="bytes=-5")["Content-Range"], "bytes 95-99/100"
+        )
+        self.assertEqual(self._get(Range="bytes=200-").status_code, 416)
+
+    @override_settings(MEDIA_SERVE_MODE="x-accel")
+    def test_x_accel_redirect(self):
+        r = self._get()
+        self.assertEqual(r["X-Accel-Redirect"], "/protected-media/logo.png")
+        self.assertEqual(r.content, b"")
+
+
+@query_budget(queries=1)
+def _vista_con_n_mas_1(request):
+    for pk in range(1, 4):
+        BlogPost.objects.filter(pk=pk).exists()
+    return HttpResponse("ok")
+
+
+_renders = []
+
+
+@cache_page_anon("core")
+def _vista_cacheada(request):
+    _renders.append(request.LANGUAGE_CODE)
+    if "form" in request.GET:
+        get_token(request)
+    return HttpResponse(f"ok {len(_renders)}")
+
+
+urlpatterns = [
+    path("n1/", _vista_con_n_mas_1),
+    path("cacheada/", _vista_cacheada),
+]
+
+
+@override_settings(ROOT_URLCONF=__name__, SERVER_TIMING=True)
+class QueryBudgetTests(TestCase):
+    def test_server_timing_y_presupuesto(self):
+        with (
+            override_settings(QUERY_BUDGET_RAISE=False),
+            self.assertLogs("core.querybudget", "INFO") as logs,
+        ):
+            r = self.client.get("/n1/")
+        self.assertIn('desc="3 queries"', r["Server-Timing"])
+        self.assertIn('desc="1 repeated"', r["Server-Timing"])
+        self.assertTrue(any("excede su presupuesto" in m for m in logs.output))
+
+        with override_settings(QUERY_BUDGET_RAISE=True):
+            with self.assertRaises(QueryBudgetExceeded):
+                self.client.get("/n1/")
+        # Sin override: lo activa el runner de pruebas (core/test_runner.py)
+        with self.assertRaises(QueryBudgetExceeded):
+            self.client.get("/n1/")
+
+
+class _FailingBackend(EmailBackend):
+    def send_messages(self, messages):
+        raise ConnectionError("SMTP caído")
+
+
+class _CrashingBackend(EmailBackend):
+    """Entrega el primer correo y el worker muere en el segundo."""
+
+    def send_messages(self, messages):
+        if mail.outbox:
+            raise KeyboardInterrupt
+        return super().send_messages(messages)
+
+
+class OutboxTests(TestCase):
+    def test_enqueue_does_not_send_until_drained(self):
+        outbox.enqueue("Hola", "Texto", "web@example.com", ["a@example.com"])
+        outbox.enqueue("Hola 2", "Texto", None, ["b@example.com"])
+        self.assertEqual(mail.outbox, [])
+
+        self.assertEqual(outbox.drain(batch_size=1), (2, 0))
+        self.assertEqual(
+            [m.to for m in mail.outbox], [["a@example.com"], ["b@example.com"]]
+        )
+        self.assertFalse(
+            OutboundEmail.objects.exclude(status=OutboundEmail.Status.SENT).exists()
+        )
+        self.assertEqual(outbox.drain(), (0, 0))
+
+    def test_failure_backs_off_then_gives_up(self):
+        email = outbox.enqueue("Hola", "Texto", None, ["a@example.com"])
+
+        self.assertEqual(
+            outbox.drain(max_attempts=2, connection=_FailingBackend()), (0, 1)
+        )
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutboundEmail.Status.PENDING)
+        self.assertEqual(email.attempts, 1)
+        self.assertIn("SMTP caído", email.last_error)
+        # Aún no vence: el worker no lo vuelve a intentar enseguida
+        self.assertEqual(outbox.drain(max_attempts=2), (0, 0))
+
+        OutboundEmail.objects.update(next_attempt_at=email.created)
+        outbox.drain(max_attempts=2, connection=_FailingBackend())
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutboundEmail.Status.FAILED)
+
+        outbox.retry(OutboundEmail.objects.all())
+        self.assertEqual(outbox.drain(), (1, 0))
+        self.assertEqual(len(mail.outbox), 1)
+
+    def test_lo_entregado_no_se_reenvia_si_el_lote_se_corta(self):
+        first = outbox.enqueue("Uno", "Texto", None, ["a@example.com"])
+        outbox.enqueue("Dos", "Texto", None, ["b@example.com"])
+        with self.assertRaises(KeyboardInterrupt):
+            outbox.send_batch(connection=_CrashingBackend())
+        first.refresh_from_db()
+        self.assertEqual(first.status, OutboundEmail.Status.SENT)
+
+        # Vencida la reserva, solo se retoma el que no salió
+        OutboundEmail.objects.update(next_attempt_at=first.created)
+        mail.outbox.clear()
+        self.assertEqual(outbox.drain(), (1, 0))
+        self.assertEqual([m.to for m in mail.outbox], [["b@example.com"]])
+
+
+@override_settings(ROOT_URLCONF=__name__, PAGE_CACHE_ENABLED=True)
+class PageCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        _renders.clear()
+
+    def test_hit_vary_and_invalidation(self):
+        self.assertEqual(self.client.get("/cacheada/")["X-Page-Cache"], "miss")
+        r = self.client.get("/cacheada/")
+        self.assertEqual((r["X-Page-Cache"], r.content), ("hit", b"ok 1"))
+
+        # Otro idioma u otra query string: otra entrada
+        self.client.get("/cacheada/", HTTP_ACCEPT_LANGUAGE="en")
+        self.client.get("/cacheada/?b=2&a=1")
+        self.assertEqual(self.client.get("/cacheada/?a=1&b=2")["X-Page-Cache"], "hit")
+        self.assertEqual(len(_renders), 3)
+
+        # Cambiar un modelo de una etiqueta de la página la invalida
+        PageHeader.objects.create(slug="x")
+        self.assertEqual(self.client.get("/cacheada/")["X-Page-Cache"], "miss")
+
+    def test_bypass_for_sessions_and_csrf(self):
+        self.client.cookies["sessionid"] = "abc"
+        self.client.get("/cacheada/")
+        self.assertNotIn("X-Page-Cache", self.client.get("/cacheada/"))
+        del self.client.cookies["sessionid"]
+
+        self.client.get("/cacheada/?form=1")
+        self.assertNotIn("X-Page-Cache", self.client.get("/cacheada/?form=1"))
+        self.assertEqual(len(_renders), 4)
+
+
+class SeedingTests(TestCase):
+    def setUp(self):
+        self.dir = Path(tempfile.mkdtemp())
+        patcher = mock.patch.dict(seeding._registry, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _fixture(self, name, headers):
+        path = self.dir / name
+        rows = [
+            {"model": "core.pageheader", "pk": pk, "fields": {"slug": slug}}
+            for pk, slug in headers
+        ]
+        path.write_text(json.dumps(rows))
+        return path
+
+    def test_carga_en_orden_una_sola_vez_por_version(self):
+        seeding.register_seed(
+            "b", 1, [self._fixture("b.json", [(1, "uno-b")])], depends=["a"]
+        )
+        seeding.register_seed(
+            "a", 1, [self._fixture("a.json", [(1, "uno"), (2, "dos")])]
+        )
+
+        self.assertEqual(seeding.run(), {"a": 2, "b": 1})
+        # b (que depende de a) se aplicó después: pisa el pk 1
+        self.assertEqual(PageHeader.objects.get(pk=1).slug, "uno-b")
+        self.assertEqual(seeding.run(), {"a": None, "b": None})
+
+        seeding.register_seed("a", 2, [self._fixture("a.json", [(2, "dos-v2")])])
+        self.assertEqual(seeding.run(["a"]), {"a": 1})
+        self.assertEqual(PageHeader.objects.get(pk=2).slug, "dos-v2")
+        self.assertIn("a:v2", seeding.applied_tags())
+
+
+class SeedMediaTests(TestCase):
+    def test_sincroniza_solo_lo_que_cambia(self):
+        base, media = Path(tempfile.mkdtemp()), Path(tempfile.mkdtemp())
+        (base / "static").mkdir()
+        (base / "static" / "a.jpg").write_bytes(b"a" * 10)
+        (base / "static" / "b.jpg").write_bytes(b"b" * 10)
+        (media / "fotos").mkdir()
+        (media / "fotos" / "b.jpg").write_bytes(b"subida desde el admin")
+        pairs = [("static", "fotos"), ("static", "fotos")]
+
+        with override_settings(BASE_DIR=base, MEDIA_ROOT=media):
+            first = sync_seed_media(pairs, link=False)
+            self.assertEqual((first.copied, first.kept), (1, 1))
+            self.assertEqual(
+                (media / "fotos" / "b.jpg").read_bytes(), b"subida desde el admin"
+            )
+
+            second = sync_seed_media(pairs, link=False)
+            self.assertEqual((second.written, second.skipped), (0, 1))
+            self.assertEqual(second.bytes_saved, 10)
+
+            (base / "static" / "a.jpg").write_bytes(b"nuevo")
+            self.assertEqual(sync_seed_media(pairs).written, 1)
+            self.assertEqual((media / "fotos" / "a.jpg").read_bytes(), b"nuevo")
+
+    def test_copy_seed_media_no_oculta_errores(self):
+        base, media = Path(tempfile.mkdtemp()), Path(tempfile.mkdtemp())
+        (base / "static").mkdir()
+        (base / "static" / "a.jpg").write_bytes(b"a")
+        fail = mock.patch(
+            "core.utils.seed_media._sync_one", side_effect=OSError("disco lleno")
+        )
+        with override_settings(BASE_DIR=base, MEDIA_ROOT=media), fail:
+            with self.assertLogs("core.seed_media", "ERROR"):
+                with self.assertRaisesMessage(OSError, "disco lleno"):
+                    copy_seed_media([("static", "fotos")])
+
+
+_calls = []
+
+
+@tagcache.cached(tagcache.section("test_cabeceras", "core.PageHeader"))
+def _slugs(prefix):
+    _calls.append(prefix)
+    return [h.slug for h in PageHeader.objects.filter(slug__startswith=prefix)]
+
+
+class TaggedCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        _calls.clear()
+
+    def test_entrada_por_argumentos_invalidada_por_su_modelo(self):
+        self.assertEqual(_slugs("a"), [])
+        self.assertEqual(_slugs("a"), [])
+        _slugs("b")
+        self.assertEqual(_calls, ["a", "b"])
+
+        # Un modelo ajeno no toca la sección; el suyo sí
+        OutboundEmail.objects.create(subject="x", to=["a@b.c"])
+        TalleresHeader.objects.create(title="t", background="e/h.jpg")
+        _slugs("a")
+        self.assertEqual(len(_calls), 2)
+        PageHeader.objects.create(slug="alfa")
+        self.assertEqual(_slugs("a"), ["alfa"])
+        self.assertEqual(len(_calls), 3)
+
+    def test_invalidar_etiqueta_a_mano(self):
+        before = tagcache.versions(["app:core", "model:core.pageheader"])
+        tagcache.invalidate("model:core.pageheader")
+        after = tagcache.versions(["app:core", "model:core.pageheader"])
+        self.assertEqual(after, [before[0], before[1] + 1])
+
+    def test_invalidacion_desde_otro_proceso(self):
+        # Dos workers contra la misma caché compartida: lo que invalida uno lo
+        # ve el otro en la siguiente lectura
+        with tempfile.TemporaryDirectory() as tmp:
+            backend = "django.core.cache.backends.filebased.FileBasedCache"
+            shared = {"default": {"BACKEND": backend, "LOCATION": tmp}}
+            with override_settings(CACHES=shared):
+                self.assertFalse(tagcache.process_local())
+                self.assertIsNone(tagcache.entry_timeout())
+                _slugs("a")
+                _slugs("a")
+                subprocess.run(
+                    [
+                        sys.executable,
+                        "-c",
+                        "import django; django.setup(); from core import cache; "
+                        "cache.invalidate('section:test_cabeceras')",
+                    ],
+                    cwd=settings.BASE_DIR,
+                    env={
+                        **os.environ,
+                        "DJANGO_SETTINGS_MODULE": "chambalabamba.settings",
+                        "CACHE_BACKEND": backend,
+                        "CACHE_LOCATION": tmp,
+                    },
+                    check=True,
+                )
+                _slugs("a")
+        self.assertEqual(_calls, ["a", "a"])
+
+    def test_cache_local_no_guarda_sin_caducidad(self):
+        local = {
+            "default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}
+        }
+        with override_settings(CACHES=local, CACHE_LOCAL_TIMEOUT=30):
+            self.assertTrue(tagcache.process_local())
+            self.assertEqual(tagcache.entry_timeout(), 30)
+            self.assertEqual(tagcache.entry_timeout(5), 5)
+
+
+class DbBenchmarkTests(TestCase):
+    def test_mide_conexion_nueva_y_reutilizada(self):
+        out = StringIO()
+        call_command("db_benchmark", iterations=3, stdout=out)
+        self.assertIn("Conexión nueva", out.getvalue())
+        self.assertIn("Conexión reutilizada", out.getvalue())
+
+    def test_sin_persistencia_no_mide_reutilizacion(self):
+        out = StringIO()
+        with mock.patch.dict(connection.settings_dict, {"CONN_MAX_AGE": 0}):
+            call_command("db_benchmark", iterations=3, stdout=out)
+        self.assertIn("no se reutiliza", out.getvalue())
+        self.assertNotIn("Ahorro", out.getvalue())
+
+
+class BenchmarkTests(TestCase):
+    def test_escala_y_mide_rutas(self):
+        tag = BlogTag.objects.create(nombre="Eco", slug="eco")
+        post = BlogPost.objects.create(titulo="Uno", slug="uno", publicado=True)
+        post.tags.add(tag)
+        self.assertEqual(
+            benchmark.scale_dataset(3, ["blog.BlogPost"]), {"blog.BlogPost": 2}
+        )
+        self.assertEqual(tag.posts.count(), 3)
+        # Otra vez sobre la misma BD (--keepdb): ni copias de copias ni slugs repetidos
+        self.assertEqual(
+            benchmark.scale_dataset(3, ["blog.BlogPost"]), {"blog.BlogPost": 0}
+        )
+        self.assertEqual(
+            benchmark.scale_dataset(4, ["blog.BlogPost"]), {"blog.BlogPost": 1}
+        )
+        self.assertEqual(tag.posts.count(), 4)
+
+        routes = dict(benchmark.public_routes())
+        self.assertEqual(routes["blog_detail"], "/blog/blog/uno/")
+        self.assertNotIn("admin:index", routes)
+        result = benchmark.run(iterations=2, only={"blog_detail"})
+        row = result["routes"]["blog_detail"]
+        self.assertEqual(row["status"], 200)
+        self.assertGreater(row["bytes"], 0)
+
+    def test_compare_detecta_regresiones(self):
+        row = {
+            "url": "/",
+            "status": 200,
+            "p95_ms": 10,
+            "queries": 2,
+            "queries_cold": 10,
+            "bytes": 1000,
+        }
+        base = {"routes": {"home": row}}
+        same = {"routes": {"home": {**row, "p95_ms": 11}}}
+        worse = {"routes": {"home": {**row, "p95_ms": 30, "queries": 3}}}
+        self.assertEqual(benchmark.compare(base, same), [])
+        self.assertEqual(len(benchmark.compare(base, worse)), 2)
+
+
+class LoadGenTests(TestCase):
+    def setUp(self):
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        override = override_settings(MEDIA_ROOT=media.name)
+        override.enable()
+        self.addCleanup(override.disable)
+
+    def test_genera_y_purga(self):
+        volumes = loadgen.Volumes(
+            posts=30,
+            tags=5,
+            products=4,
+            galleries=3,
+            estancias=2,
+            visits=2,
+            donations=7,
+        )
+        counts = loadgen.generate(volumes, chunk_size=8)
+        self.assertEqual(counts["blog.BlogComment"], 150)
+        self.assertEqual(counts["tienda.ProductoImagen"], 12)
+        self.assertEqual(counts["donaciones.Donacion"], 7)
+
+        post = BlogPost.objects.get(slug__endswith="-post-1")
+        self.assertEqual(post.header_foto.post_id, post.pk)
+        self.assertEqual(
+            post.comentarios_count, post.comentarios.filter(status="approved").count()
+        )
+        self.assertTrue(default_storage.exists(post.portada.name))
+        self.assertEqual(
+            search.search_page(BlogPost.objects.all(), "minga").paginator.count,
+            BlogPost.objects.filter(publicado=True).count(),
+        )
+
+        loadgen.purge()
+        self.assertFalse(BlogPost.objects.filter(slug__startswith="carga-").exists())
+
+
+class GunicornProfileTests(TestCase):
+    def _conf(self, **env):
+        with mock.patch.dict(os.environ, env):
+            return runpy.run_path(str(serverbench.CONFIG))
+
+    def test_perfiles(self):
+        conf = self._conf(GUNICORN_PROFILE="sync", WEB_CONCURRENCY="3")
+        self.assertEqual(conf["worker_class"], "sync")
+        self.assertFalse(conf["preload_app"])
+        self.assertEqual(conf["workers"], 3)
+        self.assertNotIn("max_requests", conf)
+
+        conf = self._conf(GUNICORN_PROFILE="gthread", GUNICORN_THREADS="6")
+        self.assertTrue(conf["preload_app"])
+        self.assertEqual(conf["threads"], 6)
+        self.assertGreaterEqual(conf["workers"], 2)
+        self.assertGreater(conf["max_requests_jitter"], 0)
+
+        conf = self._conf(GUNICORN_PROFILE="asgi")
+        self.assertEqual(conf["wsgi_app"], "chambalabamba.asgi:application")
+        self.assertEqual(conf["worker_class"], "uvicorn_worker.UvicornWorker")
+
+        with self.assertRaises(RuntimeError):
+            self._conf(GUNICORN_PROFILE="eventlet")
+
+    def test_error_de_arranque_se_lee_del_log(self):
+        process = serverbench.start("eventlet", serverbench.free_port())
+        try:
+            with self.assertRaisesMessage(RuntimeError, "no existe"):
+                serverbench.wait_ready(process, "http://127.0.0.1:1", "/", "x")
+        finally:
+            serverbench.stop(process)
+
+    def test_memoria_del_proceso(self):
+        if not os.path.exists(f"/proc/{os.getpid()}/smaps_rollup"):
+            self.skipTest("sin /proc")
+        self.assertGreater(serverbench.memory_mb(os.getpid()), 0)
+
+
+CACHED_TEMPLATES = [
+    {
+        "BACKEND": "django.template.backends.django.DjangoTemplates",
+        "DIRS": [str(Path(__file__).parent / "templates")],
+        "OPTIONS": {
+            "context_processors": ["django.template.context_processors.request"],
+            "loaders": [
+                (
+                    "django.template.loaders.cached.Loader",
+                    [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                )
+            ],
+        },
+    }
+]
+
+
+class WarmupTests(TestCase):
+    @override_settings(TEMPLATES=CACHED_TEMPLATES)
+    def test_precompila_plantillas_y_urls(self):
+        from django.template import engines
+
+        compiled, _ = warmup.templates()
+        self.assertGreater(compiled, 50)
+        cached = engines["django"].engine.template_loaders[0].get_template_cache
+        self.assertIn("blog/blog_list.html", cached)
+        self.assertIn("inicio/home.html", cached)
+        self.assertGreater(warmup.urls(), 0)
+
+    def test_llena_footer_y_sidebar(self):
+        from blog.sidebar import sidebar_context
+        from contenido.footer import get_footer
+
+        cache.clear()
+        warmup.prime_caches()
+        with self.assertNumQueries(0):
+            get_footer()
+            sidebar_context()
+
+    @override_settings(WARMUP_CACHES=True, WARMUP_PAGES=False)
+    def test_con_preload_y_cache_local_llena_cada_worker(self):
+        conf = runpy.run_path(str(serverbench.CONFIG))
+        server = mock.Mock(**{"cfg.preload_app": True})
+        with (
+            mock.patch.object(warmup, "run") as run,
+            mock.patch.object(warmup, "prime_caches") as prime,
+            # Las conexiones de la prueba siguen abiertas
+            mock.patch("django.db.connections.all", return_value=[]),
+        ):
+            # LocMemCache (la de las pruebas): el master no llena cachés
+            conf["when_ready"](server)
+            run.assert_called_once_with(caches=False, pages=False)
+            conf["post_fork"](server, mock.Mock())
+            prime.assert_called_once_with()
+
+            run.reset_mock()
+            prime.reset_mock()
+            with tempfile.TemporaryDirectory() as tmp:
+                backend = "django.core.cache.backends.filebased.FileBasedCache"
+                shared = {"default": {"BACKEND": backend, "LOCATION": tmp}}
+                with override_settings(CACHES=shared):
+                    conf["when_ready"](server)
+                    conf["post_fork"](server, mock.Mock())
+            run.assert_called_once_with(caches=True, pages=False)
+            prime.assert_not_called()
@@ -0,0 +1,127 @@
+# core/thumbnails.py
+"""
+Derivados de imagen (miniaturas redimensionadas en AVIF/WebP/JPEG) con Pillow.
+
+Las plantillas dejan de servir los originales de varios MB: cada preset define
+los anchos que se ofrecen en `srcset` y el navegador elige el adecuado.
+
+    {% load thumbnails %}
+    {% picture foto.imagen "card" alt=foto.alt %}             → <picture> avif/webp/jpg
+    <img src="{{ p.imagen_portada|thumbnail_url:'card' }}"
+         srcset="{{ p.imagen_portada|srcset:'card' }}" ...>
+
+Los derivados viven en MEDIA_ROOT/thumbs/<ruta original>-<ancho>w.<formato>.
+Se generan bajo demanda: si aún no existe, la URL apunta a la vista
+core.views.thumbnail, que lo crea y redirige al archivo. Para generarlos todos de
+antemano: manage.py generate_thumbnails --workers 4
+"""
+
+import os
+import posixpath
+
+from django.conf import settings
+from django.core.files.storage import default_storage
+from django.urls import reverse
+from PIL import Image, ImageOps, features
+
+THUMBS_DIR = "thumbs"
+
+# Anchos (px) que ofrece cada preset en srcset; el mayor es el `src` por defecto
+PRESETS = getattr(
+    settings,
+    "THUMBNAIL_PRESETS",
+    {
+        "thumb": (160, 320),
+        "card": (320, 640, 960),
+        "content": (640, 1024, 1440),
+        "hero": (960, 1440, 1920),
+    },
+)
+WIDTHS = sorted({w for widths in PRESETS.values() for w in widths})
+
+QUALITY = {"avif": 60, "webp": 80, "jpeg": 82, "png": None}
+
+# Formatos modernos que soporta el Pillow instalado, en orden de preferencia
+MODERN_FORMATS = [f for f in ("avif", "webp") if features.check(f)]
+
+_EXT = {"jpeg": "jpg"}
+_exists = set()  # derivados ya vistos en disco por este proceso
+
+
+def fallback_format(name):
+    """Formato "clásico" del derivado: PNG si el original lo es (transparencias)."""
+    return "png" if name.lower().endswith(".png") else "jpeg"
+
+
+def formats_for(name):
+    return [*MODERN_FORMATS, fallback_format(name)]
+
+
+def derivative_name(name, width, fmt):
+    stem = os.path.splitext(name)[0]
+    return posixpath.join(THUMBS_DIR, f"{stem}-{width}w.{_EXT.get(fmt, fmt)}")
+
+
+def is_valid(name, width, fmt):
+    """Solo anchos de algún preset y formatos soportados; nunca derivados de derivados."""
+    return (
+        width in WIDTHS
+        and fmt in formats_for(name)
+        and not name.startswith(THUMBS_DIR + "/")
+    )
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Generación (funciones puras sobre rutas, aptas para un pool de procesos)
+# ──────────────────────────────────────────────────────────────────────────────
+def render_file(src_path, dst_path, width, fmt):
+    """Escribe el derivado de src_path en dst_path. Nunca amplía la imagen."""
+    with Image.open(src_path) as im:
+        im = ImageOps.exif_transpose(im)
+        if im.width > width:
+            height = round(im.height * width / im.width)
+            im = im.resize((width, height), Image.Resampling.LANCZOS)
+
+        if im.mode not in ("RGB", "RGBA"):
+            alpha = "A" in im.getbands() or "transparency" in im.info
+            im = im.convert("RGBA" if alpha and fmt != "jpeg" else "RGB")
+        elif fmt == "jpeg" and im.mode == "RGBA":
+            im = im.convert("RGB")
+
+        params = {"optimize": True} if fmt in ("jpeg", "png") else {}
+        if QUALITY.get(fmt):
+            params["quality"] = QUALITY[fmt]
+        if fmt == "jpeg":
+            params["progressive"] = True
+
+        os.makedirs(os.path.dirname(dst_path), exist_ok=True)
+        # Escritura atómica: otro worker nunca ve un archivo a medias
+        tmp = f"{dst_path}.{os.getpid()}.tmp"
+        im.save(tmp, format=fmt.upper(), **params)
+        os.replace(tmp, dst_path)
+    return dst_path
+
+
+def generate(name, width, fmt, force=False):
+    """Genera (si falta) el derivado de `name` y devuelve su nombre en storage."""
+    dst = derivative_name(name, width, fmt)
+    if force or not default_storage.exists(dst):
+        render_file(default_storage.path(name), default_storage.path(dst), width, fmt)
+    _exists.add(dst)
+    return dst
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# URLs para plantillas
+# ──────────────────────────────────────────────────────────────────────────────
+def thumbnail_url(name, width, fmt):
+    """URL del derivado; si todavía no existe, la de la vista que lo genera."""
+    dst = derivative_name(name, width, fmt)
+    if dst in _exists or default_storage.exists(dst):
+        _exists.add(dst)
+        return default_storage.url(dst)
+    return reverse("thumbnail", args=[width, fmt, name])
+
+
+def srcset(name, preset, fmt):
+    return ", ".join(f"{thumbnail_url(name, w, fmt)} {w}w" for w in PRESETS[preset])
@@ -1,8 +1,37 @@
 # core/utils/seed_media.py
+"""
+Sincroniza las imágenes semilla (static de cada app) hacia MEDIA_ROOT, donde
+las esperan los fixtures (upload_to de los modelos).
+
+    manage.py load_seed_media [--force] [--workers N] [--no-link]
+
+  * Los pares repetidos y los destinos duplicados se resuelven una sola vez
+    (gana el primer par que lo declara).
+  * MEDIA_ROOT/.seed_media.json guarda tamaño, mtime y sha256 de cada archivo
+    escrito: si el origen no cambió y el destino sigue como se dejó, no se toca
+    (un deploy en caliente solo hace stat()). Si cambió el origen se rehace.
+  * Un destino que no escribió esta sincronización (o que alguien modificó) no
+    se pisa salvo con --force.
+  * En el mismo sistema de archivos se clona (reflink) o se enlaza (hardlink) en
+    vez de copiar; las copias van en un pool de hilos.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from pathlib import Path
-from shutil import copy2
+
 from django.conf import settings
 
+logger = logging.getLogger("core.seed_media")
+
+MANIFEST_NAME = ".seed_media.json"
+FICLONE = 0x40049409  # ioctl de Linux (btrfs, xfs...) para clonar un archivo
+
 DEFAULT_PAIRS = [
     (Path("eventos/static/images"), Path("images")),
     # NOSOTROS (coinciden con upload_to de los modelos)
@@ -19,10 +48,6 @@ DEFAULT_PAIRS = [
         Path("nosotros/static/nosotros/images/pilares/economia-comunitaria"),
         Path("nosotros/pilares/hero"),
     ),
-    (
-        Path("nosotros/static/nosotros/images/pilares/economia-comunitaria"),
-        Path("nosotros/pilares/hero"),
-    ),
     (
         Path("nosotros/static/nosotros/images/pilares/sociocultural"),
         Path("nosotros/headers"),
@@ -82,7 +107,6 @@ DEFAULT_PAIRS = [
     (Path("visitas/static/visitas/portadas"), Path("visitas/inner")),
     (Path("visitas/static/visitas/portadas"), Path("visitas/portadas")),
     (Path("visitas/static/visitas/galeria"), Path("visitas/galeria")),
-    (Path("visitas/static/visitas/galeria"), Path("visitas/galeria")),
     (Path("donaciones/static/images/cabezadonaciones.png"), Path("donaciones")),
     (Path("blog/static/blog/header"), Path("blog/header")),
     (Path("blog/static/blog/portadas"), Path("blog/portadas")),
@@ -90,23 +114,191 @@ DEFAULT_PAIRS = [
 ]
 
 
-def copy_seed_media(pairs=DEFAULT_PAIRS, force=False) -> int:
+@dataclass
+class SyncReport:
+    copied: int = 0
+    linked: int = 0  # reflink o hardlink
+    skipped: int = 0
+    kept: int = 0  # destinos ajenos que no se pisaron (sin --force)
+    bytes_written: int = 0
+    bytes_saved: int = 0  # lo que no hubo que copiar (sin cambios o enlazado)
+    errors: list = field(default_factory=list)
+
+    @property
+    def written(self):
+        return self.copied + self.linked
+
+
+def plan(pairs, base, media):
+    """{destino relativo: origen} sin pares repetidos; gana el primero."""
+    tasks = {}
+    for src_rel, dst_rel in dict.fromkeys((Path(s), Path(d)) for s, d in pairs):
+        src = base / src_rel
+        if src.is_file():
+            files = [src]
+        elif src.is_dir():
+            files = [f for f in src.iterdir() if f.is_file()]
+        else:
+            continue
+        for f in sorted(files):
+            tasks.setdefault((dst_rel / f.name).as_posix(), f)
+    return tasks
+
+
+def file_hash(path):
+    h = hashlib.sha256()
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _signature(stat):
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def load_manifest(media):
+    try:
+        return json.loads((media / MANIFEST_NAME).read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def save_manifest(media, manifest):
+    tmp = media / f"{MANIFEST_NAME}.tmp"
+    tmp.write_text(json.dumps(manifest, sort_keys=True))
+    os.replace(tmp, media / MANIFEST_NAME)
+
+
+def _reflink(src, dst):
+    import fcntl
+
+    with open(src, "rb") as fin, open(dst, "wb") as fout:
+        fcntl.ioctl(fout.fileno(), FICLONE, fin.fileno())
+    shutil.copystat(src, dst)
+
+
+def _place(src, dst, link):
+    """Escribe dst de forma atómica. Devuelve True si enlazó, False si copió."""
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dst.with_name(f".{dst.name}.seedtmp")
+    tmp.unlink(missing_ok=True)
+    linked = False
+    if link:
+        for attempt in (_reflink, os.link):
+            try:
+                attempt(src, tmp)
+                linked = True
+                break
+            except (OSError, ImportError):
+                # Sin soporte (ext4 sin reflink, otro dispositivo...): siguiente
+                tmp.unlink(missing_ok=True)
+    if not linked:
+        shutil.copy2(src, tmp)
+    os.replace(tmp, dst)
+    return linked
+
+
+def _sync_one(rel, src, media, entry, force, link):
+    """(acción, entrada nueva del manifiesto). Corre en un hilo."""
+    dst = media / rel
+    src_stat = src.stat()
+    try:
+        dst_stat = dst.stat()
+    except FileNotFoundError:
+        dst_stat = None
+
+    if dst_stat is not None and os.path.samestat(src_stat, dst_stat):
+        # Hardlink de una sincronización anterior: es el mismo archivo
+        same = entry and entry["src"] == _signature(src_stat)
+        return "skipped", {
+            "src": _signature(src_stat),
+            "dst": _signature(dst_stat),
+            "sha256": entry["sha256"] if same else file_hash(src),
+        }
+    if entry and dst_stat is not None:
+        untouched = _signature(dst_stat) == entry["dst"]
+        if untouched and _signature(src_stat) == entry["src"]:
+            return "skipped", entry
+        if untouched and file_hash(src) == entry["sha256"]:
+            # Mismo contenido con otra mtime (checkout nuevo): basta con apuntarlo
+            return "skipped", {**entry, "src": _signature(src_stat)}
+        if not untouched and not force:
+            return "kept", None
+    elif dst_stat is not None and not force:
+        # Ya estaba antes del manifiesto: si es idéntico se adopta, si no se respeta
+        if dst_stat.st_size == src_stat.st_size:
+            digest = file_hash(src)
+            if file_hash(dst) == digest:
+                return "skipped", {
+                    "src": _signature(src_stat),
+                    "dst": _signature(dst_stat),
+                    "sha256": digest,
+                }
+        return "kept", None
+
+    same_device = src_stat.st_dev == media.stat().st_dev
+    linked = _place(src, dst, link and same_device)
+    return ("linked" if linked else "copied"), {
+        "src": _signature(src_stat),
+        "dst": _signature(dst.stat()),
+        "sha256": file_hash(src),
+    }
+
+
+def sync_seed_media(pairs=DEFAULT_PAIRS, force=False, workers=8, link=True):
+    """Sincroniza los pares hacia MEDIA_ROOT. Devuelve un SyncReport."""
     base = Path(settings.BASE_DIR)
     media = Path(settings.MEDIA_ROOT)
     media.mkdir(parents=True, exist_ok=True)
 
-    total = 0
-    for src_rel, dst_rel in pairs:
-        src = base / src_rel
-        dst = media / dst_rel
-        if not src.exists():
-            continue
-        dst.mkdir(parents=True, exist_ok=True)
-        for f in src.glob("*"):
-            if f.is_file():
-                target = dst / f.name
-                if target.exists() and not force:
-                    continue
-                copy2(f, target)
-                total += 1
-    return total
+    tasks = plan(pairs, base, media)
+    manifest = load_manifest(media)
+    report = SyncReport()
+
+    def run(item):
+        rel, src = item
+        try:
+            return rel, src, _sync_one(rel, src, media, manifest.get(rel), force, link)
+        except OSError as exc:
+            return rel, src, ("error", exc)
+
+    with ThreadPoolExecutor(max_workers=max(workers, 1)) as pool:
+        for rel, src, (action, result) in pool.map(run, tasks.items()):
+            if action == "error":
+                report.errors.append(f"{rel}: {result}")
+                continue
+            size = src.stat().st_size
+            if action == "copied":
+                report.copied += 1
+                report.bytes_written += size
+            elif action == "linked":
+                report.linked += 1
+                report.bytes_saved += size
+            elif action == "skipped":
+                report.skipped += 1
+                report.bytes_saved += size
+            else:
+                report.kept += 1
+            if result is not None:
+                manifest[rel] = result
+
+    save_manifest(media, manifest)
+    return report
+
+
+def copy_seed_media(pairs=DEFAULT_PAIRS, force=False) -> int:
+    """
+    Compatibilidad: sincroniza y devuelve cuántos archivos se escribieron. Como
+    la copia de antes, un archivo que no se pudo escribir no pasa en silencio:
+    se registra y se lanza OSError (después de sincronizar el resto).
+    """
+    report = sync_seed_media(pairs, force=force)
+    for error in report.errors:
+        logger.error("No se pudo sincronizar %s", error)
+    if report.errors:
+        raise OSError(
+            f"{len(report.errors)} archivos semilla sin sincronizar "
+            f"(primero: {report.errors[0]})"
+        )
+    return report.written
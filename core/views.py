@@ -1 +1,20 @@
-# Create your views here.
+from django.core.exceptions import SuspiciousFileOperation
+from django.core.files.storage import default_storage
+from django.http import Http404
+from django.shortcuts import redirect
+from PIL import UnidentifiedImageError
+
+from core import thumbnails
+
+
+def thumbnail(request, width, fmt, name):
+    """Genera el derivado en la primera petición y redirige al archivo en MEDIA."""
+    try:
+        if not thumbnails.is_valid(name, width, fmt) or not default_storage.exists(
+            name
+        ):
+            raise Http404("Imagen no encontrada")
+        dst = thumbnails.generate(name, width, fmt)
+    except (SuspiciousFileOperation, UnidentifiedImageError, OSError):
+        raise Http404("Imagen no encontrada")
+    return redirect(default_storage.url(dst))
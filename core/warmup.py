@@ -0,0 +1,163 @@
+# core/warmup.py
+"""
+Warmup de un proceso recién arrancado: que la primera petición de cada worker
+no pague compilar plantillas, poblar el resolver de URLs ni llenar cachés.
+
+    from core import warmup
+    stats = warmup.run(caches=True, pages=False)
+
+  * templates(): compila todas las plantillas de los directorios de los
+    loaders (core/templates y los templates/ de cada app). Con el cached loader
+    (producción, ver TEMPLATES en settings) quedan en memoria del proceso; las
+    inclusion tags de home.html, blog_list.html... las encuentran ya compiladas.
+  * urls(): puebla el resolver (importa todos los urls.py y vistas) para cada
+    idioma de LANGUAGES y hace reverse() de cada ruta con nombre sin argumentos.
+  * prime_caches(): footer (por idioma), sidebar del blog y cabeceras de sección.
+  * prime_pages(): pide las rutas públicas (core/benchmark.py) por idioma para llenar
+    la caché de página; el host es WARMUP_HOST o el primero de ALLOWED_HOSTS.
+
+Se usa desde gunicorn.conf.py (post_fork, o una sola vez en el master con
+preload_app) y desde `manage.py warmup`. Con una caché local (LocMemCache)
+prime_caches()/prime_pages() solo sirven al proceso que las ejecuta: con
+preload_app gunicorn las llama en cada worker, no en el master.
+"""
+
+import logging
+import time
+from pathlib import Path
+
+from django.conf import settings
+from django.template import engines
+from django.template.backends.django import DjangoTemplates
+from django.urls import NoReverseMatch, get_resolver, reverse
+from django.utils import translation
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_SUFFIXES = (".html", ".txt", ".xml")
+
+
+def default_host():
+    """WARMUP_HOST o el primer host concreto de ALLOWED_HOSTS."""
+    if getattr(settings, "WARMUP_HOST", ""):
+        return settings.WARMUP_HOST
+    for host in settings.ALLOWED_HOSTS:
+        if host and host != "*":
+            return host.lstrip(".")
+    return "localhost"
+
+
+def _languages():
+    return [code for code, _ in settings.LANGUAGES] or [settings.LANGUAGE_CODE]
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Plantillas
+# ──────────────────────────────────────────────────────────────────────────────
+def _template_dirs(engine):
+    for loader in engine.template_loaders:
+        # El cached loader envuelve a los reales
+        for inner in getattr(loader, "loaders", [loader]):
+            yield from inner.get_dirs()
+
+
+def template_names(engine):
+    names = set()
+    for directory in _template_dirs(engine):
+        root = Path(directory)
+        if root.is_dir():
+            names.update(
+                path.relative_to(root).as_posix()
+                for path in root.rglob("*")
+                if path.suffix in TEMPLATE_SUFFIXES and path.is_file()
+            )
+    return sorted(names)
+
+
+def templates():
+    """Compila todas las plantillas; devuelve (compiladas, fallidas)."""
+    compiled = failed = 0
+    for backend in engines.all():
+        if not isinstance(backend, DjangoTemplates):
+            continue
+        for name in template_names(backend.engine):
+            try:
+                backend.engine.get_template(name)
+                compiled += 1
+            except Exception as exc:
+                # Plantillas sueltas de terceros que no se usan (o rotas): no
+                # impiden arrancar, se compilarán (y fallarán) al usarse
+                failed += 1
+                logger.warning("warmup: %s no compila: %s", name, exc)
+    return compiled, failed
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# URLs
+# ──────────────────────────────────────────────────────────────────────────────
+def urls():
+    """Puebla el resolver por idioma; devuelve cuántos reverse() se resolvieron."""
+    from core.benchmark import walk_routes
+
+    resolver = get_resolver()
+    routes = [name for name, _, params in walk_routes() if not params]
+    resolved = 0
+    for language in _languages():
+        with translation.override(language):
+            resolver.reverse_dict  # noqa: B018  (se calcula por idioma)
+            for name in routes:
+                try:
+                    reverse(name)
+                    resolved += 1
+                except NoReverseMatch:
+                    pass
+    return resolved
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Cachés
+# ──────────────────────────────────────────────────────────────────────────────
+def prime_caches():
+    from blog.sidebar import sidebar_context
+    from contenido.footer import get_footer
+    from inicio.section_headers import section_headers
+
+    sidebar_context()
+    section_headers()
+    for language in _languages():
+        with translation.override(language):
+            get_footer()
+    return ["blog_sidebar", "section_headers", "footer"]
+
+
+def prime_pages(host=None):
+    """GET anónimo a cada ruta pública por idioma; devuelve cuántas dieron 200."""
+    from django.test import Client
+
+    from core.benchmark import public_routes
+
+    client = Client(HTTP_HOST=host or default_host(), raise_request_exception=False)
+    ok = 0
+    paths = [url for _, url in public_routes() if url]
+    for language in _languages():
+        for path in paths:
+            # Sin cookies de la petición anterior (sesión/mensajes no se cachean)
+            client.cookies.clear()
+            response = client.get(path, HTTP_ACCEPT_LANGUAGE=language)
+            ok += response.status_code == 200
+    return ok
+
+
+def run(caches=False, pages=False):
+    """Plantillas + URLs y, si se pide, cachés y páginas. Devuelve estadísticas."""
+    started = time.perf_counter()
+    stats = {}
+    stats["templates"], stats["template_errors"] = templates()
+    stats["urls"] = urls()
+    if caches:
+        stats["caches"] = prime_caches()
+    if pages:
+        stats["pages"] = prime_pages()
+    stats["seconds"] = round(time.perf_counter() - started, 2)
+    logger.info("warmup: %s", stats)
+    return stats
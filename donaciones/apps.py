@@ -1,5 +1,4 @@
 from django.apps import AppConfig
-from django.db.models.signals import post_migrate
 
 
 class DonacionesConfig(AppConfig):
@@ -7,6 +6,4 @@ class DonacionesConfig(AppConfig):
     name = "donaciones"
 
     def ready(self):
-        from .seeders import _seed_donaciones_once
-
-        post_migrate.connect(_seed_donaciones_once, sender=self)
+        from . import seeders  # noqa: F401  (semillas, manage.py seed)
@@ -0,0 +1,31 @@
+# donaciones/management/commands/process_paypal_events.py
+import time
+
+from django.core.management.base import BaseCommand
+
+from donaciones import payments
+
+
+class Command(BaseCommand):
+    help = "Aplica los webhooks de PayPal recibidos (PayPalEvent sin procesar)"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="No termina: vuelve a mirar la cola cada --sleep segundos",
+        )
+        parser.add_argument("--sleep", type=float, default=5)
+        parser.add_argument("--batch-size", type=int, default=100)
+
+    def handle(self, *args, **opts):
+        try:
+            while True:
+                n = payments.process_pending_events(opts["batch_size"])
+                if n or opts["verbosity"] > 1:
+                    self.stdout.write(f"Eventos procesados: {n}")
+                if not opts["loop"]:
+                    return
+                time.sleep(opts["sleep"])
+        except KeyboardInterrupt:
+            self.stdout.write("Interrumpido")
@@ -0,0 +1,31 @@
+# donaciones/management/commands/reconcile_donations.py
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from donaciones import payments
+
+
+class Command(BaseCommand):
+    help = "Consulta a PayPal el estado de las donaciones pendientes antiguas"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than",
+            type=int,
+            default=30,
+            help="Minutos desde la creación para considerarla atascada (30)",
+        )
+        parser.add_argument(
+            "--workers", type=int, default=8, help="Consultas simultáneas a PayPal"
+        )
+        parser.add_argument("--limit", type=int, default=None)
+
+    def handle(self, *args, **opts):
+        stats = payments.reconcile(
+            older_than=timedelta(minutes=opts["older_than"]),
+            workers=opts["workers"],
+            limit=opts["limit"],
+        )
+        resumen = ", ".join(f"{k}: {v}" for k, v in sorted(stats.items())) or "nada"
+        self.stdout.write(self.style.SUCCESS(f"Donaciones reconciliadas → {resumen}"))
@@ -0,0 +1,84 @@
+# Generated by Django 5.2.3 on 2026-10-18 16:45
+
+from django.db import migrations, models
+
+
+def estado_desde_completado(apps, schema_editor):
+    Donacion = apps.get_model("donaciones", "Donacion")
+    Donacion.objects.filter(completado=True).update(estado="completada")
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("donaciones", "0007_alter_donacionesstatic_options"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="PayPalEvent",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("event_id", models.CharField(max_length=64, unique=True)),
+                ("event_type", models.CharField(max_length=64)),
+                (
+                    "resource_id",
+                    models.CharField(blank=True, default="", max_length=100),
+                ),
+                ("payload", models.JSONField()),
+                ("received_at", models.DateTimeField(auto_now_add=True)),
+                ("processed_at", models.DateTimeField(blank=True, null=True)),
+                ("error", models.TextField(blank=True, default="")),
+            ],
+            options={
+                "ordering": ["received_at", "id"],
+            },
+        ),
+        migrations.AddField(
+            model_name="donacion",
+            name="actualizado_en",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name="donacion",
+            name="estado",
+            field=models.CharField(
+                choices=[
+                    ("pendiente", "Pendiente"),
+                    ("completada", "Completada"),
+                    ("fallida", "Fallida"),
+                    ("cancelada", "Cancelada"),
+                    ("reembolsada", "Reembolsada"),
+                ],
+                default="pendiente",
+                max_length=12,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="donacion",
+            name="paypal_id",
+            field=models.CharField(
+                blank=True, db_index=True, max_length=100, null=True
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="donacion",
+            index=models.Index(
+                fields=["estado", "creado_en"], name="donacion_estado_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="paypalevent",
+            index=models.Index(
+                fields=["processed_at", "received_at"], name="paypal_event_todo_idx"
+            ),
+        ),
+        migrations.RunPython(estado_desde_completado, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.3 on 2026-10-18 17:35
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("donaciones", "0008_donacion_estado_paypalevent"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="paypalevent",
+            name="attempts",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name="paypalevent",
+            name="next_attempt_at",
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
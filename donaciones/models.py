@@ -1,5 +1,6 @@
 # apps/donaciones/models.py
 from django.db import models
+from django.utils import timezone
 
 
 class DonacionSection(models.Model):
@@ -76,12 +77,29 @@ class DonacionMonto(models.Model):
 
 
 class Donacion(models.Model):
+    class Estado(models.TextChoices):
+        PENDIENTE = "pendiente", "Pendiente"
+        COMPLETADA = "completada", "Completada"
+        FALLIDA = "fallida", "Fallida"
+        CANCELADA = "cancelada", "Cancelada"
+        REEMBOLSADA = "reembolsada", "Reembolsada"
+
     nombre = models.CharField(max_length=100)
     email = models.EmailField()
     monto = models.DecimalField(max_digits=10, decimal_places=2)
-    paypal_id = models.CharField(max_length=100, blank=True, null=True)
+    paypal_id = models.CharField(max_length=100, blank=True, null=True, db_index=True)
     creado_en = models.DateTimeField(auto_now_add=True)
     completado = models.BooleanField(default=False)
+    # Lo cambia solo donaciones/payments.py (transiciones idempotentes)
+    estado = models.CharField(
+        max_length=12, choices=Estado.choices, default=Estado.PENDIENTE
+    )
+    actualizado_en = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["estado", "creado_en"], name="donacion_estado_idx")
+        ]
 
 
 def __str__(self):
@@ -120,3 +138,33 @@ class DonacionesStatic(models.Model):
 
     def __str__(self):
         return self.titulo
+
+
+class PayPalEvent(models.Model):
+    """
+    Evento de webhook de PayPal tal como llegó (solo se añaden filas). El worker
+    `manage.py process_paypal_events` aplica su efecto y marca processed_at; si
+    falla se reintenta con espera exponencial (next_attempt_at) y, tras
+    PAYPAL_EVENT_MAX_ATTEMPTS intentos, se descarta (processed_at con error).
+    """
+
+    event_id = models.CharField(max_length=64, unique=True)
+    event_type = models.CharField(max_length=64)
+    resource_id = models.CharField(max_length=100, blank=True, default="")
+    payload = models.JSONField()
+    received_at = models.DateTimeField(auto_now_add=True)
+    processed_at = models.DateTimeField(null=True, blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    error = models.TextField(blank=True, default="")
+
+    class Meta:
+        ordering = ["received_at", "id"]
+        indexes = [
+            models.Index(
+                fields=["processed_at", "received_at"], name="paypal_event_todo_idx"
+            )
+        ]
+
+    def __str__(self):
+        return f"{self.event_type} {self.event_id}"
@@ -0,0 +1,274 @@
+# donaciones/payments.py
+"""
+Estado de las donaciones según PayPal, con transiciones idempotentes.
+
+El estado de una Donacion solo cambia aquí y siempre con un UPDATE condicionado
+al estado de partida (ALLOWED), así que aplicar dos veces el mismo evento (webhook
+repetido, reconciliación y retorno del navegador a la vez...) no tiene efecto:
+el correo de agradecimiento se encola una única vez.
+
+Fuentes, de más a menos inmediata:
+
+  * retorno del navegador (donacion_exitosa): ejecuta el pago (v1 execute);
+  * webhooks (views.paypal_webhook → PayPalEvent → process_pending_events,
+    desde `manage.py process_paypal_events`);
+  * `manage.py reconcile_donations`: consulta a PayPal las pendientes antiguas.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from decimal import Decimal, InvalidOperation
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .emails import send_thank_you_email
+from .models import Donacion, PayPalEvent
+from .paypal_utils import PayPalError, get_client
+
+logger = logging.getLogger("donaciones.payments")
+
+Estado = Donacion.Estado
+
+# estado destino → estados desde los que se puede llegar
+ALLOWED = {
+    Estado.COMPLETADA: (Estado.PENDIENTE, Estado.FALLIDA, Estado.CANCELADA),
+    Estado.FALLIDA: (Estado.PENDIENTE,),
+    Estado.CANCELADA: (Estado.PENDIENTE,),
+    Estado.REEMBOLSADA: (Estado.COMPLETADA,),
+}
+
+# Eventos de webhook (API v1 payments) que mueven el estado
+EVENT_STATES = {
+    "PAYMENT.SALE.COMPLETED": Estado.COMPLETADA,
+    "PAYMENT.SALE.DENIED": Estado.FALLIDA,
+    "PAYMENT.SALE.REFUNDED": Estado.REEMBOLSADA,
+    "PAYMENT.SALE.REVERSED": Estado.REEMBOLSADA,
+}
+
+# state de la venta (sale) → estado de la donación
+SALE_STATES = {
+    "completed": Estado.COMPLETADA,
+    "denied": Estado.FALLIDA,
+    "refunded": Estado.REEMBOLSADA,
+    "partially_refunded": Estado.REEMBOLSADA,
+}
+
+# Las URLs de aprobación de PayPal caducan a las 3 h
+APPROVAL_TTL = timedelta(hours=3)
+
+
+def transition(payment_id, estado):
+    """Lleva a `estado` las donaciones del pago que lo permitan. Devuelve cuántas."""
+    if not payment_id or estado not in ALLOWED:
+        return 0
+    with transaction.atomic():
+        donaciones = list(
+            Donacion.objects.select_for_update().filter(
+                paypal_id=payment_id, estado__in=ALLOWED[estado]
+            )
+        )
+        if not donaciones:
+            return 0
+        Donacion.objects.filter(pk__in=[d.pk for d in donaciones]).update(
+            estado=estado,
+            completado=estado == Estado.COMPLETADA,
+            actualizado_en=timezone.now(),
+        )
+        if estado == Estado.COMPLETADA:
+            for donacion in donaciones:
+                send_thank_you_email(donacion)
+    logger.info("Pago %s → %s (%s donaciones)", payment_id, estado, len(donaciones))
+    return len(donaciones)
+
+
+def state_from_payment(payment):
+    """Estado de la donación según un pago v1 (None si aún no hay nada que aplicar)."""
+    if payment.get("state") == "failed":
+        return Estado.FALLIDA
+    for tx in payment.get("transactions", []):
+        for related in tx.get("related_resources", []):
+            sale = related.get("sale")
+            if sale and sale.get("state") in SALE_STATES:
+                return SALE_STATES[sale["state"]]
+    return None
+
+
+def _payer_id(payment):
+    return (payment.get("payer") or {}).get("payer_info", {}).get("payer_id")
+
+
+def amount_matches(payment, donacion):
+    """True si el primer importe del pago es el de la donación (total y moneda)."""
+    try:
+        amount = payment["transactions"][0]["amount"]
+        total = Decimal(amount["total"])
+    except (KeyError, IndexError, TypeError, InvalidOperation):
+        return False
+    return (
+        total == donacion.monto and amount.get("currency") == settings.PAYPAL_CURRENCY
+    )
+
+
+def confirm_return(donacion_id, payment_id, payer_id):
+    """
+    Retorno del comprador desde PayPal: ejecuta el pago aprobado y aplica el
+    resultado. Si PayPal falla, la donación sigue pendiente (la resolverán el
+    webhook o reconcile_donations).
+
+    Solo se acepta el pago que la vista guardó al crear la donación: un paymentId
+    de la URL que no sea ese, o un importe ejecutado distinto del de la donación,
+    no cambian nada.
+    """
+    donacion = Donacion.objects.filter(pk=donacion_id, paypal_id=payment_id).first()
+    if donacion is None:
+        logger.warning("Retorno de PayPal con pago ajeno a la donación %s", donacion_id)
+        return None
+    try:
+        payment = get_client().execute_payment(payment_id, payer_id)
+    except PayPalError as exc:
+        logger.warning("No se pudo ejecutar el pago %s: %s", payment_id, exc)
+        return None
+    if not amount_matches(payment, donacion):
+        logger.error(
+            "El pago %s no corresponde al importe de la donación %s (%s %s)",
+            payment_id,
+            donacion.pk,
+            donacion.monto,
+            settings.PAYPAL_CURRENCY,
+        )
+        return None
+    estado = state_from_payment(payment)
+    transition(payment_id, estado)
+    return estado
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Webhooks
+# ──────────────────────────────────────────────────────────────────────────────
+def store_event(event):
+    """Guarda el evento (una sola vez por id). False si ya se había recibido."""
+    resource = event.get("resource") or {}
+    _, created = PayPalEvent.objects.get_or_create(
+        event_id=event["id"],
+        defaults={
+            "event_type": event.get("event_type", ""),
+            "resource_id": resource.get("parent_payment") or resource.get("id") or "",
+            "payload": event,
+        },
+    )
+    return created
+
+
+def process_event(event):
+    estado = EVENT_STATES.get(event.event_type)
+    if estado is not None:
+        transition(event.resource_id, estado)
+
+
+def retry_delay(attempts):
+    """Espera antes de reintentar un evento que ha fallado `attempts` veces."""
+    base = getattr(settings, "PAYPAL_EVENT_RETRY_DELAY", 30)
+    cap = getattr(settings, "PAYPAL_EVENT_RETRY_MAX_DELAY", 3600)
+    return timedelta(seconds=min(base * 2 ** (attempts - 1), cap))
+
+
+def _fail(event, error, max_attempts):
+    # processed_at sigue vacío (se reintenta) salvo al agotar los intentos
+    event.attempts += 1
+    event.error = f"{type(error).__name__}: {error}"[:2000]
+    if event.attempts >= max_attempts:
+        event.processed_at = timezone.now()
+        logger.error(
+            "Evento %s descartado tras %s intentos: %s",
+            event.event_id,
+            event.attempts,
+            event.error,
+        )
+    else:
+        event.next_attempt_at = timezone.now() + retry_delay(event.attempts)
+
+
+def process_pending_events(batch_size=100, max_attempts=None):
+    """
+    Aplica los eventos sin procesar y vencidos, en orden de llegada. Un fallo
+    (también de BD o de bloqueo) no consume el evento: se reintenta más tarde.
+    Devuelve cuántos se han intentado.
+    """
+    max_attempts = max_attempts or getattr(settings, "PAYPAL_EVENT_MAX_ATTEMPTS", 8)
+    done = 0
+    while True:
+        with transaction.atomic():
+            events = list(
+                PayPalEvent.objects.select_for_update(skip_locked=True).filter(
+                    processed_at__isnull=True, next_attempt_at__lte=timezone.now()
+                )[:batch_size]
+            )
+            for event in events:
+                try:
+                    with transaction.atomic():
+                        process_event(event)
+                except Exception as exc:
+                    logger.exception("Error aplicando el evento %s", event.event_id)
+                    _fail(event, exc, max_attempts)
+                else:
+                    event.error = ""
+                    event.processed_at = timezone.now()
+            PayPalEvent.objects.bulk_update(
+                events, ["processed_at", "attempts", "next_attempt_at", "error"]
+            )
+        done += len(events)
+        if len(events) < batch_size:
+            return done
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Reconciliación
+# ──────────────────────────────────────────────────────────────────────────────
+def stale_donations(older_than, limit=None):
+    qs = Donacion.objects.filter(
+        estado=Estado.PENDIENTE,
+        paypal_id__isnull=False,
+        creado_en__lte=timezone.now() - older_than,
+    ).order_by("creado_en")
+    return qs[:limit] if limit else qs
+
+
+def _check(donacion):
+    """(payment_id, estado a aplicar o None). Corre en un hilo: no toca la BD."""
+    client = get_client()
+    payment = client.get_payment(donacion.paypal_id)
+    estado = state_from_payment(payment)
+    if estado is None and payment.get("state") == "created":
+        # Aprobado pero el navegador nunca volvió: se ejecuta desde aquí
+        payer_id = _payer_id(payment)
+        if payer_id:
+            estado = state_from_payment(
+                client.execute_payment(donacion.paypal_id, payer_id)
+            )
+        elif timezone.now() - donacion.creado_en > APPROVAL_TTL:
+            estado = Estado.CANCELADA
+    return donacion.paypal_id, estado
+
+
+def reconcile(older_than=timedelta(minutes=30), workers=8, limit=None):
+    """
+    Consulta a PayPal en paralelo (workers hilos, mismo pool HTTP) las donaciones
+    pendientes más antiguas que older_than. Devuelve {estado: n, "error": n}.
+    """
+    stats = {}
+    donaciones = list(stale_donations(older_than, limit))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(_check, d) for d in donaciones]
+        for future in futures:
+            try:
+                payment_id, estado = future.result()
+            except PayPalError as exc:
+                logger.warning("Reconciliación: %s", exc)
+                stats["error"] = stats.get("error", 0) + 1
+                continue
+            if estado and transition(payment_id, estado):
+                stats[estado] = stats.get(estado, 0) + 1
+    return stats
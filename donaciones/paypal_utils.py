@@ -1,83 +1,414 @@
-from decouple import config
+# donaciones/paypal_utils.py
+"""
+Cliente de la API REST de PayPal para las donaciones.
+
+Un único PayPalClient por proceso (get_client) que:
+
+  * reutiliza las conexiones HTTPS (requests.Session con pool);
+  * pide el token OAuth una sola vez mientras sea válido (`expires_in`), en
+    memoria del proceso y en la caché compartida para el resto de workers;
+  * nunca espera indefinidamente (PAYPAL_TIMEOUT = (conexión, lectura));
+  * reintenta errores 5xx / de red con espera exponencial + jitter; los POST
+    llevan PayPal-Request-Id, así que un reintento no duplica el pago;
+  * registra la latencia de cada llamada en el logger "donaciones.paypal"
+    (extra={"paypal": {...}} para quien quiera agregarlo).
+
+    success, payment_id, approval_url = make_paypal_payment(monto, "USD", ok, cancel)
+
+Las vistas async (modo ASGI) usan las variantes a* (aaccess_token, acall,
+acreate_payment, amake_paypal_payment): mismo token, reintentos y registro, pero
+con httpx.AsyncClient (uno por event loop), así esperar a PayPal no ocupa un hilo.
+Solo tienen sentido con el loop de larga vida de un worker ASGI: bajo WSGI cada
+async_to_sync crea (y cierra) un loop y con él un cliente sin reutilizar.
+"""
+
+import asyncio
+import hashlib
+import logging
+import random
+import threading
+import time
+import uuid
+import weakref
+
+import httpx
 import requests
-import json
+from django.conf import settings
+from django.core.cache import cache
+from requests.adapters import HTTPAdapter
 
+logger = logging.getLogger("donaciones.paypal")
 
-def make_paypal_payment(amount, currency, return_url, cancel_url):
-    # Set up PayPal API credentials
-    client_id = config("PAYPAL_ID")
-    secret = config("PAYPAL_SECRET")
-    url = config("PAYPAL_BASE_URL")
-    # Set up API endpoints
-    base_url = url
-    token_url = base_url + "/v1/oauth2/token"
-    payment_url = base_url + "/v1/payments/payment"
-
-    # Request an access token
-    token_payload = {"grant_type": "client_credentials"}
-    token_headers = {"Accept": "application/json", "Accept-Language": "en_US"}
-    token_response = requests.post(
-        token_url, auth=(client_id, secret), data=token_payload, headers=token_headers
-    )
-
-    if token_response.status_code != 200:
-        # Log the error for debugging
-        print(
-            f"PayPal API authentication failed: {token_response.status_code} - {token_response.text}"
+TOKEN_KEY = "paypal:token:{client}"
+TOKEN_MARGIN = 60  # s antes de `expires_in` en que se renueva el token
+RETRY_STATUSES = {500, 502, 503, 504}
+
+
+class PayPalError(Exception):
+    def __init__(self, message, status=None, body=None):
+        super().__init__(message)
+        self.status = status
+        self.body = body
+
+
+class PayPalClient:
+    def __init__(
+        self,
+        client_id,
+        secret,
+        base_url,
+        timeout=(3.05, 15),
+        retries=2,
+        backoff=0.5,
+        pool_size=10,
+        session=None,
+    ):
+        self.client_id = client_id
+        self.secret = secret
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.pool_size = pool_size
+        self.session = session or requests.Session()
+        self._async_sessions = weakref.WeakKeyDictionary()  # event loop → AsyncClient
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=pool_size)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self._token = None  # (access_token, expira_en epoch)
+        self._lock = threading.Lock()
+        client = hashlib.sha256(f"{base_url}|{client_id}".encode()).hexdigest()[:16]
+        self._cache_key = TOKEN_KEY.format(client=client)
+
+    # ── Token OAuth ───────────────────────────────────────────────────────────
+    def access_token(self):
+        token = self._token
+        if token and token[1] > time.time():
+            return token[0]
+        with self._lock:
+            token = self._token
+            if token and token[1] > time.time():
+                return token[0]
+            token = cache.get(self._cache_key)
+            if not token or token[1] <= time.time():
+                token = self._fetch_token()
+                cache.set(
+                    self._cache_key, token, timeout=max(int(token[1] - time.time()), 1)
+                )
+            self._token = token
+            return token[0]
+
+    async def aaccess_token(self):
+        token = self._token
+        if token and token[1] > time.time():
+            return token[0]
+        # Sin lock: dos peticiones simultáneas pueden pedir token a la vez (inocuo)
+        token = await cache.aget(self._cache_key)
+        if not token or token[1] <= time.time():
+            method, path, op, kwargs = self._token_request()
+            token = self._parse_token(await self._arequest(method, path, op, **kwargs))
+            await cache.aset(
+                self._cache_key, token, timeout=max(int(token[1] - time.time()), 1)
+            )
+        self._token = token
+        return token[0]
+
+    def _token_request(self):
+        return (
+            "POST",
+            "/v1/oauth2/token",
+            "token",
+            {
+                "auth": (self.client_id, self.secret),
+                "data": {"grant_type": "client_credentials"},
+                "headers": {"Accept": "application/json", "Accept-Language": "en_US"},
+            },
         )
-        return False, "Failed to authenticate with PayPal API", None
 
-    try:
-        access_token = token_response.json()["access_token"]
-    except KeyError:
-        print(
-            f"Failed to get access token from PayPal API response: {token_response.text}"
+    def _fetch_token(self):
+        method, path, op, kwargs = self._token_request()
+        return self._parse_token(self._request(method, path, op, **kwargs))
+
+    @staticmethod
+    def _parse_token(response):
+        try:
+            data = response.json()
+            expires_at = time.time() + int(data.get("expires_in", 0)) - TOKEN_MARGIN
+            return data["access_token"], expires_at
+        except (ValueError, KeyError):
+            raise PayPalError(
+                "Respuesta de token inválida", response.status_code, response.text
+            )
+
+    def invalidate_token(self):
+        self._token = None
+        cache.delete(self._cache_key)
+
+    # ── HTTP ──────────────────────────────────────────────────────────────────
+    def _request(self, method, path, op, **kwargs):
+        url = self.base_url + path
+        attempt = 0
+        while True:
+            attempt += 1
+            start = time.perf_counter()
+            try:
+                response = self.session.request(
+                    method, url, timeout=self.timeout, **kwargs
+                )
+                error = None
+            except requests.RequestException as exc:
+                # Cualquier fallo de requests acaba en PayPalError; solo los de
+                # conexión/timeout se reintentan (ChunkedEncodingError,
+                # TooManyRedirects... no se arreglan repitiendo)
+                response, error = None, exc
+            retryable = isinstance(error, (requests.ConnectionError, requests.Timeout))
+            if not self._should_retry(op, path, response, start, attempt, retryable):
+                break
+            # Espera exponencial con jitter completo
+            time.sleep(self._delay(attempt))
+        return self._result(op, response, error)
+
+    async def _arequest(self, method, path, op, **kwargs):
+        url = self.base_url + path
+        attempt = 0
+        while True:
+            attempt += 1
+            start = time.perf_counter()
+            try:
+                response = await self._async_session().request(method, url, **kwargs)
+                error = None
+            except httpx.RequestError as exc:
+                response, error = None, exc
+            retryable = isinstance(error, httpx.TransportError)
+            if not self._should_retry(op, path, response, start, attempt, retryable):
+                break
+            await asyncio.sleep(self._delay(attempt))
+        return self._result(op, response, error)
+
+    def _async_session(self):
+        loop = asyncio.get_running_loop()
+        session = self._async_sessions.get(loop)
+        if session is None:
+            connect, read = self.timeout
+            session = httpx.AsyncClient(
+                timeout=httpx.Timeout(read, connect=connect),
+                limits=httpx.Limits(max_connections=self.pool_size),
+            )
+            self._async_sessions[loop] = session
+        return session
+
+    def _should_retry(self, op, path, response, start, attempt, retryable=True):
+        """Registra la llamada; True si hay que reintentarla."""
+        status = response.status_code if response is not None else None
+        ms = (time.perf_counter() - start) * 1000
+        logger.info(
+            "paypal %s %s → %s en %.0f ms (intento %s)",
+            op,
+            path,
+            status or "error",
+            ms,
+            attempt,
+            extra={
+                "paypal": {
+                    "op": op,
+                    "status": status,
+                    "ms": round(ms, 1),
+                    "attempt": attempt,
+                }
+            },
         )
-        return False, "Failed to get access token", None
+        retry = retryable if status is None else status in RETRY_STATUSES
+        return retry and attempt <= self.retries
 
-    # Create payment payload
-    payment_payload = {
-        "intent": "sale",
-        "payer": {"payment_method": "paypal"},
-        "transactions": [
-            {
-                "amount": {"total": str(amount), "currency": currency},
-                "description": "Donación para Chambalabamba",  # Updated description
-            }
-        ],
-        "redirect_urls": {"return_url": return_url, "cancel_url": cancel_url},
-    }
-
-    # Create payment request
-    payment_headers = {
-        "Content-Type": "application/json",
-        "Authorization": f"Bearer {access_token}",
-    }
-
-    payment_response = requests.post(
-        payment_url, data=json.dumps(payment_payload), headers=payment_headers
-    )
-    print(
-        f"PayPal payment creation response: {payment_response.text}"
-    )  # Log the full response
-
-    if payment_response.status_code != 201:
-        print(
-            f"Failed to create PayPal payment: {payment_response.status_code} - {payment_response.text}"
+    def _delay(self, attempt):
+        return random.uniform(0, self.backoff * 2 ** (attempt - 1))
+
+    @staticmethod
+    def _result(op, response, error):
+        if response is None:
+            raise PayPalError(f"PayPal no responde ({op}): {error}")
+        status = response.status_code
+        if status >= 400:
+            raise PayPalError(
+                f"PayPal {op}: HTTP {status}", status=status, body=response.text
+            )
+        return response
+
+    @staticmethod
+    def _json(response, op):
+        try:
+            return response.json()
+        except ValueError:
+            raise PayPalError(
+                f"PayPal {op}: respuesta no es JSON",
+                response.status_code,
+                response.text,
+            )
+
+    def call(self, method, path, op, json=None, request_id=None):
+        """Llamada autenticada a la API; renueva el token una vez si caducó (401)."""
+        headers = self._headers(method, request_id)
+        for renewed in (False, True):
+            headers["Authorization"] = f"Bearer {self.access_token()}"
+            try:
+                return self._request(method, path, op, json=json, headers=headers)
+            except PayPalError as exc:
+                if exc.status != 401 or renewed:
+                    raise
+                self.invalidate_token()
+
+    async def acall(self, method, path, op, json=None, request_id=None):
+        headers = self._headers(method, request_id)
+        for renewed in (False, True):
+            headers["Authorization"] = f"Bearer {await self.aaccess_token()}"
+            try:
+                return await self._arequest(
+                    method, path, op, json=json, headers=headers
+                )
+            except PayPalError as exc:
+                if exc.status != 401 or renewed:
+                    raise
+                self._token = None
+                await cache.adelete(self._cache_key)
+
+    @staticmethod
+    def _headers(method, request_id):
+        headers = {"Content-Type": "application/json"}
+        if method == "POST":
+            # Idempotencia: los reintentos del mismo POST no duplican la operación
+            headers["PayPal-Request-Id"] = request_id or str(uuid.uuid4())
+        return headers
+
+    # ── Pagos (API v1/payments) ───────────────────────────────────────────────
+    @staticmethod
+    def _payment(amount, currency, return_url, cancel_url):
+        return {
+            "intent": "sale",
+            "payer": {"payment_method": "paypal"},
+            "transactions": [
+                {
+                    "amount": {"total": str(amount), "currency": currency},
+                    "description": "Donación para Chambalabamba",
+                }
+            ],
+            "redirect_urls": {"return_url": return_url, "cancel_url": cancel_url},
+        }
+
+    def create_payment(self, amount, currency, return_url, cancel_url, request_id=None):
+        response = self.call(
+            "POST",
+            "/v1/payments/payment",
+            op="create_payment",
+            json=self._payment(amount, currency, return_url, cancel_url),
+            request_id=request_id,
+        )
+        return self._json(response, "create_payment")
+
+    async def acreate_payment(
+        self, amount, currency, return_url, cancel_url, request_id=None
+    ):
+        response = await self.acall(
+            "POST",
+            "/v1/payments/payment",
+            op="create_payment",
+            json=self._payment(amount, currency, return_url, cancel_url),
+            request_id=request_id,
+        )
+        return self._json(response, "create_payment")
+
+    def get_payment(self, payment_id):
+        response = self.call(
+            "GET", f"/v1/payments/payment/{payment_id}", op="get_payment"
+        )
+        return self._json(response, "get_payment")
+
+    def execute_payment(self, payment_id, payer_id):
+        response = self.call(
+            "POST",
+            f"/v1/payments/payment/{payment_id}/execute",
+            op="execute_payment",
+            json={"payer_id": payer_id},
+            request_id=f"execute-{payment_id}",
+        )
+        return self._json(response, "execute_payment")
+
+    # ── Webhooks ──────────────────────────────────────────────────────────────
+    def verify_webhook(self, headers, event, webhook_id):
+        """True si PayPal confirma la firma del evento recibido con esas cabeceras."""
+        payload = {
+            "auth_algo": headers.get("Paypal-Auth-Algo"),
+            "cert_url": headers.get("Paypal-Cert-Url"),
+            "transmission_id": headers.get("Paypal-Transmission-Id"),
+            "transmission_sig": headers.get("Paypal-Transmission-Sig"),
+            "transmission_time": headers.get("Paypal-Transmission-Time"),
+            "webhook_id": webhook_id,
+            "webhook_event": event,
+        }
+        if not all(payload.values()):
+            return False
+        response = self.call(
+            "POST",
+            "/v1/notifications/verify-webhook-signature",
+            op="verify_webhook",
+            json=payload,
+        )
+        result = self._json(response, "verify_webhook")
+        return result.get("verification_status") == "SUCCESS"
+
+
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client():
+    """Cliente compartido del proceso, configurado desde settings.PAYPAL_*."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = PayPalClient(
+                    settings.PAYPAL_CLIENT_ID,
+                    settings.PAYPAL_SECRET,
+                    settings.PAYPAL_BASE_URL,
+                    timeout=(
+                        settings.PAYPAL_CONNECT_TIMEOUT,
+                        settings.PAYPAL_READ_TIMEOUT,
+                    ),
+                    retries=settings.PAYPAL_RETRIES,
+                )
+    return _client
+
+
+def make_paypal_payment(amount, currency, return_url, cancel_url):
+    """Crea el pago. Devuelve (True, payment_id, approval_url) o (False, error, None)."""
+    try:
+        payment = get_client().create_payment(amount, currency, return_url, cancel_url)
+    except PayPalError as exc:
+        logger.error("No se pudo crear el pago en PayPal: %s %s", exc, exc.body or "")
+        return False, "Failed to create PayPal payment.", None
+    return _approval(payment)
+
+
+async def amake_paypal_payment(amount, currency, return_url, cancel_url):
+    """make_paypal_payment para vistas async."""
+    try:
+        payment = await get_client().acreate_payment(
+            amount, currency, return_url, cancel_url
         )
+    except PayPalError as exc:
+        logger.error("No se pudo crear el pago en PayPal: %s %s", exc, exc.body or "")
         return False, "Failed to create PayPal payment.", None
+    return _approval(payment)
+
 
+def _approval(payment):
     try:
-        payment_id = payment_response.json()["id"]
+        payment_id = payment["id"]
         approval_url = next(
-            link["href"]
-            for link in payment_response.json()["links"]
-            if link["rel"] == "approval_url"
+            link["href"] for link in payment["links"] if link["rel"] == "approval_url"
         )
     except (KeyError, StopIteration):
-        print(
-            f"Failed to extract approval URL from PayPal payment response: {payment_response.text}"
-        )
+        logger.error("Respuesta de PayPal sin approval_url: %s", payment)
         return False, "Failed to get approval URL", None
 
     return True, payment_id, approval_url
@@ -1,78 +1,17 @@
-from django.core.management import call_command
-from django.db import connection, transaction
+# donaciones/seeders.py
 from pathlib import Path
 
-# Define the seeds for the donaciones app
-SEEDS = [
-    ("donaciones_defaults.json", "donaciones:defaults:v3"),
-    ("donaciones_home_callout.json", "donaciones:home_callout:v1"),
-    ("donaciones_static_default.json", "donaciones:static_default:v1"),
-]
+from core.seeding import register_seed
 
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
 
-def _seed_donaciones_once(sender, **kwargs):
-    # Check if the signal is for the 'donaciones' app
-    if sender.label != "donaciones":
-        return
-
-    base_dir = Path(__file__).resolve().parent
-    with connection.cursor() as cur, transaction.atomic():
-        # Create the seed_run table if it doesn't exist
-        cur.execute("CREATE TABLE IF NOT EXISTS seed_run(tag TEXT PRIMARY KEY)")
-
-        for filename, tag in SEEDS:
-            # Check if the seed has already been run
-            cur.execute("SELECT 1 FROM seed_run WHERE tag=%s", [tag])
-            if cur.fetchone():
-                print(f"[seed_donaciones] Seed '{tag}' already run, skipping.")
-                continue
-
-            fixture_path = base_dir / "fixtures" / filename
-            if not fixture_path.exists():
-                print(
-                    f"[seed_donaciones] Skipped: Fixture '{fixture_path}' does not exist."
-                )
-                continue
-
-            # Load the fixture
-            call_command("loaddata", str(fixture_path), verbosity=0)
-            print(f"[seed_donaciones] Loaded fixture: {fixture_path.name}")
-
-            # Record the tag as run
-            cur.execute("INSERT INTO seed_run(tag) VALUES(%s)", [tag])
-            print(f"[seed_donaciones] Marked '{tag}' as run.")
-
-    print("[seed_donaciones] Seeding process completed.")
-
-
-# Note: The actual mechanism to trigger _seed_donaciones_once (e.g., using Django signals)
-# would need to be set up elsewhere, typically in the app's AppConfig.
-# For this example, we'll assume it's handled.
-# If you are running this script manually, you would call seed_donaciones() directly.
-# However, the user's request implies a more automated seeding process like in 'nosotros'.
-# To mimic 'nosotros', we'd need to connect this to a signal.
-# For now, we'll keep the function definition.
-# If you want to run this manually, you can call seed_donaciones() after migrations.
-
-# The original seed_donaciones function is replaced by the fixture-based logic.
-# If you need to run this manually, you would call _seed_donaciones_once after migrations.
-# For demonstration purposes, we'll keep the function name consistent if possible,
-# but the logic is now fixture-based.
-
-# Let's redefine seed_donaciones to call the fixture logic,
-# assuming it's meant to be called directly or via a management command.
-# If it's meant to be triggered by a signal, the structure would be different.
-
-# For simplicity and to match the user's request for a fixture approach,
-# we'll make seed_donaciones call the fixture loading logic.
-# In a real app, this might be handled by a custom management command or a signal.
-
-
-def seed_donaciones():
-    _seed_donaciones_once(
-        sender=None, kwargs={}
-    )  # Pass dummy sender/kwargs if not using signals
-
-
-# If you want to run this manually, you can call seed_donaciones() after migrations.
-# Example: python manage.py runscript seed_donaciones
+register_seed("donaciones:defaults", 3, [FIXTURES / "donaciones_defaults.json"])
+register_seed(
+    "donaciones:home_callout",
+    1,
+    [FIXTURES / "donaciones_home_callout.json"],
+    depends=["donaciones:defaults"],
+)
+register_seed(
+    "donaciones:static_default", 1, [FIXTURES / "donaciones_static_default.json"]
+)
@@ -1 +1,301 @@
-# Create your tests here.
+import json
+import threading
+from datetime import timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import AsyncMock, patch
+
+import requests
+from asgiref.sync import async_to_sync
+
+from django.core.cache import cache
+from django.db import DatabaseError
+from django.test import AsyncRequestFactory, SimpleTestCase, TestCase
+from django.urls import reverse
+from django.utils import timezone
+
+from core.models import OutboundEmail
+
+from . import payments, views
+from .models import Donacion, PayPalEvent
+from .paypal_utils import PayPalClient, PayPalError
+
+
+class _StubPayPal(BaseHTTPRequestHandler):
+    """Imita /v1/oauth2/token y /v1/payments/payment; `fail` = 503 pendientes."""
+
+    def log_message(self, *args):
+        pass
+
+    def _json(self, status, data):
+        body = json.dumps(data).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        server = self.server
+        self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if self.path == "/v1/oauth2/token":
+            server.tokens += 1
+            return self._json(200, {"access_token": "tok", "expires_in": 32400})
+        server.request_ids.append(self.headers.get("PayPal-Request-Id"))
+        if server.fail:
+            server.fail -= 1
+            return self._json(503, {"name": "SERVICE_UNAVAILABLE"})
+        return self._json(
+            201,
+            {
+                "id": "PAY-1",
+                "links": [{"rel": "approval_url", "href": "https://paypal/approve"}],
+            },
+        )
+
+
+class PayPalClientTests(SimpleTestCase):
+    def setUp(self):
+        cache.clear()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _StubPayPal)
+        self.server.tokens, self.server.fail, self.server.request_ids = 0, 0, []
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        host, port = self.server.server_address
+        self.client = PayPalClient("id", "secret", f"http://{host}:{port}", backoff=0)
+
+    def _create(self):
+        return self.client.create_payment("10", "USD", "http://ok", "http://ko")
+
+    def test_token_is_reused_across_payments(self):
+        self._create()
+        self._create()
+        self.assertEqual(self.server.tokens, 1)
+        # Otro proceso (otro cliente) lo toma de la caché compartida
+        other = PayPalClient("id", "secret", self.client.base_url)
+        other.access_token()
+        self.assertEqual(self.server.tokens, 1)
+
+    def test_retries_5xx_with_same_request_id(self):
+        self.server.fail = 2
+        self.assertEqual(self._create()["id"], "PAY-1")
+        ids = self.server.request_ids
+        self.assertEqual(len(ids), 3)
+        self.assertEqual(len(set(ids)), 1)
+
+        self.server.fail = 3
+        with self.assertRaises(PayPalError) as ctx:
+            self._create()
+        self.assertEqual(ctx.exception.status, 503)
+
+    def test_request_errors_become_paypal_errors(self):
+        session = self.client.session
+        with patch.object(
+            session, "request", side_effect=requests.exceptions.ChunkedEncodingError()
+        ) as request:
+            with self.assertRaises(PayPalError):
+                self._create()
+        self.assertEqual(request.call_count, 1)  # no se reintenta
+
+        with patch.object(
+            session, "request", side_effect=requests.ConnectionError()
+        ) as request:
+            with self.assertRaises(PayPalError):
+                self._create()
+        self.assertEqual(request.call_count, 3)  # 1 + PAYPAL_RETRIES
+
+    def test_async_client_retries_and_reuses_token(self):
+        create = async_to_sync(self.client.acreate_payment)
+        self.server.fail = 1
+        self.assertEqual(create("10", "USD", "http://ok", "http://ko")["id"], "PAY-1")
+        self.assertEqual(create("10", "USD", "http://ok", "http://ko")["id"], "PAY-1")
+        # El token del cliente síncrono y del async es el mismo (caché compartida)
+        self._create()
+        self.assertEqual(self.server.tokens, 1)
+        ids = self.server.request_ids
+        self.assertEqual(len(ids), 4)
+        self.assertEqual(ids[0], ids[1])
+
+
+class DonacionPayPalViewTests(TestCase):
+    def _check(self, response, make_payment):
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(response.url, "https://paypal/approve")
+        donacion = Donacion.objects.get()
+        self.assertEqual(donacion.paypal_id, "PAY-9")
+        self.assertIn(f"custom_id={donacion.pk}", make_payment.call_args.args[2])
+
+    @patch("donaciones.views.make_paypal_payment")
+    def test_sync_view_saves_payment_and_redirects(self, make_payment):
+        # Fuera de ASGI_MODE la URL usa la vista síncrona
+        make_payment.return_value = (True, "PAY-9", "https://paypal/approve")
+        response = self.client.post(
+            reverse("donacion_paypal"), {"amount": "15", "first_name": "Ana"}
+        )
+        self._check(response, make_payment)
+
+    @patch("donaciones.views.amake_paypal_payment", new_callable=AsyncMock)
+    def test_async_view_saves_payment_and_redirects(self, make_payment):
+        make_payment.return_value = (True, "PAY-9", "https://paypal/approve")
+        request = AsyncRequestFactory().post(
+            reverse("donacion_paypal"), {"amount": "15", "first_name": "Ana"}
+        )
+        response = async_to_sync(views.adonacion_paypal)(request)
+        self._check(response, make_payment)
+
+
+class _FakeClient:
+    def __init__(self, payments=None, verified=True, executed=None):
+        self.payments = payments or {}
+        self.verified = verified
+        self.executed = executed
+
+    def verify_webhook(self, headers, event, webhook_id):
+        return self.verified
+
+    def get_payment(self, payment_id):
+        return self.payments[payment_id]
+
+    def execute_payment(self, payment_id, payer_id):
+        if self.executed is not None:
+            return self.executed
+        return {"state": "approved", "transactions": [_sale("completed")]}
+
+
+def _sale(state):
+    return {"related_resources": [{"sale": {"state": state}}]}
+
+
+class PayPalReconciliationTests(TestCase):
+    def setUp(self):
+        self.donacion = Donacion.objects.create(
+            nombre="Ana", email="ana@example.com", monto=10, paypal_id="PAY-1"
+        )
+        self.event = {
+            "id": "WH-1",
+            "event_type": "PAYMENT.SALE.COMPLETED",
+            "resource": {"id": "SALE-1", "parent_payment": "PAY-1"},
+        }
+
+    def _post(self, client):
+        with patch("donaciones.views.get_client", return_value=client):
+            return self.client.post(
+                reverse("paypal_webhook"),
+                json.dumps(self.event),
+                content_type="application/json",
+            )
+
+    def test_webhook_is_stored_once_and_applied_idempotently(self):
+        self.assertEqual(self._post(_FakeClient()).status_code, 200)
+        self.assertEqual(self._post(_FakeClient()).status_code, 200)
+        self.assertEqual(PayPalEvent.objects.count(), 1)
+        self.donacion.refresh_from_db()
+        self.assertEqual(self.donacion.estado, Donacion.Estado.PENDIENTE)
+
+        self.assertEqual(payments.process_pending_events(), 1)
+        self.assertEqual(payments.process_pending_events(), 0)
+        # Mismo efecto llegando otra vez por otra vía: sin segundo correo
+        payments.transition("PAY-1", Donacion.Estado.COMPLETADA)
+
+        self.donacion.refresh_from_db()
+        self.assertEqual(self.donacion.estado, Donacion.Estado.COMPLETADA)
+        self.assertTrue(self.donacion.completado)
+        self.assertEqual(OutboundEmail.objects.count(), 1)
+
+    def test_failed_event_is_retried_then_discarded(self):
+        payments.store_event(self.event)
+        event = PayPalEvent.objects.get()
+        with patch.object(payments, "transition", side_effect=DatabaseError("lock")):
+            self.assertEqual(payments.process_pending_events(max_attempts=2), 1)
+            event.refresh_from_db()
+            self.assertIsNone(event.processed_at)
+            self.assertEqual(event.attempts, 1)
+            self.assertIn("lock", event.error)
+            # Espera a next_attempt_at
+            self.assertEqual(payments.process_pending_events(max_attempts=2), 0)
+
+            PayPalEvent.objects.update(next_attempt_at=timezone.now())
+            payments.process_pending_events(max_attempts=2)
+            event.refresh_from_db()
+            self.assertIsNotNone(event.processed_at)
+            self.assertEqual(event.attempts, 2)
+
+        # Un fallo pasajero seguido de éxito aplica el evento
+        PayPalEvent.objects.update(
+            processed_at=None, attempts=0, next_attempt_at=timezone.now()
+        )
+        with patch.object(
+            payments, "transition", side_effect=[DatabaseError("lock"), 1]
+        ):
+            payments.process_pending_events()
+            PayPalEvent.objects.update(next_attempt_at=timezone.now())
+            payments.process_pending_events()
+        event.refresh_from_db()
+        self.assertIsNotNone(event.processed_at)
+        self.assertEqual(event.error, "")
+
+    def _return(self, donacion_id, total, currency="USD"):
+        executed = {
+            "state": "approved",
+            "transactions": [
+                {
+                    "amount": {"total": total, "currency": currency},
+                    **_sale("completed"),
+                }
+            ],
+        }
+        client = _FakeClient(executed=executed)
+        with patch("donaciones.payments.get_client", return_value=client):
+            return payments.confirm_return(donacion_id, "PAY-1", "PAYER")
+
+    def test_return_checks_payment_id_and_amount(self):
+        # Sin paypal_id guardado no se adopta el paymentId de la URL
+        sin_pago = Donacion.objects.create(
+            nombre="Luis", email="luis@example.com", monto=10
+        )
+        self.assertIsNone(self._return(sin_pago.pk, "10.00"))
+        sin_pago.refresh_from_db()
+        self.assertIsNone(sin_pago.paypal_id)
+
+        self.assertIsNone(self._return(self.donacion.pk, "1.00"))
+        self.assertIsNone(self._return(self.donacion.pk, "10.00", "EUR"))
+        self.donacion.refresh_from_db()
+        self.assertEqual(self.donacion.estado, Donacion.Estado.PENDIENTE)
+
+        self.assertEqual(
+            self._return(self.donacion.pk, "10.00"), Donacion.Estado.COMPLETADA
+        )
+        self.donacion.refresh_from_db()
+        self.assertEqual(self.donacion.estado, Donacion.Estado.COMPLETADA)
+
+    def test_webhook_with_bad_signature_is_rejected(self):
+        self.assertEqual(self._post(_FakeClient(verified=False)).status_code, 400)
+        self.assertFalse(PayPalEvent.objects.exists())
+
+    def test_reconcile_stale_donations(self):
+        otra = Donacion.objects.create(
+            nombre="Luis", email="luis@example.com", monto=5, paypal_id="PAY-2"
+        )
+        reciente = Donacion.objects.create(
+            nombre="Eva", email="eva@example.com", monto=5, paypal_id="PAY-3"
+        )
+        Donacion.objects.exclude(pk=reciente.pk).update(
+            creado_en=reciente.creado_en - timedelta(hours=1)
+        )
+        client = _FakeClient(
+            {
+                "PAY-1": {"state": "approved", "transactions": [_sale("completed")]},
+                # Aprobado pero sin ejecutar: el navegador nunca volvió
+                "PAY-2": {
+                    "state": "created",
+                    "payer": {"payer_info": {"payer_id": "X"}},
+                },
+            }
+        )
+        with patch("donaciones.payments.get_client", return_value=client):
+            stats = payments.reconcile(older_than=timedelta(minutes=30), workers=2)
+
+        self.assertEqual(stats, {Donacion.Estado.COMPLETADA: 2})
+        estados = dict(Donacion.objects.values_list("pk", "estado"))
+        self.assertEqual(estados[otra.pk], Donacion.Estado.COMPLETADA)
+        self.assertEqual(estados[reciente.pk], Donacion.Estado.PENDIENTE)
@@ -1,9 +1,16 @@
+from django.conf import settings
 from django.urls import path
 from . import views
 
+# En modo ASGI la vista de pago es async (espera a PayPal sin ocupar un hilo)
+donacion_paypal = (
+    views.adonacion_paypal if settings.ASGI_MODE else views.donacion_paypal
+)
+
 urlpatterns = [
     path("", views.index, name="donaciones"),
-    path("paypal/", views.donacion_paypal, name="donacion_paypal"),
+    path("paypal/", donacion_paypal, name="donacion_paypal"),
     path("exitosa/", views.donacion_exitosa, name="donacion_exitosa"),
     path("cancelada/", views.donacion_cancelada, name="donacion_cancelada"),
+    path("paypal/webhook/", views.paypal_webhook, name="paypal_webhook"),
 ]
@@ -1,18 +1,35 @@
+import json
+import logging
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseBadRequest
 from django.shortcuts import render, redirect
 from django.urls import reverse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
 
 # from paypal.standard.forms import PayPalPaymentsForm # No longer needed
+from core.singletons import get_singleton
+
 from .models import DonacionSection, Donacion, DonacionesStatic
 from decimal import Decimal, InvalidOperation
 
-# Import the make_paypal_payment function from the new utility file
-from .paypal_utils import make_paypal_payment
+# Creación del pago contra la API de PayPal (variante async para el modo ASGI)
+from . import payments
+from .paypal_utils import (
+    PayPalError,
+    amake_paypal_payment,
+    get_client,
+    make_paypal_payment,
+)
+
+logger = logging.getLogger(__name__)
 
 
 def index(request):
     # This view now renders the static donations page.
     # It fetches the first published DonacionesStatic object.
-    static_content = DonacionesStatic.objects.filter(publicado=True).first()
+    static_content = get_singleton(DonacionesStatic)
     if not static_content:
         # If no static content is configured, provide a default object
         # This avoids having to handle None in the template and provides a fallback.
@@ -47,85 +64,103 @@ def index(request):
 #     return render(request, 'donaciones/donaciones_form.html', {'donacion_sections': donacion_sections})
 
 
-def donacion_paypal(request):
-    if request.method == "POST":
-        # Try to get amount from radio buttons first, then from the 'other' input field
-        monto = request.POST.get("amount")
-        if not monto:
-            monto = request.POST.get("amount_other")
-
-        # Basic validation to ensure monto is not None or empty before creating Donacion
-        if not monto:
-            # Handle the case where no amount is provided. Redirect to an error page or show a message.
-            return redirect("donaciones")  # Or redirect to a specific error page
-
-        nombre = request.POST.get("first_name", "Anónimo")
-        email = request.POST.get("email", "anonimo@example.com")
-
-        # Ensure monto is a Decimal before saving
-        try:
-            monto_decimal = Decimal(monto)
-        except InvalidOperation:
-            # Handle invalid amount format
-            return redirect("donaciones")  # Or redirect to a specific error page
-
-        donacion = Donacion.objects.create(
-            nombre=nombre,
-            email=email,
-            monto=monto_decimal,
-        )
+def _donacion_data(request):
+    """(nombre, email, monto str, monto Decimal) del formulario, o None si no vale."""
+    # Try to get amount from radio buttons first, then from the 'other' input field
+    monto = request.POST.get("amount")
+    if not monto:
+        monto = request.POST.get("amount_other")
 
-        # Use the API-based payment creation
-        amount = monto  # Use the string amount for PayPal API
-        currency = "USD"  # Default currency
-        # Construct return and cancel URLs using reverse, passing the donacion.id as a custom parameter
-        return_url = (
-            request.build_absolute_uri(reverse("donacion_exitosa"))
-            + f"?custom_id={donacion.id}"
-        )
-        cancel_url = request.build_absolute_uri(reverse("donacion_cancelada"))
+    # Basic validation to ensure monto is not None or empty before creating Donacion
+    if not monto:
+        return None
 
-        success, payment_id, approval_url = make_paypal_payment(
-            amount, currency, return_url, cancel_url
-        )
+    # Ensure monto is a Decimal before saving
+    try:
+        monto_decimal = Decimal(monto)
+    except InvalidOperation:
+        return None
 
-        if success:
-            # Redirect to PayPal's approval URL
-            return redirect(approval_url)
-        else:
-            # Handle error, perhaps render an error page or redirect to a generic error URL
-            # Log the error details from make_paypal_payment if available
-            print(
-                f"Failed to initiate PayPal payment. Payment ID: {payment_id}, Approval URL: {approval_url}"
-            )
-            return redirect("donaciones")  # Redirect to donations page for now
+    nombre = request.POST.get("first_name", "Anónimo")
+    email = request.POST.get("email", "anonimo@example.com")
+    return nombre, email, monto, monto_decimal
 
+
+def _paypal_urls(request, donacion):
+    # Construct return and cancel URLs using reverse, passing the donacion.id as a custom parameter
+    return_url = (
+        request.build_absolute_uri(reverse("donacion_exitosa"))
+        + f"?custom_id={donacion.id}"
+    )
+    cancel_url = request.build_absolute_uri(reverse("donacion_cancelada"))
+    return return_url, cancel_url
+
+
+def donacion_paypal(request):
     # If not POST, redirect to donations page
+    if request.method != "POST":
+        return redirect("donaciones")
+    data = _donacion_data(request)
+    if data is None:
+        return redirect("donaciones")  # Or redirect to a specific error page
+    nombre, email, monto, monto_decimal = data
+
+    donacion = Donacion.objects.create(nombre=nombre, email=email, monto=monto_decimal)
+
+    # Use the API-based payment creation (string amount, PAYPAL_CURRENCY)
+    success, payment_id, approval_url = make_paypal_payment(
+        monto, settings.PAYPAL_CURRENCY, *_paypal_urls(request, donacion)
+    )
+
+    if success:
+        # Guardado ya: webhooks y reconcile_donations lo encuentran aunque el
+        # comprador no vuelva a la web
+        Donacion.objects.filter(pk=donacion.pk).update(paypal_id=payment_id)
+        # Redirect to PayPal's approval URL
+        return redirect(approval_url)
+    # make_paypal_payment ya registró el detalle del error
+    logger.warning("No se pudo iniciar el pago de la donación %s", donacion.pk)
+    return redirect("donaciones")
+
+
+async def adonacion_paypal(request):
+    # Solo en modo ASGI (donaciones/urls.py): el event loop de uvicorn es de larga
+    # vida, así que su httpx.AsyncClient reutiliza conexiones; mientras se espera
+    # a PayPal el worker atiende otras peticiones. Bajo WSGI cada petición async
+    # tendría un loop nuevo (y un cliente nuevo): ahí se usa donacion_paypal
+    if request.method != "POST":
+        return redirect("donaciones")
+    data = _donacion_data(request)
+    if data is None:
+        return redirect("donaciones")
+    nombre, email, monto, monto_decimal = data
+
+    donacion = await Donacion.objects.acreate(
+        nombre=nombre, email=email, monto=monto_decimal
+    )
+
+    success, payment_id, approval_url = await amake_paypal_payment(
+        monto, settings.PAYPAL_CURRENCY, *_paypal_urls(request, donacion)
+    )
+
+    if success:
+        await Donacion.objects.filter(pk=donacion.pk).aupdate(paypal_id=payment_id)
+        return redirect(approval_url)
+    logger.warning("No se pudo iniciar el pago de la donación %s", donacion.pk)
     return redirect("donaciones")
 
 
 def donacion_exitosa(request):
     # Retrieve the custom_id (Donacion ID) from the URL parameters
     custom_id = request.GET.get("custom_id")
-    payment_id = request.GET.get("paymentId")  # Also get paymentId if available
-
-    if custom_id:
-        try:
-            donacion = Donacion.objects.get(id=custom_id)
-            # Update the donation status to completed
-            donacion.completado = True
-            if payment_id:  # Only update paypal_id if paymentId is present
-                donacion.paypal_id = payment_id
-            donacion.save()
-            print(f"Donacion {custom_id} marked as completed. PayPal ID: {payment_id}")
-        except Donacion.DoesNotExist:
-            # Handle case where Donacion object is not found
-            print(f"Donacion with custom_id {custom_id} not found.")
-        except Exception as e:
-            # Handle other potential errors during update
-            print(f"Error updating Donacion status for custom_id {custom_id}: {e}")
+    payment_id = request.GET.get("paymentId")
+    payer_id = request.GET.get("PayerID")
+
+    # Se ejecuta el pago aprobado; el estado lo decide PayPal, no la URL
+    if custom_id and custom_id.isdigit() and payment_id and payer_id:
+        payments.confirm_return(int(custom_id), payment_id, payer_id)
     else:
-        print("No custom_id found in URL parameters for donacion_exitosa.")
+        logger.warning("Retorno de PayPal sin custom_id/paymentId/PayerID")
 
     # Fetch the DonacionSection to display success message
     donacion_section = DonacionSection.objects.filter(publicado=True).first()
@@ -138,3 +173,33 @@ def donacion_cancelada(request):
     donacion_section = DonacionSection.objects.filter(publicado=True).first()
     context = {"donacion_section": donacion_section}
     return render(request, "donaciones/donacion_cancelada.html", context)
+
+
+@csrf_exempt
+@require_POST
+def paypal_webhook(request):
+    """
+    Recibe webhooks de PayPal: verifica la firma y guarda el evento. Lo aplica
+    el worker (manage.py process_paypal_events), así PayPal recibe el 200 al
+    momento y los reenvíos del mismo evento se ignoran.
+    """
+    try:
+        event = json.loads(request.body)
+        event_id = event["id"]
+    except (ValueError, KeyError, TypeError):
+        return HttpResponseBadRequest("Evento inválido")
+
+    try:
+        verified = get_client().verify_webhook(
+            request.headers, event, settings.PAYPAL_WEBHOOK_ID
+        )
+    except PayPalError as exc:
+        # PayPal reintentará el envío
+        logger.warning("No se pudo verificar el webhook %s: %s", event_id, exc)
+        return HttpResponse(status=503)
+    if not verified:
+        logger.warning("Webhook de PayPal con firma inválida: %s", event_id)
+        return HttpResponseBadRequest("Firma inválida")
+
+    payments.store_event(event)
+    return HttpResponse(status=200)
@@ -1,8 +1,4 @@
 from django.apps import AppConfig
-from django.db.models.signals import post_migrate
-from .seeders import (
-    _seed_eventos_once,
-)  # lo defines en otro archivo (ej. seed_proyectos.py)
 
 
 class EventosConfig(AppConfig):
@@ -11,4 +7,4 @@ class EventosConfig(AppConfig):
     label = "eventos"  # ← opcional pero recomendable
 
     def ready(self):
-        post_migrate.connect(_seed_eventos_once, sender=self)
+        from . import seeders  # noqa: F401  (semillas, manage.py seed)
@@ -1,21 +1,17 @@
-from django.core.management import call_command
-from django.db import connection, transaction
+# eventos/seeders.py
+from pathlib import Path
 
-SEED_TAG = "eventos:v5"  # cámbialo a v5 cuando quieras resembrar
+from core.seeding import register_seed
 
+FIXTURES = Path(__file__).resolve().parent / "fixtures"
 
-def _seed_eventos_once(sender, **kwargs):
-    with connection.cursor() as cur, transaction.atomic():
-        # Crear tabla ledger si no existe
-        cur.execute("CREATE TABLE IF NOT EXISTS seed_run(tag TEXT PRIMARY KEY)")
-        # Verificar si ya corrimos esta versión
-        cur.execute("SELECT 1 FROM seed_run WHERE tag=%s", [SEED_TAG])
-        if cur.fetchone():
-            print(f"[seed_eventos] Ya corrido {SEED_TAG}, no se recarga")
-            return
-
-        # Cargar fixtures en orden
-        fixtures = [
+# Sube la versión para resembrar (manage.py seed)
+register_seed(
+    "eventos",
+    5,
+    [
+        FIXTURES / f"{name}.json"
+        for name in (
             "festivales",
             "talleres",
             "talleres_page",
@@ -24,11 +20,6 @@ def _seed_eventos_once(sender, **kwargs):
             "escuela_page",
             "retiros_page",
             "terapias_page",
-        ]
-        for fx in fixtures:
-            call_command("loaddata", fx, verbosity=0)
-            print(f"[seed_eventos] Cargado fixture: {fx}")
-
-        # Registrar versión
-        cur.execute("INSERT INTO seed_run(tag) VALUES(%s)", [SEED_TAG])
-        print(f"[seed_eventos] Marcado {SEED_TAG}")
+        )
+    ],
+)
@@ -1,4 +1,8 @@
 from django.shortcuts import render, get_object_or_404
+
+from core.singletons import get_singleton
+from core.pagecache import cache_page_anon
+
 from .models import (
     Festival,
     TallerDetail,
@@ -13,42 +17,49 @@ from .models import (
 # Create your views here.
 
 
+@cache_page_anon("eventos", "proyectos")
 def escuela_viva(request):
-    page_content = EscuelaPage.objects.first()
+    page_content = get_singleton(EscuelaPage)
     return render(request, "eventos/escuela.html", {"page": page_content})
 
 
+@cache_page_anon("eventos", "proyectos")
 def talleres(request):
     talleres = TallerDetail.objects.all().order_by("-id")
-    page_content = TalleresPage.objects.first()
+    page_content = get_singleton(TalleresPage)
     return render(
         request, "eventos/talleres.html", {"talleres": talleres, "page": page_content}
     )
 
 
+@cache_page_anon("eventos", "proyectos")
 def taller_detail(request, slug):
     taller = get_object_or_404(TallerDetail, slug=slug)
     return render(request, "eventos/taller_detail.html", {"taller": taller})
 
 
+@cache_page_anon("eventos", "proyectos")
 def retiros(request):
-    page_content = RetirosPage.objects.first()
+    page_content = get_singleton(RetirosPage)
     return render(request, "eventos/retiros.html", {"page": page_content})
 
 
+@cache_page_anon("eventos", "proyectos")
 def artes(request):
-    page_content = ArtesPage.objects.first()
+    page_content = get_singleton(ArtesPage)
     return render(request, "eventos/artes.html", {"page": page_content})
 
 
+@cache_page_anon("eventos", "proyectos")
 def terapias(request):
-    page_content = TerapiasPage.objects.first()
+    page_content = get_singleton(TerapiasPage)
     return render(request, "eventos/terapias.html", {"page": page_content})
 
 
+@cache_page_anon("eventos", "proyectos")
 def festivales(request):
     festivales = Festival.objects.all().order_by("-id")
-    page_content = FestivalesPage.objects.first()
+    page_content = get_singleton(FestivalesPage)
     return render(
         request,
         "eventos/festivales.html",
@@ -56,6 +67,7 @@ def festivales(request):
     )
 
 
+@cache_page_anon("eventos", "proyectos")
 def festival_detail(request, slug):
     festival = get_object_or_404(Festival, slug=slug)
     return render(request, "eventos/festival_detail.html", {"festival": festival})
@@ -0,0 +1,158 @@
+# gunicorn.conf.py
+"""
+Perfiles de ejecución de gunicorn (Procfile / init_app.sh: `gunicorn -c gunicorn.conf.py`).
+
+GUNICORN_PROFILE elige el perfil (por defecto "asgi" con ASGI_MODE, si no "gthread"):
+
+  * sync    → lo de antes: 2 workers síncronos, sin preload ni reciclado. Se
+              deja como referencia para `manage.py benchmark_server`.
+  * gthread → preload_app (los módulos se importan en el master y los workers
+              los comparten por copy-on-write), un worker por CPU (mín. 2) con
+              GUNICORN_THREADS hilos y reciclado con max_requests + jitter para
+              cortar el crecimiento de memoria del admin (Pillow, miniaturas).
+  * asgi    → igual, con uvicorn_worker.UvicornWorker y chambalabamba.asgi.
+
+Variables: WEB_CONCURRENCY (workers), GUNICORN_THREADS, GUNICORN_MAX_REQUESTS,
+GUNICORN_MAX_REQUESTS_JITTER, GUNICORN_TIMEOUT, PORT. Con DB_POOL, los hilos de
+un worker no deberían superar DB_POOL_MAX_SIZE.
+"""
+
+import os
+
+# `config` es también un ajuste de gunicorn: no puede quedar como nombre global
+import decouple
+
+PROFILES = {
+    "sync": {
+        "wsgi_app": "chambalabamba.wsgi:application",
+        "worker_class": "sync",
+        "preload_app": False,
+    },
+    "gthread": {
+        "wsgi_app": "chambalabamba.wsgi:application",
+        "worker_class": "gthread",
+        "preload_app": True,
+    },
+    "asgi": {
+        "wsgi_app": "chambalabamba.asgi:application",
+        "worker_class": "uvicorn_worker.UvicornWorker",
+        "preload_app": True,
+    },
+}
+
+
+def cpu_count():
+    """CPUs disponibles para el proceso (respeta la afinidad del contenedor)."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+profile = decouple.config(
+    "GUNICORN_PROFILE",
+    default="asgi"
+    if decouple.config("ASGI_MODE", default=False, cast=bool)
+    else "gthread",
+)
+if profile not in PROFILES:
+    raise RuntimeError(
+        f"GUNICORN_PROFILE={profile!r} no existe; opciones: {', '.join(PROFILES)}"
+    )
+
+wsgi_app = PROFILES[profile]["wsgi_app"]
+worker_class = PROFILES[profile]["worker_class"]
+preload_app = PROFILES[profile]["preload_app"]
+
+bind = f"0.0.0.0:{decouple.config('PORT', default='8000')}"
+timeout = decouple.config("GUNICORN_TIMEOUT", default=120, cast=int)
+graceful_timeout = 30
+keepalive = 5
+
+if profile == "sync":
+    workers = decouple.config("WEB_CONCURRENCY", default=2, cast=int)
+else:
+    workers = decouple.config("WEB_CONCURRENCY", default=max(2, cpu_count()), cast=int)
+    threads = decouple.config("GUNICORN_THREADS", default=4, cast=int)
+    # El jitter evita que todos los workers se reciclen a la vez
+    max_requests = decouple.config("GUNICORN_MAX_REQUESTS", default=1000, cast=int)
+    max_requests_jitter = decouple.config(
+        "GUNICORN_MAX_REQUESTS_JITTER", default=100, cast=int
+    )
+
+# Latido de los workers en memoria: en contenedores /tmp puede ser un disco lento
+if os.path.isdir("/dev/shm"):
+    worker_tmp_dir = "/dev/shm"
+
+
+# ──────────────────────────────────────────────────────────────────────────────
+# Hooks
+# ──────────────────────────────────────────────────────────────────────────────
+def _warm_up(caches=True):
+    """Plantillas, URLs y cachés (core/warmup.py; WARMUP_* en settings)."""
+    from django.conf import settings
+
+    from core import warmup
+
+    try:
+        warmup.run(
+            caches=caches and settings.WARMUP_CACHES,
+            pages=caches and settings.WARMUP_PAGES,
+        )
+    except Exception:
+        # Sin BD (p.ej. aún sin migrar) se arranca igual, en frío
+        warmup.logger.warning("Warmup incompleto", exc_info=True)
+
+
+def _prime_caches():
+    from django.conf import settings
+
+    from core import warmup
+
+    try:
+        if settings.WARMUP_CACHES:
+            warmup.prime_caches()
+        if settings.WARMUP_PAGES:
+            warmup.prime_pages()
+    except Exception:
+        warmup.logger.warning("Warmup de cachés incompleto", exc_info=True)
+
+
+def _local_cache():
+    from core.cache import process_local
+
+    return process_local()
+
+
+def _close_connections():
+    # Ni conexiones ni pool (con sus hilos) pueden cruzar el fork
+    from django.db import connections
+
+    for conn in connections.all(initialized_only=True):
+        conn.close()
+        if hasattr(conn, "close_pool"):
+            conn.close_pool()
+
+
+def when_ready(server):
+    # Con preload, el master ya tiene la app: plantillas y URLs se compilan una
+    # vez antes de los forks y cada worker (también los reciclados) nace con
+    # ellas. Las cachés solo si son compartidas: en una LocMemCache del master
+    # los workers reciclados heredarían el contenido del arranque, no el actual
+    if server.cfg.preload_app:
+        _warm_up(caches=not _local_cache())
+        _close_connections()
+
+
+def post_fork(server, worker):
+    if server.cfg.preload_app:
+        # Caché local: cada worker llena la suya con el contenido de ahora
+        if _local_cache():
+            _prime_caches()
+        return
+    # Sin preload, cada worker se calienta antes de aceptar peticiones
+    import django
+
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", "chambalabamba.settings")
+    django.setup()
+    _warm_up()
@@ -1,6 +1,5 @@
 # apps/inicio/apps.py
 from django.apps import AppConfig
-from django.db.models.signals import post_migrate
 
 
 class InicioConfig(AppConfig):
@@ -8,7 +7,4 @@ class InicioConfig(AppConfig):
     name = "inicio"
 
     def ready(self):
-        # Conectar el seeder para correr tras migraciones de esta app
-        from .seeders import seed_inicio_once
-
-        post_migrate.connect(seed_inicio_once, sender=self)
+        from . import seeders  # noqa: F401  (semillas, manage.py seed)
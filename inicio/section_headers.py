@@ -0,0 +1,80 @@
+# inicio/section_headers.py
+"""
+Cabeceras de sección (SectionHeader) resueltas en bloque.
+
+Varios templatetags (gallery_headers, gallery_headers_estancias, products_tabs,
+_home_cooperaciones...) leen la cabecera de su sección; la home llega a pedir
+cinco. En vez de un SectionHeader.objects.filter(...).first() por tag:
+
+    from inicio.section_headers import get_section_header
+
+    header = get_section_header("tienda_tabs")  # SectionHeader publicado o None
+
+La primera consulta de la petición carga todas las cabeceras publicadas de una
+vez (una consulta, o ninguna si están en la caché: core/cache.py, etiqueta del
+modelo) y las siguientes salen de memoria. SectionHeaderMiddleware acota ese
+registro a la petición; fuera de una (comandos, tests) cada llamada va a la caché.
+"""
+
+import contextvars
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+
+from core import cache as tagcache
+
+from .models import SectionHeader
+
+HEADERS_TAG = tagcache.model_tag(SectionHeader)
+
+_registry = contextvars.ContextVar("section_headers", default=None)
+
+
+def _load_all():
+    return {h.seccion: h for h in SectionHeader.objects.filter(publicado=True)}
+
+
+def section_headers():
+    """{seccion: SectionHeader} de todas las cabeceras publicadas."""
+    scope = _registry.get()
+    if scope is not None and "headers" in scope:
+        return scope["headers"]
+    headers = tagcache.get_or_set("section_headers", [HEADERS_TAG], _load_all)
+    if scope is not None:
+        scope["headers"] = headers
+    return headers
+
+
+def get_section_header(seccion):
+    if not seccion:
+        return None
+    return section_headers().get(seccion)
+
+
+class SectionHeaderMiddleware:
+    """Abre un registro de cabeceras por petición (se carga al primer uso)."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.async_mode = iscoroutinefunction(get_response)
+        if self.async_mode:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.async_mode:
+            return self.__acall__(request)
+        token = _registry.set({})
+        try:
+            return self.get_response(request)
+        finally:
+            _registry.reset(token)
+
+    async def __acall__(self, request):
+        # sync_to_async copia el contexto: las vistas y tags en hilos ven el registro
+        token = _registry.set({})
+        try:
+            return await self.get_response(request)
+        finally:
+            _registry.reset(token)
@@ -1,11 +1,14 @@
 from django import template
-from inicio.models import Gallery, SectionHeader
+
+from core import cache as tagcache
+from inicio.models import Gallery
+from inicio.section_headers import get_section_header
 
 register = template.Library()
 
 
-@register.inclusion_tag("inicio/_gallery_headers_component.html")
-def gallery_headers(seccion, title=None, subtitle=None, limit=None):
+@tagcache.cached(tagcache.model_tag(Gallery))
+def _galerias(seccion, limit=None):
     qs = (
         Gallery.objects.filter(seccion=seccion, publicado=True)
         .exclude(portada="")
@@ -16,9 +19,15 @@ def gallery_headers(seccion, title=None, subtitle=None, limit=None):
             qs = qs[: int(limit)]
         except (TypeError, ValueError):
             pass
+    return list(qs)
+
+
+@register.inclusion_tag("inicio/_gallery_headers_component.html")
+def gallery_headers(seccion, title=None, subtitle=None, limit=None):
+    qs = _galerias(seccion, limit)
 
     # OVERRIDE desde BD si hay SectionHeader publicado para esa sección
-    header = SectionHeader.objects.filter(seccion=seccion, publicado=True).first()
+    header = get_section_header(seccion)
     if header:
         if not title:
             title = header.title
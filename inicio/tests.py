@@ -1 +1,47 @@
-# Create your tests here.
+from django.core.cache import cache
+from django.db import connection
+from django.template import Context, Template
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from inicio import section_headers
+from inicio.models import SectionHeader
+
+HEADERS = Template(
+    "{% load inicio_extras tienda_extras coops_extras participa_extras %}"
+    "{% gallery_headers 'home_ultimos_eventos' %}"
+    "{% products_tabs %}"
+    "{% _home_cooperaciones %}"
+    "{% gallery_headers_estancias 'participa_estancias' %}"
+)
+
+
+class SectionHeaderRegistryTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        SectionHeader.objects.create(seccion="tienda_tabs", title="Nuestra tienda")
+        SectionHeader.objects.create(seccion="home_cooperaciones", title="Aliadas")
+        SectionHeader.objects.create(
+            seccion="participa_estancias", title="Oculta", publicado=False
+        )
+
+    def test_una_consulta_para_todas_las_cabeceras(self):
+        token = section_headers._registry.set({})
+        try:
+            with CaptureQueriesContext(connection) as ctx:
+                html = HEADERS.render(Context())
+                section_headers.get_section_header("nosotros_cabecera")
+        finally:
+            section_headers._registry.reset(token)
+        sql = [q["sql"] for q in ctx.captured_queries if "sectionheader" in q["sql"]]
+        self.assertEqual(len(sql), 1)
+        self.assertIn("Nuestra tienda", html)
+        self.assertNotIn("Oculta", html)
+
+    def test_cambio_en_el_admin_invalida_la_cache(self):
+        self.assertEqual(
+            section_headers.get_section_header("tienda_tabs").title, "Nuestra tienda"
+        )
+        SectionHeader.objects.filter(seccion="tienda_tabs").update(title="x")
+        SectionHeader.objects.get(seccion="tienda_tabs").save()
+        self.assertEqual(section_headers.get_section_header("tienda_tabs").title, "x")
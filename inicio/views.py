@@ -1,9 +1,13 @@
 from django.shortcuts import render
+from core.querybudget import query_budget
+from core.pagecache import cache_page_anon
 from .models import HeroSlide, ValorCard
 from django.shortcuts import get_object_or_404
 from .models import Gallery
 
 
+@query_budget(queries=30)
+@cache_page_anon("tienda", "cooperaciones", "participa", "donaciones")
 def home(request):
     ctx = {
         "hero_slides": HeroSlide.objects.filter(publicado=True).order_by("orden"),
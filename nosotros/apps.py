@@ -1,7 +1,5 @@
 # apps/nosotros/apps.py
 from django.apps import AppConfig
-from django.db.models.signals import post_migrate
-from .seeders import _seed_nosotros_once
 
 
 class NosotrosConfig(AppConfig):
@@ -10,4 +8,4 @@ class NosotrosConfig(AppConfig):
     label = "nosotros"
 
     def ready(self):
-        post_migrate.connect(_seed_nosotros_once, sender=self)
+        from . import seeders  # noqa: F401  (semillas, manage.py seed)
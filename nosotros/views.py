@@ -1,25 +1,32 @@
 from django.shortcuts import render, get_object_or_404
+from core.pagecache import cache_page_anon
+
 from .models import NosotrosPage, TopicPage
 from .models import PilarPage
 
 
+@cache_page_anon("nosotros")
 def nuestro_camino(request):
     page = get_object_or_404(NosotrosPage, enabled=True)
     return render(request, "nosotros/nuestro_camino.html", {"page": page})
 
 
+@cache_page_anon("nosotros")
 def gobernanza(request):
     return render(request, "nosotros/gobernanza.html")
 
 
+@cache_page_anon("nosotros")
 def principios_valores(request):
     return render(request, "nosotros/principios_valores.html")
 
 
+@cache_page_anon("nosotros")
 def territorio(request):
     return render(request, "nosotros/territorio.html")
 
 
+@cache_page_anon("nosotros")
 def pilar_detail(request, slug):
     page = get_object_or_404(
         PilarPage.objects.select_related("header").prefetch_related(
@@ -30,6 +37,7 @@ def pilar_detail(request, slug):
     return render(request, f"nosotros/pilares/pilar_{slug}.html", {"page": page})
 
 
+@cache_page_anon("nosotros")
 def topic_detail(request, slug):
     page = get_object_or_404(
         TopicPage.objects.select_related("header").prefetch_related(
@@ -41,18 +49,22 @@ def topic_detail(request, slug):
     return render(request, "nosotros/topic_detail.html", {"page": page})
 
 
+@cache_page_anon("nosotros")
 def pilar_bienestar(request):
     return render(request, "nosotros/pilares/pilar_bienestar.html")
 
 
+@cache_page_anon("nosotros")
 def pilar_ecologia(request):
     return render(request, "nosotros/pilares/pilar_ecologia.html")
 
 
+@cache_page_anon("nosotros")
 def pilar_economia(request):
     return render(request, "nosotros/pilares/pilar_economia.html")
 
 
+@cache_page_anon("nosotros")
 def pilar_sociocultural(request):
     return render(request, "nosotros/pilares/pilar_sociocultural.html")
 
@@ -1,5 +1,4 @@
 from django.apps import AppConfig
-from django.db.models.signals import post_migrate
 
 
 class ParticipaConfig(AppConfig):
@@ -8,7 +7,4 @@ class ParticipaConfig(AppConfig):
     verbose_name = "Participa"
 
     def ready(self):
-        from .seeds import _seed_estancias_once, _seed_voluntariado_once
-
-        post_migrate.connect(_seed_estancias_once, sender=self)
-        post_migrate.connect(_seed_voluntariado_once, sender=self)
+        from . import seeds  # noqa: F401  (semillas, manage.py seed)
@@ -1,4 +1,2 @@
-from .seed_estancias import _seed_estancias_once
-from .seed_voluntariado import _seed_voluntariado_once
-
-__all__ = ["_seed_estancias_once", "_seed_voluntariado_once"]
+# Declaraciones de semillas (core/seeding.py)
+from . import seed_estancias, seed_voluntariado  # noqa: F401
@@ -1,6 +1,8 @@
 # participa/templatetags/participa_extras.py
 from django import template
 
+from core.singletons import get_singleton
+
 register = template.Library()
 
 # --------- Imports tolerantes ---------
@@ -23,9 +25,9 @@ except Exception:
 
 # NEW: header administrable (ajusta el import al app donde esté tu SectionHeader)
 try:
-    from inicio.models import SectionHeader
+    from inicio.section_headers import get_section_header
 except Exception:
-    SectionHeader = None
+    get_section_header = None
 
 
 # ====== ESTANCIAS (admin-override para title/subtitle) ======
@@ -61,8 +63,8 @@ def gallery_headers_estancias(
 
     # Header administrable (si el modelo existe)
     admin_title = admin_subtitle = None
-    if SectionHeader is not None and seccion:
-        sh = SectionHeader.objects.filter(seccion=seccion, publicado=True).first()
+    if get_section_header is not None and seccion:
+        sh = get_section_header(seccion)
         if sh:
             # Soporta both title/titulo, subtitle/subtitulo
             admin_title = getattr(sh, "title", None) or getattr(sh, "titulo", None)
@@ -164,9 +166,6 @@ def voluntariado_page():
     if VoluntariadoPage is None:
         return None
     try:
-        return (
-            VoluntariadoPage.objects.filter(publicado=True).first()
-            or VoluntariadoPage.get_solo()
-        )
+        return get_singleton(VoluntariadoPage) or VoluntariadoPage.get_solo()
     except Exception:
         return None
@@ -1,6 +1,7 @@
 from django.shortcuts import render, get_object_or_404
 from .models import ParticipaPage, Estancia
 from .models import VoluntariadoPage  # tu modelo de la captura
+from core.singletons import get_singleton
 from django.templatetags.static import static
 
 # participa/views.py
@@ -8,7 +9,7 @@ from django.http import Http404
 
 
 def voluntariado(request):
-    pagina = VoluntariadoPage.objects.filter(publicado=True).first()
+    pagina = get_singleton(VoluntariadoPage)
     if not pagina:
         raise Http404("Página de Voluntariado no configurada")
 
@@ -54,7 +55,7 @@ def voluntariado(request):
 
 
 def estancias_list(request):
-    page = ParticipaPage.objects.select_related("header").first()
+    page = get_singleton(ParticipaPage)
     estancias = Estancia.objects.filter(
         seccion="participa_estancias", publicado=True
     ).order_by("orden", "-creado")
@@ -66,7 +67,7 @@ def estancias_list(request):
 
 
 def estancia_detail(request, slug):
-    page = ParticipaPage.objects.select_related("header").first()
+    page = get_singleton(ParticipaPage)
     e = get_object_or_404(Estancia, slug=slug, publicado=True)
     fotos = e.fotos.filter(publicado=True).order_by("orden", "-creado")
     specs = e.specs.all().order_by("orden", "id")
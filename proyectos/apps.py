@@ -1,5 +1,4 @@
 from django.apps import AppConfig
-from django.db.models.signals import post_migrate
 
 
 class ProyectosConfig(AppConfig):
@@ -8,6 +7,4 @@ class ProyectosConfig(AppConfig):
     verbose_name = "Proyectos"
 
     def ready(self):
-        from .seeds.seed_proyectos import _seed_proyectos_once
-
-        post_migrate.connect(_seed_proyectos_once, sender=self)
+        from .seeds import seed_proyectos  # noqa: F401  (semillas, manage.py seed)
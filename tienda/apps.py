@@ -1,6 +1,4 @@
 from django.apps import AppConfig
-from django.db.models.signals import post_migrate
-from .seeders import _seed_tienda_once
 
 
 class TiendaConfig(AppConfig):
@@ -8,7 +6,8 @@ class TiendaConfig(AppConfig):
     name = "tienda"
 
     def ready(self):
-        # Importa el seeder para registrar el post_migrate
-        from . import seeders  # noqa
+        from . import seeders  # noqa: F401  (semillas, manage.py seed)
+        from . import tabs  # noqa: F401  (etiqueta de caché de products_tabs)
+        from core import search
 
-        post_migrate.connect(_seed_tienda_once, sender=self)
+        search.register(self.get_model("Producto"))
@@ -66,6 +66,14 @@ class Producto(models.Model):
         # Ajusta al nombre real de tu ruta de detalle si existe:
         return reverse("tienda:detalle-producto", kwargs={"slug": self.slug})
 
+    def search_document(self):
+        """(título, cuerpo) para core.search; None si no debe aparecer en búsquedas."""
+        if not self.publicado:
+            return None
+        from core.search import to_plain_text
+
+        return self.titulo, to_plain_text(self.descripcion_corta, self.descripcion)
+
     class Meta:
         ordering = ["orden", "-creado"]
         verbose_name = "1) Producto"
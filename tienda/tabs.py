@@ -0,0 +1,58 @@
+# tienda/tabs.py
+"""
+Datos de las pestañas de productos por categoría ({% products_tabs %} en la home).
+
+Una sola consulta con ROW_NUMBER() OVER (PARTITION BY categoria ORDER BY orden,
+-creado) trae los primeros `limit` productos de cada categoría publicada (más un
+prefetch de imágenes) y se agrupan en Python. El resultado se cachea bajo la
+etiqueta "section:tienda_tabs" (core/cache.py), que sube al cambiar Producto,
+ProductoCategoria o ProductoImagen.
+"""
+
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+from core import cache as tagcache
+
+from .models import Producto
+
+TABS_TAG = tagcache.section(
+    "tienda_tabs",
+    "tienda.Producto",
+    "tienda.ProductoCategoria",
+    "tienda.ProductoImagen",
+)
+
+
+def build_tabs(limit=8):
+    """[{id, title, items}] por categoría publicada con productos publicados."""
+    productos = (
+        Producto.objects.filter(publicado=True, categoria__publicado=True)
+        .annotate(
+            fila=Window(
+                RowNumber(),
+                partition_by=F("categoria_id"),
+                order_by=[F("orden").asc(), F("creado").desc()],
+            )
+        )
+        .select_related("categoria")
+        .prefetch_related("imagenes")
+        .order_by("categoria__orden", "categoria__nombre", "orden", "-creado")
+    )
+    if limit:
+        productos = productos.filter(fila__lte=limit)
+
+    tabs = {}
+    for p in productos:
+        tab = tabs.setdefault(
+            p.categoria_id,
+            {"id": p.categoria.slug, "title": p.categoria.nombre, "items": []},
+        )
+        tab["items"].append(p)
+    return list(tabs.values())
+
+
+def product_tabs(limit=8):
+    return tagcache.get_or_set(
+        "tienda_tabs", [TABS_TAG], lambda: build_tabs(limit), limit
+    )
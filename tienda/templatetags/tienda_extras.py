@@ -1,50 +1,15 @@
 from django import template
-from django.db.models import Q
-from tienda.models import Producto, ProductoCategoria
+from tienda.tabs import product_tabs
 
 # NUEVO:
 try:
-    from inicio.models import SectionHeader
+    from inicio.section_headers import get_section_header
 except Exception:
-    SectionHeader = None
+    get_section_header = None
 
 register = template.Library()
 
 
-def productos_por_categoria(cat_key: str, limit=None):
-    """Devuelve productos publicados por slug/nombre de categoría."""
-    cat_key = (cat_key or "").strip()
-    if not cat_key:
-        return Producto.objects.none()
-
-    qs = (
-        Producto.objects.filter(publicado=True)
-        .filter(
-            Q(categoria__slug=cat_key)
-            | Q(categoria__slug__iexact=cat_key)
-            | Q(categoria__nombre__iexact=cat_key)
-        )
-        .select_related("categoria")
-        .order_by("orden", "-creado")
-    )
-
-    # Prefetch seguro (si no tienes related_name='imagenes', usa el set por defecto)
-    try:
-        Producto._meta.get_field("imagenes")
-        qs = qs.prefetch_related("imagenes")
-    except Exception:
-        qs = qs.prefetch_related("productoimagen_set")
-
-    if limit:
-        try:
-            limit = int(limit)
-            if limit > 0:
-                qs = qs[:limit]
-        except (TypeError, ValueError):
-            pass
-    return qs
-
-
 @register.inclusion_tag("tienda/_products_tabs.html")
 def products_tabs(
     header_h5=None,  # <-- default None para permitir override
@@ -55,10 +20,8 @@ def products_tabs(
 ):
     tabs = []
     # ==== NUEVO: intentar leer títulos desde SectionHeader si no vinieron por parámetro ====
-    if (header_h2 is None or header_h5 is None) and SectionHeader is not None:
-        hdr = SectionHeader.objects.filter(
-            seccion="tienda_tabs", publicado=True
-        ).first()
+    if (header_h2 is None or header_h5 is None) and get_section_header is not None:
+        hdr = get_section_header("tienda_tabs")
         if hdr:
             if header_h2 is None:
                 header_h2 = hdr.title or "Productos"
@@ -73,19 +36,8 @@ def products_tabs(
         # ... igual ...
         pass
     else:
-        cats = (
-            ProductoCategoria.objects.filter(publicado=True, productos__publicado=True)
-            .order_by("orden", "nombre")
-            .distinct()
-        )
-        for c in cats:
-            tabs.append(
-                {
-                    "id": c.slug,
-                    "title": c.nombre,
-                    "items": productos_por_categoria(c.slug, limit),
-                }
-            )
+        # Una consulta con ROW_NUMBER por categoría, cacheada (tienda/tabs.py)
+        tabs = product_tabs(int(limit or 0))
 
     return {
         "header_h5": header_h5,
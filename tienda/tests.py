@@ -1 +1,49 @@
-# Create your tests here.
+from django.core.cache import cache
+from django.test import TestCase
+
+from tienda.models import Producto, ProductoCategoria
+from tienda.tabs import product_tabs
+
+
+class ProductTabsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.cats = [
+            ProductoCategoria.objects.create(
+                nombre=f"Cat {i}", slug=f"cat-{i}", orden=i
+            )
+            for i in range(3)
+        ]
+        for cat in self.cats:
+            for j in range(4):
+                Producto.objects.create(
+                    titulo=f"{cat.slug} {j}",
+                    slug=f"{cat.slug}-{j}",
+                    categoria=cat,
+                    orden=j,
+                )
+
+    def _mis_tabs(self, tabs):
+        return {
+            t["id"]: [p.slug for p in t["items"]]
+            for t in tabs
+            if t["id"].startswith("cat-")
+        }
+
+    def test_una_consulta_por_pestanas_y_luego_cache(self):
+        # productos con ROW_NUMBER + prefetch de imágenes
+        with self.assertNumQueries(2):
+            tabs = product_tabs(limit=2)
+        self.assertEqual(
+            self._mis_tabs(tabs),
+            {c.slug: [f"{c.slug}-0", f"{c.slug}-1"] for c in self.cats},
+        )
+        with self.assertNumQueries(0):
+            product_tabs(limit=2)
+
+    def test_guardar_producto_invalida(self):
+        product_tabs(limit=2)
+        Producto.objects.filter(slug="cat-0-0").get().delete()
+        self.assertEqual(
+            self._mis_tabs(product_tabs(limit=2))["cat-0"], ["cat-0-1", "cat-0-2"]
+        )
@@ -1,6 +1,10 @@
 from django.shortcuts import get_object_or_404, render
 from django.core.paginator import Paginator
-from django.db.models import Q
+
+from core import search
+from core.pagecache import cache_page_anon
+from core.querybudget import query_budget
+from core.singletons import get_singleton
 
 from .models import Producto, TiendaLanding
 
@@ -9,8 +13,10 @@ from .models import Producto, TiendaLanding
 from inicio.models import Gallery
 
 
+@query_budget(queries=15)
+@cache_page_anon("tienda")
 def lista_productos(request):
-    landing = TiendaLanding.objects.filter(publicado=True).first()
+    landing = get_singleton(TiendaLanding)
 
     qs = (
         Producto.objects.filter(publicado=True)
@@ -23,13 +29,13 @@ def lista_productos(request):
     if cat:  # slug de categoría
         qs = qs.filter(categoria__slug=cat)
 
-    q = request.GET.get("q")
+    q = (request.GET.get("q") or "").strip()
     if q:
-        # Mejor con Q para OR:
-        qs = qs.filter(Q(titulo__icontains=q) | Q(descripcion__icontains=q))
-
-    paginator = Paginator(qs, 12)
-    page_obj = paginator.get_page(request.GET.get("page"))
+        # Búsqueda de texto completo ordenada por relevancia (core/search.py)
+        page_obj = search.search_page(qs, q, page=request.GET.get("page"), per_page=12)
+    else:
+        paginator = Paginator(qs, 12)
+        page_obj = paginator.get_page(request.GET.get("page"))
     return render(
         request,
         "tienda/panel-productos.html",
@@ -43,6 +49,7 @@ def lista_productos(request):
     )
 
 
+@cache_page_anon("tienda")
 def detalle_producto(request, slug):
     producto = get_object_or_404(
         Producto.objects.select_related("categoria").prefetch_related("imagenes"),
@@ -61,6 +68,7 @@ def detalle_producto(request, slug):
     )
 
 
+@cache_page_anon("tienda")
 def productos_home(request):
     productos = (
         Producto.objects.filter(publicado=True)
@@ -1,6 +1,5 @@
 # apps/visitas/apps.py
 from django.apps import AppConfig
-from django.db.models.signals import post_migrate
 
 
 class VisitasConfig(AppConfig):
@@ -8,6 +7,4 @@ class VisitasConfig(AppConfig):
     verbose_name = "Visitas guiadas"
 
     def ready(self):
-        from .seeds.seed_visitas import _seed_visitas_once
-
-        post_migrate.connect(_seed_visitas_once, sender=self)
+        from .seeds import seed_visitas  # noqa: F401  (semillas, manage.py seed)
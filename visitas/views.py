@@ -1,10 +1,15 @@
 # apps/visitas/views.py
 from django.shortcuts import get_object_or_404, render
+
+from core.singletons import get_singleton
+from core.pagecache import cache_page_anon
+
 from .models import VisitsLanding, GuidedVisit
 
 
+@cache_page_anon("visitas")
 def visitas_index(request):
-    landing = VisitsLanding.objects.filter(publicado=True).first()
+    landing = get_singleton(VisitsLanding)
     visitas = (
         GuidedVisit.objects.filter(publicado=True)
         .prefetch_related("fotos")
@@ -32,6 +37,7 @@ def visitas_index(request):
     )
 
 
+@cache_page_anon("visitas")
 def visita_detail(request, slug):
     visita = get_object_or_404(
         GuidedVisit.objects.prefetch_related("fotos"), slug=slug, publicado=True